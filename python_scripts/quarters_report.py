@@ -9,24 +9,47 @@ self-contained HTML dashboard with a project toggle in the navbar.
 import sys
 import json
 import os
-import glob
+import re
 import pathlib
 import calendar
 import base64
 import argparse
+import time
+import gzip
+import hashlib
+import io
+import queue
+import random
+import threading
+import http.client
+import urllib.error
 import urllib.request
 import urllib.parse
 import concurrent.futures
+import contextlib
+import bisect
+import shutil
 from datetime import datetime, timezone, date, timedelta
 from zoneinfo import ZoneInfo
 from secret_manager import SecretsManager
 
+try:
+    import brotli  # optional — without it only .gz siblings are written
+except ImportError:
+    brotli = None
+try:
+    import fcntl  # POSIX only — without it the cross-process run lock is a no-op
+except ImportError:
+    fcntl = None
+
 # Force UTF-8 output so Unicode characters (em dashes, ellipsis, etc.) print correctly
 # on Windows terminals that default to Windows-1252.
 sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
 TESTING_MODE  = False   # Skip Claude API calls; preserve any existing notes
 FORCE_NOTES   = False  # Force regeneration of ALL notes even for backfill quarters
+FULL_SYNC     = False  # Ignore the local issue store and re-pull every issue from Jira
+BATCH_SPRINT_NOTES = True  # One Claude request per quarter for all changed sprints (False = one per sprint)
 PREVIEW_MODE  = False  # Set to True to write to test.html instead of the live page
 ANTHROPIC_QUARTER_MODEL = "claude-sonnet-4-5"       # Update here when model is retired
 ANTHROPIC_SPRINT_MODEL = "claude-haiku-4-5-20251001"  # Lighter model for sprint-level notes
@@ -62,11 +85,14 @@ _CAPACITY_UPDATE_WEBHOOKS = _load_webhook_map("capacity_update_webhook_url")
 # dashboard_title : shown in the browser tab before JS loads (JS sets it per-quarter afterwards).
 # logo_alt        : alt text for the header logo image.
 # dashboard_base_url : base URL printed to console after a successful run (cosmetic only).
+# dashboard_lazy_data : embed only a per-quarter manifest in the HTML and let the browser
+#                       fetch each quarter's JSON on demand (False = inline everything).
 DASHBOARD_TITLE        = secrets.get("dashboard_title",        "Quarter Dashboard")
 LOGO_ALT               = secrets.get("logo_alt",               "")
 DASHBOARD_BASE_URL     = secrets.get("dashboard_base_url",     "")
 DASHBOARD_FILENAME     = secrets.get("dashboard_filename",     "index.html")
 DASHBOARD_PREVIEW_FILE = secrets.get("dashboard_preview_file", "test.html")
+DASHBOARD_LAZY_DATA    = secrets.get("dashboard_lazy_data",    True)
 
 # When the daily full Claude-notes run fires. Shown in the dashboard converted to each
 # viewer's local timezone. Use IANA timezone names (https://en.wikipedia.org/wiki/List_of_tz_database_time_zones).
@@ -78,7 +104,12 @@ NOTES_REFRESH_TIME = {"hour": 17, "minute": 0, "tz": "Europe/Dublin"}
 BACKFILL_QUARTERS = []
 #BACKFILL_QUARTERS = ["Q1 2024", "Q2 2024", "Q3 2024", "Q4 2024", "Q1 2025", "Q2 2025", "Q3 2025", "Q4 2025", "Q1 2026"]
 
-TOKEN_LOG_PATH = pathlib.Path(__file__).parent / "data" / "token_usage.log"
+TOKEN_LEDGER_DIR = pathlib.Path(__file__).parent / "data" / "token_usage"
+NOTE_CACHE_PATH = pathlib.Path(__file__).parent / "data" / "note_cache.json.gz"
+# Raw Jira payloads (HTTP response cache, issue and worklog stores, sprint catalogue) are
+# kept here, one folder per project — never under reports_dir, which Home Assistant serves
+# without authentication at /local/.
+PRIVATE_DATA_DIR = pathlib.Path(__file__).parent / "data" / "projects"
 
 # ---------------------------------------------------------------------------
 # Project configuration
@@ -143,7 +174,8 @@ def _load_projects(filename="team_projects.json"):
     """Load project configuration from a JSON file beside this script.
     Each entry needs: key, display, board_id, team_file, reports_dir.
     Optional: notes_context (injected into Claude prompts for project-specific guidance).
-    Optional: "enabled": false to skip a project without deleting its config entry."""
+    Optional: "enabled": false to skip a project without deleting its config entry.
+    Optional: sprint_catalogue_ttl_minutes (reuse the saved board sprint list across runs)."""
     p = pathlib.Path(__file__).with_name(filename)
     if not p.exists():
         raise FileNotFoundError(
@@ -167,6 +199,7 @@ WLOG_ADMINS = _load_admins()
 # Resolve derived paths and load team members for each project
 for _p in PROJECTS:
     _p["data_dir"]    = os.path.join(_p["reports_dir"], "data")
+    _p["store_dir"]   = os.path.join(PRIVATE_DATA_DIR, _p["key"].lower())
     _p["archive_dir"] = os.path.join(_p["reports_dir"], "archive")
     _p["team_map"]    = _load_team(_p["team_file"])
 
@@ -175,10 +208,54 @@ for _p in PROJECTS:
 # (e.g. /config/www/quarters) — the script will create it automatically on first run.
 DASHBOARD_OUTPUT_DIR = secrets.get("dashboard_output_dir", PROJECTS[0]["reports_dir"])
 
-# Module-level active project key/sp-field — set before each project run so
-# helpers that can't easily take a proj param (e.g. _issue_row) work correctly.
-_ACTIVE_PROJECT_KEY = PROJECTS[0]["key"]
-_ACTIVE_SP_FIELD    = PROJECTS[0].get("story_points_field") or "customfield_10016"
+
+class RunContext:
+    """Per-project state for one quarter run, passed explicitly to helpers such as
+    _issue_row() that can't easily take the full set of fetch_kpis() arguments.
+    Nothing project-specific lives at module level, so several projects and quarters
+    can be processed concurrently (see --jobs)."""
+
+    def __init__(self, proj, ref=None, use_http_cache=True):
+        self.proj        = proj
+        self.ref         = ref
+        self.project_key = proj["key"]
+        self.sp_field    = proj.get("story_points_field") or "customfield_10016"
+        self.use_http_cache = use_http_cache
+        self.http_cache_dir = _http_cache_dir(proj) if use_http_cache else None
+        self._changelogs = {}
+        self._ip_dates   = {}    # issue key -> earliest In Progress date (or None)
+        self._rows       = {}    # issue key -> _issue_row() dict
+        self._in_progress_statuses = None
+
+    def changelog(self, rec):
+        """The IssueRecord's ChangelogIndex, built on first use and reused for the rest of the run."""
+        index = self._changelogs.get(rec.key)
+        if index is None:
+            index = self._changelogs[rec.key] = ChangelogIndex(rec.raw)
+        return index
+
+    def ip_date(self, rec):
+        """Date the issue first entered an In Progress status, looked up once per run."""
+        try:
+            return self._ip_dates[rec.key]
+        except KeyError:
+            d = self._ip_dates[rec.key] = self.changelog(rec).earliest_in_progress(self.in_progress_statuses)
+            return d
+
+    def issue_row(self, rec):
+        """The issue's _issue_row(), built once per run. The dict is shared — copy it
+        before adding list-specific fields."""
+        row = self._rows.get(rec.key)
+        if row is None:
+            row = self._rows[rec.key] = _issue_row(rec, self)
+        return row
+
+    @property
+    def in_progress_statuses(self):
+        if self._in_progress_statuses is None:
+            self._in_progress_statuses = fetch_in_progress_statuses(self.project_key,
+                                                                    cache_dir=self.http_cache_dir)
+        return self._in_progress_statuses
 
 # ---------------------------------------------------------------------------
 # Developer roster — auto-maintained across all projects
@@ -190,40 +267,40 @@ _ACTIVE_SP_FIELD    = PROJECTS[0].get("story_points_field") or "customfield_1001
 # To assign someone to a project team, copy their entry into the relevant
 # dlk_team_members.json / nda_team_members.json file.
 _ALL_DEVS_FILE = pathlib.Path(__file__).with_name("team_members_all.json")
+_ALL_DEVS_LOCK = threading.Lock()  # shared by every project's run
 
 
 def _update_developer_roster(assignee_stats):
     """Merge newly seen assignees into all_developers.json. Adds only, never removes."""
-    try:
-        roster = json.loads(_ALL_DEVS_FILE.read_text(encoding="utf-8")) if _ALL_DEVS_FILE.exists() else {}
-    except Exception:
-        roster = {}
-
-    added = []
-    for a in assignee_stats:
-        aid  = a.get("account_id", "")
-        name = a.get("name", "")
-        if aid and name and name != "Unassigned" and aid not in roster:
-            roster[aid] = name
-            added.append(name)
-
-    if added:
-        _ALL_DEVS_FILE.write_text(
-            json.dumps(roster, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
-        print(f"      Developer roster updated — added: {', '.join(added)} ({len(roster)} total)")
-    else:
-        print(f"      Developer roster unchanged ({len(roster)} developers)")
-    return roster
+    with _ALL_DEVS_LOCK, _file_lock(f"{_ALL_DEVS_FILE}.lock"):
+        try:
+            roster = json.loads(_ALL_DEVS_FILE.read_text(encoding="utf-8")) if _ALL_DEVS_FILE.exists() else {}
+        except Exception:
+            roster = {}
+
+        added = []
+        for a in assignee_stats:
+            aid  = a.get("account_id", "")
+            name = a.get("name", "")
+            if aid and name and name != "Unassigned" and aid not in roster:
+                roster[aid] = name
+                added.append(name)
+
+        if added:
+            _write_if_changed(_ALL_DEVS_FILE,
+                              json.dumps(roster, indent=2, ensure_ascii=False).encode("utf-8"))
+            print(f"      Developer roster updated — added: {', '.join(added)} ({len(roster)} total)")
+        else:
+            print(f"      Developer roster unchanged ({len(roster)} developers)")
+        return roster
 
 
 # ---------------------------------------------------------------------------
 # HTTP helpers
 # ---------------------------------------------------------------------------
 
-def _auth_header():
-    token = base64.b64encode(f"{JIRA_EMAIL}:{JIRA_API_TOKEN}".encode()).decode()
+def _auth_header(email, api_token):
+    token = base64.b64encode(f"{email}:{api_token}".encode()).decode()
     return {
         "Authorization": f"Basic {token}",
         "Content-Type": "application/json",
@@ -231,10 +308,334 @@ def _auth_header():
     }
 
 
-def http_get(url, headers):
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req) as resp:
-        return json.loads(resp.read().decode())
+# Client-side throttling for Jira Cloud. The bucket caps the steady request rate across
+# every worker thread; the in-flight cap starts at the connection pool size, halves on
+# each 429 and creeps back up by one after a run of clean responses.
+_JIRA_RATE_PER_SEC  = 50.0
+_JIRA_BURST         = 50
+_JIRA_MAX_RETRIES   = 6      # per request, on 429/503
+_JIRA_BACKOFF_BASE  = 1.0    # seconds; doubled per retry when no Retry-After is sent
+_JIRA_BACKOFF_MAX   = 60.0
+
+# On-disk response cache (JiraClient.get with cache_dir, one file per URL under
+# store_dir/http_cache). Seconds an entry is served without asking Jira again, by
+# endpoint; 0 = always revalidate (a conditional request if Jira sent an ETag /
+# Last-Modified, otherwise a normal refetch). Worklog pages are stored with the issue's
+# timespent as their version, so any newly logged time invalidates them.
+_HTTP_CACHE_TTLS = (
+    (re.compile(r"/rest/agile/1\.0/board\?"),                 24 * 3600),   # board metadata
+    (re.compile(r"/rest/api/3/project/[^/]+/statuses$"),       24 * 3600),
+    (re.compile(r"/rest/agile/1\.0/board/\d+/sprint\?"),       0),           # sprint list
+    (re.compile(r"/rest/api/3/issue/[^/]+/worklog\?"),         30 * 24 * 3600),
+)
+
+
+def _http_cache_ttl(url):
+    path = urllib.parse.urlsplit(url)
+    path = path.path + (f"?{path.query}" if path.query else "")
+    return next((ttl for pattern, ttl in _HTTP_CACHE_TTLS if pattern.search(path)), 0)
+
+
+class _RateLimiter:
+    """Token bucket + adaptive in-flight cap shared by all threads using one JiraClient.
+    pause() opens a Retry-After window during which nobody may start a request."""
+
+    def __init__(self, rate, burst, max_in_flight):
+        self.rate      = rate
+        self.burst     = burst
+        self.limit     = max_in_flight
+        self._max      = max_in_flight
+        self._tokens   = float(burst)
+        self._stamp    = time.monotonic()
+        self._in_flight = 0
+        self._ok_streak = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp  = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._in_flight >= self.limit:
+                    wait = None  # woken by release()
+                elif self._tokens < 1:
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    self._tokens    -= 1
+                    self._in_flight += 1
+                    return
+                self._cond.wait(wait)
+
+    def release(self, throttled=False):
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._ok_streak = 0
+            else:
+                self._ok_streak += 1
+                if self.limit < self._max and self._ok_streak >= self.limit:
+                    self.limit += 1
+                    self._ok_streak = 0
+            self._cond.notify_all()
+
+    def pause(self, seconds):
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def wait_if_paused(self):
+        with self._cond:
+            while (delay := self._paused_until - time.monotonic()) > 0:
+                self._cond.wait(delay)
+
+
+def _retry_delay(resp, attempt):
+    """Seconds to wait before retrying a throttled response: the server's Retry-After
+    when given, otherwise exponential backoff with jitter."""
+    try:
+        return max(0.0, float(resp.getheader("Retry-After")))
+    except (TypeError, ValueError):
+        backoff = min(_JIRA_BACKOFF_MAX, _JIRA_BACKOFF_BASE * 2 ** attempt)
+        return backoff * random.uniform(0.5, 1.0)
+
+
+class JiraClient:
+    """Keep-alive HTTP client for the Jira REST API, shared by every Jira call in a run.
+
+    Idle connections sit in a LIFO pool so the worker threads in fetch_kpis /
+    fetch_worklogs_for_quarter reuse an already-open TLS session instead of paying a
+    handshake per page. Each connection is only ever used by one thread at a time;
+    threads beyond pool_size get a temporary connection that is closed on release.
+    Every request first takes a slot from the shared _RateLimiter; 429/503 responses are
+    retried (honouring Retry-After) up to _JIRA_MAX_RETRIES times before surfacing.
+    Errors are raised as urllib.error.HTTPError so callers' existing handling is unchanged."""
+
+    # Raised when the server silently dropped an idle keep-alive connection — the request
+    # is retried once on a newly opened connection, and the rest of the idle pool (which
+    # has usually been dropped too, e.g. after a long notes stage) is discarded.
+    _STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                     http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+
+    def __init__(self, base_url, email, api_token, pool_size=10, timeout=60):
+        parts = urllib.parse.urlsplit(base_url)
+        self._scheme  = parts.scheme
+        self._host    = parts.hostname
+        self._port    = parts.port
+        self._timeout = timeout
+        self._pool    = queue.LifoQueue(maxsize=pool_size)
+        # Credentials are encoded once per run, not once per request
+        self._headers = {**_auth_header(email, api_token), "Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        self.requests_made = 0
+        self.connections_opened = 0
+        self.throttled_responses = 0
+        self.cache_hits = 0
+        self.cache_revalidated = 0
+        self.cache_misses = 0
+        self._stats_lock = threading.Lock()
+        self._limiter = _RateLimiter(_JIRA_RATE_PER_SEC, _JIRA_BURST, pool_size)
+
+    def _new_connection(self):
+        cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        with self._stats_lock:
+            self.connections_opened += 1
+        return cls(self._host, self._port, timeout=self._timeout)
+
+    def _acquire(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _send(self, method, path, data, headers):
+        conn = self._acquire()
+        for attempt in (1, 2):
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                resp = conn.getresponse()
+                raw  = resp.read()
+            except self._STALE_ERRORS:
+                conn.close()
+                if attempt == 2:
+                    raise
+                self.close()
+                conn = self._new_connection()
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp, raw
+
+    def _request(self, method, url, body=None, headers=None):
+        """Send one request (with throttling/retries) and return (response, parsed JSON).
+        A 304 Not Modified comes back with None as its body."""
+        parts = urllib.parse.urlsplit(url)
+        path  = parts.path + (f"?{parts.query}" if parts.query else "")
+        data  = json.dumps(body).encode() if body is not None else None
+        hdrs  = {**self._headers, **headers} if headers else self._headers
+        with self._stats_lock:
+            self.requests_made += 1
+        for retry in range(_JIRA_MAX_RETRIES + 1):
+            self._limiter.acquire()
+            try:
+                resp, raw = self._send(method, path, data, hdrs)
+            except Exception:
+                self._limiter.release()
+                raise
+            throttled = resp.status in (429, 503)
+            self._limiter.release(throttled=resp.status == 429)
+            if not throttled or retry == _JIRA_MAX_RETRIES:
+                break
+            with self._stats_lock:
+                self.throttled_responses += 1
+            delay = _retry_delay(resp, retry)
+            if resp.status == 429:
+                # Jira's rate limit is per account, so every thread backs off together
+                self._limiter.pause(delay)
+            else:
+                time.sleep(delay)
+        if resp.status == 304:
+            return resp, None
+        if resp.getheader("Content-Encoding", "") == "gzip":
+            raw = gzip.decompress(raw)
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(raw))
+        return resp, (json.loads(raw.decode()) if raw else {})
+
+    def _request_json(self, method, url, body=None):
+        return self._request(method, url, body)[1]
+
+    def wait_if_throttled(self):
+        """Block until any Retry-After window announced by a 429 has passed."""
+        self._limiter.wait_if_paused()
+
+    def get(self, url, cache_dir=None, ttl=None, version=None):
+        """GET url; with cache_dir, serve it from the on-disk response cache when the
+        entry is younger than ttl seconds (default: _http_cache_ttl(url)) and was stored
+        with the same version, revalidating stale entries with If-None-Match /
+        If-Modified-Since when Jira sent an ETag / Last-Modified for them."""
+        if not cache_dir:
+            return self._request_json("GET", url)
+        ttl   = _http_cache_ttl(url) if ttl is None else ttl
+        path  = os.path.join(cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+        entry = None
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if entry.get("url") != url or entry.get("version") != version:
+                entry = None
+        except Exception:
+            pass
+        if entry and time.time() - entry["fetched_at"] < ttl:
+            with self._stats_lock:
+                self.cache_hits += 1
+            return entry["body"]
+
+        conditional = {}
+        if entry and entry.get("etag"):
+            conditional["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            conditional["If-Modified-Since"] = entry["last_modified"]
+        resp, data = self._request("GET", url, headers=conditional)
+        if data is None and entry:
+            with self._stats_lock:
+                self.cache_revalidated += 1
+            data = entry["body"]
+        else:
+            with self._stats_lock:
+                self.cache_misses += 1
+        etag, last_modified = resp.getheader("ETag"), resp.getheader("Last-Modified")
+        if ttl > 0 or etag or last_modified:
+            entry = {"url": url, "version": version, "fetched_at": time.time(),
+                     "etag": etag, "last_modified": last_modified, "body": data}
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with _atomic_target(path) as tmp, open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(entry, fh)
+            except OSError as exc:
+                print(f"      WARNING: could not write HTTP cache entry: {exc}")
+        return data
+
+    def post(self, url, body):
+        return self._request_json("POST", url, body)
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_JIRA = JiraClient(JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN)
+
+
+def http_get(url, cache_dir=None, ttl=None, version=None):
+    return _JIRA.get(url, cache_dir=cache_dir, ttl=ttl, version=version)
+
+
+def _http_cache_dir(proj):
+    return os.path.join(proj["store_dir"], "http_cache")
+
+
+# An entry is rewritten whenever it is refetched or revalidated, and a newer version of a
+# URL replaces the file in place, so one untouched for longer than the longest TTL is
+# expired and only ever refetched — it is deleted instead of kept forever.
+_HTTP_CACHE_RETENTION_S = max(ttl for _, ttl in _HTTP_CACHE_TTLS)
+
+
+def _prune_http_cache(proj):
+    cache_dir = _http_cache_dir(proj)
+    cutoff    = time.time() - _HTTP_CACHE_RETENTION_S
+    removed   = 0
+    try:
+        entries = list(os.scandir(cache_dir))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    if removed:
+        print(f"  {proj['key']}: pruned {removed} expired HTTP cache entr{'y' if removed == 1 else 'ies'}")
+
+
+# Earlier versions kept these raw-payload stores in the publicly served data_dir.
+_LEGACY_STORE_NAMES = ("http_cache", "issue_store", "worklog_store.json.gz", "sprint_catalogue.json")
+
+
+def _move_private_stores(proj):
+    """Move stores left in data_dir by earlier versions into store_dir (or delete them when
+    store_dir already has its own copy), so no raw Jira payload stays web-accessible."""
+    for name in _LEGACY_STORE_NAMES:
+        old = os.path.join(proj["data_dir"], name)
+        if not os.path.exists(old):
+            continue
+        new = os.path.join(proj["store_dir"], name)
+        try:
+            os.makedirs(proj["store_dir"], exist_ok=True)
+            if os.path.exists(new):
+                shutil.rmtree(old) if os.path.isdir(old) else os.remove(old)
+            else:
+                shutil.move(old, new)
+        except OSError as exc:
+            print(f"  WARNING: could not move {old} out of the served directory ({exc})")
 
 
 # ---------------------------------------------------------------------------
@@ -257,95 +658,156 @@ def quarter_file_key(label):
     return label.replace(" ", "_")
 
 
+# ---------------------------------------------------------------------------
+# Board sprint catalogue
+# ---------------------------------------------------------------------------
+# Every sprint on a project's board (active, closed and future) is listed once per run
+# and shared by fetch_sprints_in_quarter(), _sprint_date_map() and fetch_next_sprint(),
+# instead of each of them re-resolving the board and paging its sprints for every
+# project and backfill quarter. Set "sprint_catalogue_ttl_minutes" in a project's config
+# to also persist the catalogue to store_dir/sprint_catalogue.json and reuse it across
+# runs for that long (0 / absent = fetch fresh on every run).
+
+_SPRINT_CATALOGUES: dict[str, dict] = {}
+_SPRINT_CATALOGUE_LOCKS: dict[str, threading.Lock] = {}
+_SPRINT_CATALOGUE_LOCKS_GUARD = threading.Lock()
+
+
+def _fetch_board(proj, cache_dir=None):
+    """Return the configured board for proj (or the project's first board), or None."""
+    board_url = f"{JIRA_BASE_URL}/rest/agile/1.0/board?projectKeyOrId={proj['key']}&maxResults=50"
+    boards = http_get(board_url, cache_dir=cache_dir).get("values", [])
+    if not boards:
+        return None
+    return next((b for b in boards if str(b["id"]) == str(proj["board_id"])), boards[0])
+
+
+def _load_persisted_catalogue(path, ttl_minutes):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            catalogue = json.load(fh)
+        fetched = datetime.fromisoformat(catalogue["fetched_at"])
+    except Exception:
+        return None
+    age_min = (datetime.now(timezone.utc) - fetched).total_seconds() / 60
+    return catalogue if age_min < ttl_minutes else None
+
+
+def fetch_sprint_catalogue(proj, persist=True):
+    """Return {"board": {id, name} or None, "sprints": [raw sprint dicts], "fetched_at"}
+    for proj, fetching it from Jira at most once per run. Fetch errors propagate.
+    persist=False (used by --diagnose) fetches live and leaves the HTTP cache and the
+    saved catalogue untouched."""
+    key = proj["key"]
+    with _SPRINT_CATALOGUE_LOCKS_GUARD:
+        lock = _SPRINT_CATALOGUE_LOCKS.setdefault(key, threading.Lock())
+    with lock:
+        if key in _SPRINT_CATALOGUES:
+            return _SPRINT_CATALOGUES[key]
+        ttl_minutes = (proj.get("sprint_catalogue_ttl_minutes") or 0) if persist else 0
+        cache_dir   = _http_cache_dir(proj) if persist else None
+        path = os.path.join(proj["store_dir"], "sprint_catalogue.json")
+        catalogue = _load_persisted_catalogue(path, ttl_minutes) if ttl_minutes else None
+        if catalogue is not None:
+            print(f"      Sprint catalogue ({key}): reusing saved copy from {catalogue['fetched_at']}")
+        else:
+            board   = _fetch_board(proj, cache_dir)
+            sprints = []
+            if board:
+                start_at = 0
+                while True:
+                    params = urllib.parse.urlencode({
+                        "state": "active,closed,future",
+                        "startAt": start_at,
+                        "maxResults": 50,
+                    })
+                    data = http_get(f"{JIRA_BASE_URL}/rest/agile/1.0/board/{board['id']}/sprint?{params}",
+                                    cache_dir=cache_dir)
+                    page = data.get("values", [])
+                    sprints.extend(page)
+                    if not page or data.get("isLast", True):
+                        break
+                    start_at += len(page)
+            catalogue = {
+                "board":      {"id": board["id"], "name": board.get("name", "")} if board else None,
+                "sprints":    sprints,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+            }
+            if ttl_minutes:
+                os.makedirs(proj["store_dir"], exist_ok=True)
+                _write_if_changed(path, json.dumps(catalogue, indent=2).encode("utf-8"))
+        _SPRINT_CATALOGUES[key] = catalogue
+        return catalogue
+
+
+def _catalogue_sprints(catalogue, *states):
+    """Raw sprints in the given states, grouped in the order the states are listed."""
+    return [s for state in states for s in catalogue["sprints"] if s.get("state") == state]
+
+
 # ---------------------------------------------------------------------------
 # Sprint discovery
 # ---------------------------------------------------------------------------
 
-def fetch_sprints_in_quarter(proj, ref=None):
-    headers = _auth_header()
+def fetch_sprints_in_quarter(proj, ref=None, persist=True):
     quarter_start = current_quarter_start(ref)
     today = ref or date.today()
     project_key = proj["key"]
-    board_id_cfg = proj["board_id"]
 
-    board_url = f"{JIRA_BASE_URL}/rest/agile/1.0/board?projectKeyOrId={project_key}&maxResults=50"
-    board_data = http_get(board_url, headers)
-    boards = board_data.get("values", [])
-    if not boards:
+    catalogue = fetch_sprint_catalogue(proj, persist)
+    board = catalogue["board"]
+    if not board:
         raise RuntimeError(f"No boards found for project {project_key}")
-
-    preferred = next(
-        (b for b in boards if str(b["id"]) == str(board_id_cfg)),
-        boards[0]
-    )
-    board_id = preferred["id"]
-    print(f"      Using board: {preferred['name']} (id={board_id})")
+    print(f"      Using board: {board['name']} (id={board['id']})")
 
     seen = {}
-    for state in ("active", "closed"):
-        start_at = 0
-        while True:
-            params = urllib.parse.urlencode({
-                "state": state,
-                "startAt": start_at,
-                "maxResults": 50,
-            })
-            url = f"{JIRA_BASE_URL}/rest/agile/1.0/board/{board_id}/sprint?{params}"
-            data = http_get(url, headers)
-            sprints = data.get("values", [])
-            if not sprints:
-                break
+    for sprint in _catalogue_sprints(catalogue, "active", "closed"):
+        sid = sprint["id"]
+        if sid in seen:
+            continue
 
-            for sprint in sprints:
-                sid = sprint["id"]
-                if sid in seen:
-                    continue
+        start_str = sprint.get("startDate", "")
+        if not start_str:
+            continue
+        try:
+            sprint_start = datetime.fromisoformat(
+                start_str.replace("Z", "+00:00")
+            ).date()
+        except Exception:
+            continue
 
-                start_str = sprint.get("startDate", "")
-                if not start_str:
-                    continue
-                try:
-                    sprint_start = datetime.fromisoformat(
-                        start_str.replace("Z", "+00:00")
-                    ).date()
-                except Exception:
-                    continue
+        end_str = sprint.get("endDate", "")
+        end_date = None
+        if end_str:
+            try:
+                end_date = datetime.fromisoformat(
+                    end_str.replace("Z", "+00:00")
+                ).date()
+            except Exception:
+                pass
 
-                end_str = sprint.get("endDate", "")
-                end_date = None
-                if end_str:
-                    try:
-                        end_date = datetime.fromisoformat(
-                            end_str.replace("Z", "+00:00")
-                        ).date()
-                    except Exception:
-                        pass
-
-                sprint_end = end_date or today
-                # Assign sprint to whichever quarter contains its midpoint,
-                # so a sprint is never double-counted and a sprint that only
-                # touches a quarter boundary by one day goes to the right place.
-                # Use sprint_start <= today (not midpoint) to exclude future
-                # sprints, since an active sprint's midpoint may not have
-                # arrived yet.
-                sprint_mid = sprint_start + timedelta(days=(sprint_end - sprint_start).days // 2)
-                quarter_end_month = quarter_start.month + 2
-                quarter_end = date(quarter_start.year, quarter_end_month,
-                                   calendar.monthrange(quarter_start.year, quarter_end_month)[1])
-                if not (sprint_start <= today and quarter_start <= sprint_mid <= quarter_end):
-                    continue
+        sprint_end = end_date or today
+        # Assign sprint to whichever quarter contains its midpoint,
+        # so a sprint is never double-counted and a sprint that only
+        # touches a quarter boundary by one day goes to the right place.
+        # Use sprint_start <= today (not midpoint) to exclude future
+        # sprints, since an active sprint's midpoint may not have
+        # arrived yet.
+        sprint_mid = sprint_start + timedelta(days=(sprint_end - sprint_start).days // 2)
+        quarter_end_month = quarter_start.month + 2
+        quarter_end = date(quarter_start.year, quarter_end_month,
+                           calendar.monthrange(quarter_start.year, quarter_end_month)[1])
+        if not (sprint_start <= today and quarter_start <= sprint_mid <= quarter_end):
+            continue
 
-                seen[sid] = {
-                    "id": sid,
-                    "name": sprint["name"],
-                    "state": sprint["state"],
-                    "start_date": str(sprint_start),
-                    "end_date": str(end_date) if end_date else None,
-                }
+        seen[sid] = {
+            "id": sid,
+            "name": sprint["name"],
+            "state": sprint["state"],
+            "start_date": str(sprint_start),
+            "end_date": str(end_date) if end_date else None,
+        }
 
-            if data.get("isLast", True):
-                break
-            start_at += len(sprints)
 
     return sorted(seen.values(), key=lambda s: s["start_date"])
 
@@ -373,28 +835,20 @@ _CAPACITY_BUFFER_PCT = 0.70
 
 def fetch_next_sprint(proj):
     """Fetch the earliest future sprint for proj and return capacity data, or None."""
-    headers     = _auth_header()
     project_key = proj["key"]
     use_sp      = proj.get("use_story_points", False)
     sp_field    = proj.get("story_points_field") or "customfield_10016"
     team_map    = _load_team(proj.get("team_file", "")) if proj.get("team_file") else {}
 
-    # Resolve board id
-    board_url  = f"{JIRA_BASE_URL}/rest/agile/1.0/board?projectKeyOrId={project_key}&maxResults=50"
-    boards     = http_get(board_url, headers).get("values", [])
-    if not boards:
+    # Future sprints come from the run's board catalogue. Deliberately NOT wrapped in a
+    # try/except here — a transient failure (rate limit, timeout, network blip) must not
+    # be silently mistaken for a genuinely empty "no future sprint" result. Let it
+    # propagate; the caller in main() already reports real failures distinctly
+    # ("Next sprint fetch failed: ...").
+    catalogue = fetch_sprint_catalogue(proj)
+    if not catalogue["board"]:
         return None
-    preferred  = next((b for b in boards if str(b["id"]) == str(proj["board_id"])), boards[0])
-    board_id   = preferred["id"]
-
-    # Fetch future sprints. Deliberately NOT wrapped in a try/except here — a transient
-    # failure (rate limit, timeout, network blip) must not be silently mistaken for a
-    # genuinely empty "no future sprint" result. Let it propagate; the caller in main()
-    # already reports real failures distinctly ("Next sprint fetch failed: ...").
-    params = urllib.parse.urlencode({"state": "future", "startAt": 0, "maxResults": 50})
-    url    = f"{JIRA_BASE_URL}/rest/agile/1.0/board/{board_id}/sprint?{params}"
-    data   = http_get(url, headers)
-    future = data.get("values", [])
+    future = _catalogue_sprints(catalogue, "future")
     if not future:
         return None
 
@@ -422,7 +876,7 @@ def fetch_next_sprint(proj):
     fields = (f"key,summary,status,issuetype,assignee,priority,"
               f"timespent,timeoriginalestimate,{sp_field}")
     try:
-        issues = jira_search(jql, fields=fields)
+        issues = [IssueRecord(i, sp_field) for i in jira_search(jql, fields=fields)]
     except Exception as exc:
         # Degrade to an empty issue list rather than failing the whole next-sprint
         # lookup, but print it — silently swallowing this would make a real fetch
@@ -434,15 +888,11 @@ def fetch_next_sprint(proj):
     by_assignee = {}
     issue_rows  = []
     for issue in issues:
-        f          = issue["fields"]
-        assignee   = f.get("assignee") or {}
-        name       = assignee.get("displayName", "Unassigned")
-        account_id = assignee.get("accountId", "")
-        est_s      = f.get("timeoriginalestimate") or 0
-        sp_raw     = f.get(sp_field)
-        sp         = int(sp_raw) if sp_raw is not None else 0
-        itype      = f["issuetype"]["name"]
-        status     = f["status"]["name"]
+        name       = issue.assignee
+        account_id = issue.account_id
+        est_s      = issue.estimated_s
+        sp         = issue.sp
+        itype      = issue.type
 
         key = account_id or name
         if key not in by_assignee:
@@ -481,14 +931,14 @@ def fetch_next_sprint(proj):
             a["tasks"]   += 1
 
         issue_rows.append({
-            "key":          issue["key"],
-            "url":          f"{JIRA_BASE_URL}/browse/{issue['key']}",
-            "summary":      f["summary"],
+            "key":          issue.key,
+            "url":          f"{JIRA_BASE_URL}/browse/{issue.key}",
+            "summary":      issue.summary,
             "type":         itype,
-            "status":       status,
+            "status":       issue.status,
             "assignee":     name,
             "account_id":   account_id,
-            "priority":     (f.get("priority") or {}).get("name", ""),
+            "priority":     issue.priority,
             "estimated_h":  round(est_s / 3600, 1),
             "sp":           sp,
             "has_estimate": (sp > 0) if use_sp else (est_s > 0),
@@ -513,13 +963,14 @@ def fetch_next_sprint(proj):
 # Jira search
 # ---------------------------------------------------------------------------
 
-def jira_search(jql, fields="key,summary,status,issuetype,assignee,fixVersions,labels,priority,customfield_10016",
-                max_results=500, expand=None):
-    headers = _auth_header()
-    all_issues = []
-    next_page_token = None
+def jira_search_iter(jql, fields="key,summary,status,issuetype,assignee,fixVersions,labels,priority,customfield_10016",
+                     max_results=500, expand=None, reduce=None):
+    """Yield issues matching jql page by page instead of collecting them all first.
 
-    while True:
+    The next page is requested in the background while the caller processes the current
+    one, so per-issue work overlaps with network I/O. reduce (e.g. _compact_issue) is
+    applied to each issue as it arrives, so only the reduced records stay alive."""
+    def _page(token):
         params = {
             "jql": jql,
             "fields": fields,
@@ -527,49 +978,211 @@ def jira_search(jql, fields="key,summary,status,issuetype,assignee,fixVersions,l
         }
         if expand:
             params["expand"] = expand
-        if next_page_token:
-            params["nextPageToken"] = next_page_token
+        if token:
+            params["nextPageToken"] = token
+        return http_get(f"{JIRA_BASE_URL}/rest/api/3/search/jql?{urllib.parse.urlencode(params)}")
+
+    seen = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetch:
+        future = prefetch.submit(_page, None)
+        while future is not None:
+            data   = future.result()
+            issues = data.get("issues", [])
+            seen  += len(issues)
+            future = None
+            if not (data.get("isLast", True) or not issues or seen >= max_results) \
+                    and data.get("nextPageToken"):
+                future = prefetch.submit(_page, data["nextPageToken"])
+            for issue in issues:
+                yield reduce(issue) if reduce else issue
+
+
+def jira_search(jql, fields="key,summary,status,issuetype,assignee,fixVersions,labels,priority,customfield_10016",
+                max_results=500, expand=None):
+    return list(jira_search_iter(jql, fields=fields, max_results=max_results, expand=expand))
+
+
+# Keys Jira attaches to every nested object (users, statuses, versions, ...) that nothing
+# downstream reads — links back to the REST resource and avatar/icon URL maps.
+_JIRA_BULK_KEYS = frozenset(("self", "avatarUrls", "iconUrl", "expand"))
+_CHANGELOG_ITEM_KEYS = ("field", "fieldId", "from", "fromString", "to", "toString")
+
+
+def _strip_bulk(value):
+    if isinstance(value, dict):
+        return {k: _strip_bulk(v) for k, v in value.items() if k not in _JIRA_BULK_KEYS}
+    if isinstance(value, list):
+        return [_strip_bulk(v) for v in value]
+    return value
+
+
+def _compact_issue(issue, sprint_field=None):
+    """Reduce a raw search result to what the KPI code reads: the requested fields minus
+    REST links and avatar/icon maps, and only the status and Sprint changelog items
+    (each history cut to its created date and those items). The record keeps Jira's
+    shape, so every consumer works on it unchanged; compacting is idempotent.
+
+    changelog.total is rewritten so that total > len(histories) still means "Jira
+    truncated this changelog" (see _payload_sprint_ids)."""
+    sprint_field = sprint_field or _DEFAULT_SPRINT_FIELD
+    out = {"key": issue["key"], "fields": _strip_bulk(issue.get("fields", {}))}
+    if "id" in issue:
+        out["id"] = issue["id"]
+    changelog = issue.get("changelog")
+    if changelog is not None:
+        histories = changelog.get("histories", [])
+        missing   = max(0, changelog.get("total", len(histories)) - len(histories))
+        kept = []
+        for h in histories:
+            items = [{k: it[k] for k in _CHANGELOG_ITEM_KEYS if k in it}
+                     for it in h.get("items", [])
+                     if it.get("field") in ("status", "Sprint") or it.get("fieldId") == sprint_field]
+            if items:
+                kept.append({"created": h.get("created", ""), "items": items})
+        out["changelog"] = {"histories": kept, "total": len(kept) + missing}
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Incremental issue store
+# ---------------------------------------------------------------------------
+# Issues for each project/quarter (compacted to the fields and changelog items the KPIs
+# read — see _compact_issue) are kept on disk between runs.
+# After the first full pull, a run only asks Jira for issues whose `updated` is at or
+# after the last sync watermark and merges them in, so a data-only refresh costs a few
+# requests instead of re-paging the whole quarter.
+
+# Hours after which the store is rebuilt from scratch anyway — picks up deleted issues
+# and permission changes, which never show up in an `updated >=` query.
+_ISSUE_STORE_FULL_SYNC_HOURS = 24
+# JQL compares `updated` in the API user's profile timezone at minute precision, while
+# the watermark is stored in UTC. Querying from (watermark - overlap) covers any
+# timezone offset; re-fetching a few extra issues is harmless since merges are by key.
+_ISSUE_STORE_OVERLAP = timedelta(hours=15)
+# Record format written into each store. Stores without it predate _compact_issue() and are
+# compacted once on their next incremental sync; marked stores are used as they are.
+_ISSUE_STORE_FORMAT = 2
 
-        url = f"{JIRA_BASE_URL}/rest/api/3/search/jql?{urllib.parse.urlencode(params)}"
-        data = http_get(url, headers)
-        issues = data.get("issues", [])
-        all_issues.extend(issues)
 
-        if data.get("isLast", True) or not issues or len(all_issues) >= max_results:
-            break
-        next_page_token = data.get("nextPageToken")
-        if not next_page_token:
-            break
+def _issue_store_path(proj, label):
+    return os.path.join(proj["store_dir"], "issue_store", f"{quarter_file_key(label)}.json.gz")
+
+
+def _load_issue_store(path):
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        print(f"      WARNING: could not read issue store {path} ({exc}) — doing a full sync")
+        return None
+
+
+def _save_issue_store(path, store):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _atomic_target(path) as tmp, gzip.open(tmp, "wt", encoding="utf-8") as fh:
+        json.dump(store, fh, separators=(",", ":"))
+
+
+def sync_quarter_issues(proj, label, sprint_ids, fields, expand="changelog", persist=True):
+    """Return the issues in sprint_ids for one project/quarter (as _compact_issue()
+    records), via the local store.
+
+    Falls back to a full jira_search when there is no store yet, when the quarter's
+    sprint set or requested fields changed, when the store is older than
+    _ISSUE_STORE_FULL_SYNC_HOURS, or when FULL_SYNC is set. Otherwise only issues
+    updated since the watermark are fetched and upserted by key; issues updated since
+    then that are no longer in any of the quarter's sprints are dropped.
+    persist=False (used by --diagnose) reads the store but never writes it back."""
+    project_key   = proj["key"]
+    sprint_field  = proj.get("sprint_field") or _DEFAULT_SPRINT_FIELD
+    sprint_clause = ", ".join(sprint_ids)
+    base_jql      = f"project = {project_key} AND sprint in ({sprint_clause})"
+    path          = _issue_store_path(proj, label)
+    started       = datetime.now(timezone.utc)
+    store         = None if FULL_SYNC else _load_issue_store(path)
+
+    reason = None
+    if FULL_SYNC:
+        reason = "--full-sync"
+    elif not store:
+        reason = "no local store yet"
+    elif store.get("sprint_ids") != sprint_ids:
+        reason = "sprint set changed"
+    elif store.get("fields") != fields or store.get("expand") != expand:
+        reason = "requested fields changed"
+    else:
+        try:
+            full_age_h = (started - datetime.fromisoformat(store["full_synced_at"])).total_seconds() / 3600
+        except Exception:
+            full_age_h = None
+        if full_age_h is None or full_age_h >= _ISSUE_STORE_FULL_SYNC_HOURS:
+            reason = f"periodic full re-sync (every {_ISSUE_STORE_FULL_SYNC_HOURS}h)"
 
-    return all_issues
+    print(f"  Querying: {base_jql[:90]}...")
+    compact = lambda i: _compact_issue(i, sprint_field)
+    if reason:
+        print(f"      Issue store: full sync ({reason})")
+        issues = jira_search_iter(base_jql, fields=fields, expand=expand, reduce=compact)
+        store = {
+            "project":        project_key,
+            "quarter":        label,
+            "sprint_ids":     sprint_ids,
+            "fields":         fields,
+            "expand":         expand,
+            "full_synced_at": started.isoformat(),
+            "format":         _ISSUE_STORE_FORMAT,
+            "issues":         {i["key"]: i for i in issues},
+        }
+    else:
+        since = (datetime.fromisoformat(store["synced_at"]) - _ISSUE_STORE_OVERLAP).strftime("%Y-%m-%d %H:%M")
+        if store.get("format") != _ISSUE_STORE_FORMAT:
+            # Stores written before records were compacted shrink here once, without a re-sync.
+            store["issues"] = {k: compact(i) for k, i in store["issues"].items()}
+            store["format"] = _ISSUE_STORE_FORMAT
+        changed = 0
+        for i in jira_search_iter(f'{base_jql} AND updated >= "{since}"', fields=fields,
+                                  expand=expand, reduce=compact):
+            store["issues"][i["key"]] = i
+            changed += 1
+        removed = sum(1 for i in jira_search_iter(
+            f'project = {project_key} AND updated >= "{since}" '
+            f'AND (sprint not in ({sprint_clause}) OR sprint is EMPTY)',
+            fields="key", max_results=2000,
+        ) if store["issues"].pop(i["key"], None) is not None)
+        print(f"      Issue store: {changed} updated, {removed} removed since {since} "
+              f"({len(store['issues'])} stored)")
+    store["synced_at"] = started.isoformat()
+    if persist:
+        _save_issue_store(path, store)
+    return list(store["issues"].values())
 
 
 # Cache so we only hit the statuses endpoint once per run (keyed by project key)
 _IN_PROGRESS_STATUSES: dict[str, set] = {}
+_IN_PROGRESS_STATUSES_LOCK = threading.Lock()
 
 
-def fetch_in_progress_statuses(project_key=None):
+def fetch_in_progress_statuses(project_key, cache_dir=None):
     """Return the set of status names that belong to the In Progress category."""
-    global _IN_PROGRESS_STATUSES
-    if project_key is None:
-        project_key = _ACTIVE_PROJECT_KEY
-    if project_key in _IN_PROGRESS_STATUSES:
+    with _IN_PROGRESS_STATUSES_LOCK:
+        if project_key in _IN_PROGRESS_STATUSES:
+            return _IN_PROGRESS_STATUSES[project_key]
+        url = f"{JIRA_BASE_URL}/rest/api/3/project/{project_key}/statuses"
+        try:
+            data = http_get(url, cache_dir=cache_dir)
+            names: set = set()
+            for issue_type in data:
+                for status in issue_type.get("statuses", []):
+                    if status.get("statusCategory", {}).get("key") == "indeterminate":
+                        names.add(status["name"])
+            _IN_PROGRESS_STATUSES[project_key] = names
+            print(f"  In-progress statuses ({project_key}): {names}")
+        except Exception as exc:
+            print(f"  WARNING: Could not fetch project statuses ({exc}) — using defaults")
+            _IN_PROGRESS_STATUSES[project_key] = {"In Progress", "In Development", "In Review", "In Testing"}
         return _IN_PROGRESS_STATUSES[project_key]
-    headers = _auth_header()
-    url = f"{JIRA_BASE_URL}/rest/api/3/project/{project_key}/statuses"
-    try:
-        data = http_get(url, headers)
-        names: set = set()
-        for issue_type in data:
-            for status in issue_type.get("statuses", []):
-                if status.get("statusCategory", {}).get("key") == "indeterminate":
-                    names.add(status["name"])
-        _IN_PROGRESS_STATUSES[project_key] = names
-        print(f"  In-progress statuses ({project_key}): {names}")
-    except Exception as exc:
-        print(f"  WARNING: Could not fetch project statuses ({exc}) — using defaults")
-        _IN_PROGRESS_STATUSES[project_key] = {"In Progress", "In Development", "In Review", "In Testing"}
-    return _IN_PROGRESS_STATUSES[project_key]
 
 
 def _resolution_quarter(date_str):
@@ -578,87 +1191,208 @@ def _resolution_quarter(date_str):
     return f"Q{((d.month - 1) // 3) + 1} {d.year}"
 
 
-def _sprint_added_date(issue, sprint_id_str, sprint_name):
-    """Return the ISO date (YYYY-MM-DD) when a sprint was first added to the issue,
-    by scanning the changelog for sprint field changes.  Returns None if not found.
-    Matches by sprint ID string in the 'to' field or sprint name in 'toString'."""
-    for history in sorted(
-        issue.get("changelog", {}).get("histories", []),
-        key=lambda h: h.get("created", "")
-    ):
+class ChangelogIndex:
+    """Everything the KPI code reads from one issue's changelog, gathered in a single
+    chronological pass — histories are sorted once per issue instead of once per lookup.
+    Get one via RunContext.changelog(rec)."""
+
+    __slots__ = ("status_transitions", "_first_status", "_sprint_added_ids", "_sprint_items",
+                 "_added_cache")
+
+    def __init__(self, issue):
+        self.status_transitions = []  # [(YYYY-MM-DD, fromString, toString)], oldest first
+        self._first_status      = {}  # status name -> first date the issue entered it
+        self._sprint_added_ids  = {}  # sprint id str -> first date it was added
+        self._sprint_items      = []  # [(date, toString, fromString)] for name matching
+        self._added_cache       = {}
+        for history in sorted(issue.get("changelog", {}).get("histories", []),
+                              key=lambda h: h.get("created", "")):
+            day = history.get("created", "")[:10]
+            for item in history.get("items", []):
+                if item.get("field") == "status":
+                    to_status = item.get("toString")
+                    self.status_transitions.append((day, item.get("fromString"), to_status))
+                    if day and to_status not in self._first_status:
+                        self._first_status[to_status] = day
+                if item.get("field") == "Sprint" or item.get("fieldId") == "customfield_10020":
+                    frm_ids = str(item.get("from") or "").split(",")
+                    for sid in str(item.get("to") or "").split(","):
+                        if sid not in frm_ids:
+                            self._sprint_added_ids.setdefault(sid, day)
+                    self._sprint_items.append((day, str(item.get("toString") or ""),
+                                               str(item.get("fromString") or "")))
+
+    def earliest_in_progress(self, in_progress_statuses):
+        """First date (YYYY-MM-DD) the issue entered any In Progress status, or None."""
+        return min((d for name, d in self._first_status.items() if name in in_progress_statuses),
+                   default=None)
+
+    def sprint_added_date(self, sprint_id_str, sprint_name):
+        """Date the sprint was first added to the issue (matched by id in 'to', or by name
+        in 'toString'), or None if the changelog never shows it being added."""
+        key = (sprint_id_str, sprint_name)
+        if key not in self._added_cache:
+            by_name = next((d for d, to_str, frm_str in self._sprint_items
+                            if sprint_name in to_str and sprint_name not in frm_str), None)
+            dates = [d for d in (self._sprint_added_ids.get(sprint_id_str), by_name) if d is not None]
+            self._added_cache[key] = min(dates) if dates else None
+        return self._added_cache[key]
+
+
+# Jira Cloud's Sprint custom field. Override per project with "sprint_field".
+_DEFAULT_SPRINT_FIELD = "customfield_10020"
+
+
+def _payload_sprint_ids(issue, sprint_field=_DEFAULT_SPRINT_FIELD):
+    """Return the set of sprint id strings the issue belongs to according to its own search
+    payload, or None if the payload can't tell. Prefers the sprint field itself; when it
+    wasn't returned, replays the latest Sprint change in the (complete) changelog."""
+    fields = issue.get("fields", {})
+    if sprint_field in fields:
+        ids = set()
+        for sp in fields[sprint_field] or []:
+            if isinstance(sp, dict) and sp.get("id") is not None:
+                ids.add(str(sp["id"]))
+            elif isinstance(sp, str):
+                # Legacy serialisation: "com.atlassian.greenhopper...Sprint@1a2b[id=123,...]"
+                ids.update(re.findall(r"\bid=(\d+)", sp))
+        return ids
+    changelog = issue.get("changelog", {})
+    histories = changelog.get("histories", [])
+    if changelog.get("total", len(histories)) > len(histories):
+        return None  # truncated changelog — the latest Sprint change may be missing
+    latest = None
+    for history in histories:
         for item in history.get("items", []):
-            if item.get("field") == "Sprint" or item.get("fieldId") == "customfield_10020":
-                to_ids  = str(item.get("to")       or "")
-                to_str  = str(item.get("toString") or "")
-                frm_ids = str(item.get("from")     or "")
-                frm_str = str(item.get("fromString") or "")
-                added_by_id   = sprint_id_str in to_ids.split(",") and sprint_id_str not in frm_ids.split(",")
-                added_by_name = sprint_name in to_str and sprint_name not in frm_str
-                if added_by_id or added_by_name:
-                    return history["created"][:10]
-    return None
+            if item.get("field") == "Sprint" or item.get("fieldId") == sprint_field:
+                created = history.get("created", "")
+                if latest is None or created >= latest[0]:
+                    latest = (created, item)
+    if latest is None:
+        return None
+    return {x.strip() for x in str(latest[1].get("to") or "").split(",") if x.strip()}
 
 
-def _earliest_in_progress_date(issue, in_progress_statuses):
-    """Scan the changelog for the first date the issue entered an In Progress status.
-    Returns an ISO date string (YYYY-MM-DD) or None if not found."""
-    histories = issue.get("changelog", {}).get("histories", [])
-    earliest = None
-    for history in sorted(histories, key=lambda h: h.get("created", "")):
-        for item in history.get("items", []):
-            if item.get("field") == "status" and item.get("toString") in in_progress_statuses:
-                d = history.get("created", "")[:10]
-                if d and (earliest is None or d < earliest):
-                    earliest = d
-                break
-    return earliest
+def _fetch_sprint_membership_by_jql(project_key, targets):
+    """Fallback: {issue_key: {sprint_id_str, ...}} from one key-only JQL search per sprint."""
+    def _fetch_sprint_keys(sid_name):
+        sid, _name = sid_name
+        return sid, {i["key"] for i in jira_search(
+            f"project = {project_key} AND sprint = {sid}",
+            fields="key", max_results=2000,
+        )}
+
+    membership: dict[str, set] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+        for sid, keys in ex.map(_fetch_sprint_keys, targets):
+            for k in keys:
+                membership.setdefault(k, set()).add(sid)
+    return membership
+
+
+def resolve_sprint_membership(issues, targets, project_key, sprint_field=_DEFAULT_SPRINT_FIELD,
+                              prev_sid=None):
+    """Map issue key -> [sprint_id_str, ...] restricted to targets ([(sprint_id_str, name)],
+    in target order; prev_sid marks the previous quarter's last sprint in the log).
+    Resolved from the issues' own payload where possible; falls back to per-sprint JQL
+    searches only when some issue has neither the sprint field nor a usable Sprint
+    changelog."""
+    resolved = {i["key"]: _payload_sprint_ids(i, sprint_field) for i in issues}
+    unresolved = [k for k, ids in resolved.items() if ids is None]
+    if unresolved:
+        print(f"  Building sprint membership map ({len(targets)} sprints, parallel) — "
+              f"sprint field missing for {len(unresolved)} issue(s)...")
+        resolved = _fetch_sprint_membership_by_jql(project_key, targets)
+    else:
+        print(f"  Sprint membership resolved from issue payload ({len(issues)} issues)")
+
+    membership: dict[str, list[str]] = {}
+    for key, ids in resolved.items():
+        in_targets = [sid for sid, _name in targets if sid in ids]
+        if in_targets:
+            membership[key] = in_targets
+    for sid, name in targets:
+        count = sum(1 for ids in membership.values() if sid in ids)
+        suffix = " (rollover check)" if sid == prev_sid else ""
+        print(f"    Sprint {name}: {count} issues{suffix}")
+    return membership
 
 
 # ---------------------------------------------------------------------------
 # KPI calculation
 # ---------------------------------------------------------------------------
+# The KPI code reads issues through IssueRecord rather than the raw search payload: the
+# values it needs are pulled out of issue["fields"] once, when the issues are loaded,
+# instead of through the same nested lookups on every pass over the list.
+
+class IssueRecord:
+    """One Jira issue, normalised for the KPI code. `raw` is the (compacted) search
+    payload, kept for the changelog and sprint-field reads that need the full shape."""
+
+    __slots__ = ("key", "id", "summary", "type", "status", "status_cat", "priority",
+                 "assignee", "account_id", "logged_s", "estimated_s", "sp", "has_sp",
+                 "labels", "fix_versions", "created", "resolved", "raw")
+
+    def __init__(self, issue, sp_field):
+        f        = issue["fields"]
+        status   = f.get("status") or {}
+        assignee = f.get("assignee") or {}
+        sp_raw   = f.get(sp_field)
+        self.key          = issue["key"]
+        self.id           = str(issue.get("id", ""))
+        self.summary      = f.get("summary") or ""
+        self.type         = f["issuetype"]["name"]
+        self.status       = status.get("name", "")
+        self.status_cat   = (status.get("statusCategory") or {}).get("key", "")
+        self.priority     = (f.get("priority") or {}).get("name", "") or ""
+        self.assignee     = assignee.get("displayName", "Unassigned")
+        self.account_id   = assignee.get("accountId", "")
+        self.logged_s     = f.get("timespent") or 0
+        self.estimated_s  = f.get("timeoriginalestimate") or 0
+        self.sp           = int(sp_raw or 0)
+        self.has_sp       = bool(sp_raw)   # 0.5 SP counts as estimated even though sp == 0
+        self.labels       = frozenset(f.get("labels") or ())
+        self.fix_versions = tuple(f.get("fixVersions") or ())
+        self.created      = (f.get("created") or "")[:10]
+        self.resolved     = (f.get("resolutiondate") or "")[:10]
+        self.raw          = issue
+
+
+def _cycle_days(rec, ip_date):
+    """Resolved minus (first In Progress, else created) in whole days, or None."""
+    start_s = ip_date or rec.created
+    if start_s and rec.resolved:
+        try:
+            return max(0, (date.fromisoformat(rec.resolved) - date.fromisoformat(start_s)).days)
+        except Exception:
+            pass
+    return None
 
-def _sprint_date_map(board_id=None):
-    """Return list of (start_date_str, end_date_str, sprint_name) from the Agile board API.
+
+def _sprint_date_map(proj, persist=True):
+    """SprintIntervals over the board's active and closed sprints, keyed by sprint name.
     Used to match a resolution date to the sprint it fell within."""
-    if board_id is None:
-        board_id = next(p["board_id"] for p in PROJECTS if p["key"] == _ACTIVE_PROJECT_KEY)
-    headers = _auth_header()
+    try:
+        catalogue = fetch_sprint_catalogue(proj, persist)
+    except Exception as exc:
+        print(f"      WARNING: sprint date map fetch failed ({exc})")
+        return SprintIntervals(())
     entries = []
-    for state in ("active", "closed"):
-        try:
-            start_at = 0
-            while True:
-                params = urllib.parse.urlencode({"state": state, "startAt": start_at, "maxResults": 50})
-                data = http_get(
-                    f"{JIRA_BASE_URL}/rest/agile/1.0/board/{board_id}/sprint?{params}",
-                    headers,
-                )
-                for s in data.get("values", []):
-                    sd = (s.get("startDate") or "")[:10]
-                    ed = (s.get("endDate")   or "")[:10]
-                    nm = s.get("name", "")
-                    if sd and ed and nm:
-                        entries.append((sd, ed, nm))
-                if data.get("isLast", True):
-                    break
-                start_at += len(data.get("values", []))
-        except Exception as exc:
-            print(f"      WARNING: sprint date map fetch failed ({exc})")
-            break
-    return entries
+    for s in _catalogue_sprints(catalogue, "active", "closed"):
+        sd = (s.get("startDate") or "")[:10]
+        ed = (s.get("endDate")   or "")[:10]
+        nm = s.get("name", "")
+        if sd and ed and nm:
+            entries.append((nm, sd, ed))
+    return SprintIntervals(entries)
 
 
 def _sprint_for_date(sprint_map, resolved_date_str):
     """Return the sprint name whose date range contains resolved_date_str."""
-    rd = resolved_date_str[:10]
-    for sd, ed, nm in sprint_map:
-        if sd <= rd <= ed:
-            return nm
-    return ""
+    return sprint_map.find(resolved_date_str[:10]) or ""
 
 
-def _build_inprogress_rows(in_progress, all_issues, qe_date, in_progress_statuses):
+def _build_inprogress_rows(in_progress, all_issues, qe_date, ctx):
     """Build the in-progress issue list, enriched with cross-quarter carry-over info.
 
     Items currently in-progress are shown as normal rows.
@@ -673,8 +1407,8 @@ def _build_inprogress_rows(in_progress, all_issues, qe_date, in_progress_statuse
 
     rows = []
     for i in in_progress:
-        row = _issue_row(i)
-        ip_date = _earliest_in_progress_date(i, in_progress_statuses)
+        row = dict(ctx.issue_row(i))
+        ip_date = ctx.ip_date(i)
         if ip_date and ip_date < qs_str:
             # Item was started before this quarter — flag as a carry-in
             ip_d   = date.fromisoformat(ip_date)
@@ -689,21 +1423,20 @@ def _build_inprogress_rows(in_progress, all_issues, qe_date, in_progress_statuse
 
     cross_candidates = []
     for i in all_issues:
-        if i["fields"]["status"]["statusCategory"]["key"] != "done":
+        if i.status_cat != "done":
             continue
-        rd = (i["fields"].get("resolutiondate") or "")[:10]
+        rd = i.resolved
         if not rd or rd <= qe_str:
             continue
-        ip_date = _earliest_in_progress_date(i, in_progress_statuses)
+        ip_date = ctx.ip_date(i)
         if not ip_date or ip_date > qe_str:
             continue
         cross_candidates.append((i, rd))
 
     if cross_candidates:
-        smap = _sprint_date_map(board_id=_ACTIVE_PROJECT_KEY and next(
-            (p["board_id"] for p in PROJECTS if p["key"] == _ACTIVE_PROJECT_KEY), None))
+        smap = _sprint_date_map(ctx.proj, persist=ctx.use_http_cache)
         for i, rd in cross_candidates:
-            row = _issue_row(i)
+            row = dict(ctx.issue_row(i))
             row["resolved_date"]    = rd
             row["resolved_quarter"] = _resolution_quarter(rd)
             row["resolved_sprint"]  = _sprint_for_date(smap, rd)
@@ -713,135 +1446,336 @@ def _build_inprogress_rows(in_progress, all_issues, qe_date, in_progress_statuse
     return rows
 
 
-def _issue_row(issue):
-    assignee   = issue["fields"].get("assignee")
-    logged_s   = issue["fields"].get("timespent") or 0
-    est_s      = issue["fields"].get("timeoriginalestimate") or 0
-    sp_raw     = issue["fields"].get(_ACTIVE_SP_FIELD)
-    story_pts  = int(sp_raw) if sp_raw is not None else 0
-    resolved_s = (issue["fields"].get("resolutiondate") or "")[:10]
+def _issue_row(rec, ctx):
+    """Dashboard row for one issue. Use ctx.issue_row() to get the run's cached copy."""
     # Use earliest In Progress transition as cycle start; fall back to created date
-    ip_date    = _earliest_in_progress_date(issue, fetch_in_progress_statuses())
-    start_s    = ip_date or (issue["fields"].get("created") or "")[:10]
-    cycle_days = None
-    if start_s and resolved_s:
-        try:
-            cycle_days = max(0, (date.fromisoformat(resolved_s) - date.fromisoformat(start_s)).days)
-        except Exception:
-            pass
+    ip_date = ctx.ip_date(rec)
     return {
-        "key":            issue["key"],
-        "url":            f"{JIRA_BASE_URL}/browse/{issue['key']}",
-        "summary":        issue["fields"]["summary"],
-        "type":           issue["fields"]["issuetype"]["name"],
-        "status":         issue["fields"]["status"]["name"],
-        "status_cat":     issue["fields"]["status"]["statusCategory"]["key"],
-        "assignee":       assignee["displayName"] if assignee else "Unassigned",
-        "priority":       (issue["fields"].get("priority") or {}).get("name", "") or "",
-        "fix_versions":   [v["name"] for v in issue["fields"].get("fixVersions", [])],
-        "labels":         issue["fields"].get("labels", []),
-        "logged_h":       round(logged_s / 3600, 1),
-        "estimated_h":    round(est_s   / 3600, 1),
-        "has_estimate":   est_s > 0,
-        "has_log":        logged_s > 0,
-        "story_points":   story_pts,
-        "cycle_days":     cycle_days,
+        "key":            rec.key,
+        "url":            f"{JIRA_BASE_URL}/browse/{rec.key}",
+        "summary":        rec.summary,
+        "type":           rec.type,
+        "status":         rec.status,
+        "status_cat":     rec.status_cat,
+        "assignee":       rec.assignee,
+        "priority":       rec.priority,
+        "fix_versions":   [v["name"] for v in rec.fix_versions],
+        # The payload's list rather than rec.labels, so the dashboard keeps Jira's order
+        "labels":         rec.raw["fields"].get("labels", []),
+        "logged_h":       round(rec.logged_s    / 3600, 1),
+        "estimated_h":    round(rec.estimated_s / 3600, 1),
+        "has_estimate":   rec.estimated_s > 0,
+        "has_log":        rec.logged_s > 0,
+        "story_points":   rec.sp,
+        "cycle_days":     _cycle_days(rec, ip_date),
     }
 
 
-def _compute_per_sprint(sprints, all_issues, in_progress_statuses, proj,
-                        version_release_dates, issue_sprint_ids_fn,
-                        prev_q_sprint_id=None, prev_q_sprint_end=None,
-                        quarter_start_str=None, excl_issues=None):
-    """Compute per-sprint KPIs and assignee stats for sprint-level filtering and trends."""
-    _excl_done_sp_st  = set(proj.get("excluded_done_statuses", []))
-    _excl_done_sp_lbl = set(proj.get("excluded_done_labels",   []))
-    sp_field          = proj.get("story_points_field") or "customfield_10016"
-    use_oos           = proj.get("use_oos", True)
-    def _is_done_sp(issue):
-        if issue["fields"]["status"]["statusCategory"]["key"] != "done":
-            return False
-        if issue["fields"]["status"]["name"] in _excl_done_sp_st:
-            return False
-        if _excl_done_sp_lbl & set(issue["fields"].get("labels", [])):
-            return False
-        return True
+# ---------------------------------------------------------------------------
+# KPI statistics
+# ---------------------------------------------------------------------------
+# Means, medians and release-date counts for fetch_kpis() and _compute_per_sprint().
+# Medians are true medians (the middle pair is averaged). Inputs are per-sprint and
+# per-quarter lists of at most a few hundred values, so plain sorts and bisects suffice.
+
+
+def _mean(values):
+    """Arithmetic mean rounded to 1dp, or 0 for no values."""
+    if not values:
+        return 0
+    return round(sum(values) / len(values), 1)
+
+
+def _median(values):
+    """Median rounded to 1dp, or 0 for no values. A whole result comes back as an int,
+    so counts such as releases stay integers."""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    mid     = len(ordered) // 2
+    value   = ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    value   = round(float(value), 1)
+    return int(value) if value.is_integer() else value
+
+
+def _count_in_ranges(dates, ranges):
+    """For each inclusive (start, end) in ranges, how many of dates fall inside it.
+    Dates and bounds are YYYY-MM-DD strings; the dates are sorted once and each range
+    is two binary searches instead of a scan over every date."""
+    ordered = sorted(dates)
+    return [max(0, bisect.bisect_right(ordered, e) - bisect.bisect_left(ordered, s))
+            for s, e in ranges]
+
+
+class SprintIntervals:
+    """Sorted index over sprint date ranges, shared by carry-over resolution
+    (_sprint_for_date), release attribution and worklog windowing.
+
+    Built from (sprint id, start, end) with inclusive YYYY-MM-DD bounds; a sprint with no
+    start date matches from the beginning of time and one with no end date runs to today.
+    find() bisects the start dates and walks back only while a running maximum of the end
+    dates still reaches the day, so a lookup is O(log n) for back-to-back sprints while
+    still returning the first-listed sprint where ranges touch or overlap."""
+
+    __slots__ = ("_ids", "_ranges", "_by_id", "_order", "_starts", "_max_end")
+
+    def __init__(self, sprints):
+        today        = str(date.today())
+        self._ids    = []
+        self._ranges = []
+        for sid, start, end in sprints:
+            self._ids.append(sid)
+            self._ranges.append((start or "", end or today))
+        self._by_id  = dict(zip(self._ids, self._ranges))
+        self._order  = sorted(range(len(self._ranges)), key=lambda k: self._ranges[k][0])
+        self._starts = [self._ranges[k][0] for k in self._order]
+        self._max_end, top = [], ""
+        for k in self._order:
+            top = max(top, self._ranges[k][1])
+            self._max_end.append(top)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def find(self, day):
+        """Id of the first-listed sprint whose range contains day, or None."""
+        best = None
+        pos  = bisect.bisect_right(self._starts, day) - 1
+        while pos >= 0 and self._max_end[pos] >= day:
+            k = self._order[pos]
+            if self._ranges[k][1] >= day and (best is None or k < best):
+                best = k
+            pos -= 1
+        return None if best is None else self._ids[best]
+
+    def range_of(self, sid):
+        """(start, end) of one sprint, or None if it isn't in the index."""
+        return self._by_id.get(sid)
+
+    def count(self, dates):
+        """{sprint id: how many of dates fall within that sprint}."""
+        return dict(zip(self._ids, _count_in_ranges(dates, self._ranges)))
+
+
+# ---------------------------------------------------------------------------
+# KPI aggregation
+# ---------------------------------------------------------------------------
+# aggregate_issues() walks a quarter's issues once, derives each issue's facts once
+# (done?, type, seconds, story points, cycle time, ...) and feeds them into every bucket
+# the issue belongs to — the quarter, each of its sprints, and the excluded-summary
+# equivalents — instead of re-filtering the issue list per KPI and per sprint.
+
+class _IssueFacts:
+    """The run-dependent values every bucket needs on top of the IssueRecord (done under
+    this project's rules, first In Progress date, cycle time), computed once per issue."""
+
+    __slots__ = ("rec", "done", "oos", "cycle_days", "ip_date")
+
+    def __init__(self, rec, ctx, is_done):
+        self.rec        = rec
+        self.done       = is_done(rec)
+        self.oos        = "Out_Of_Sprint" in rec.labels
+        self.ip_date    = ctx.ip_date(rec)
+        # Same rule as _issue_row()
+        self.cycle_days = _cycle_days(rec, self.ip_date)
+
+
+class _Bucket:
+    """Running totals for the quarter or for one sprint."""
+
+    __slots__ = ("total", "completed", "types", "logged_s", "estimated_s", "sp_total",
+                 "sp_completed", "oos", "oos_open", "rollover", "cycle", "assignees")
+
+    def __init__(self):
+        self.total = self.completed = self.logged_s = self.estimated_s = 0
+        self.sp_total = self.sp_completed = self.oos = self.oos_open = self.rollover = 0
+        self.types, self.cycle, self.assignees = {}, [], {}
+
+    def add(self, fx, use_oos):
+        r = fx.rec
+        self.total       += 1
+        self.types[r.type] = self.types.get(r.type, 0) + 1
+        self.logged_s    += r.logged_s
+        self.estimated_s += r.estimated_s
+        self.sp_total    += r.sp
+        if fx.done:
+            self.completed    += 1
+            self.sp_completed += r.sp
+        if use_oos and fx.oos:
+            self.oos += 1
+            if r.status_cat != "done":
+                self.oos_open += 1
+        a = self.assignees.get(r.assignee)
+        if a is None:
+            a = self.assignees[r.assignee] = {"account_id": r.account_id, "total": 0, "completed": 0,
+                                              "logged_s": 0, "estimated_s": 0, "sp_total": 0, "sp_completed": 0}
+        a["total"]       += 1
+        a["sp_total"]    += r.sp
+        if fx.done:
+            a["completed"]    += 1
+            a["sp_completed"] += r.sp
+        a["logged_s"]    += r.logged_s
+        a["estimated_s"] += r.estimated_s
+
+
+class _ExclBucket:
+    """Running totals for excluded-summary issues (quarter-wide or one sprint), kept so
+    the dashboard can add them back in when "show excluded" is on."""
+
+    __slots__ = ("items", "completed", "types", "oos", "oos_open", "cycle", "logged_s",
+                 "estimated_s", "no_estimate", "no_log", "by_dev")
+
+    def __init__(self):
+        self.items = self.completed = self.oos = self.oos_open = 0
+        self.logged_s = self.estimated_s = self.no_estimate = self.no_log = 0
+        self.types, self.cycle, self.by_dev = {}, [], {}
+
+    def add(self, fx):
+        r = fx.rec
+        self.items += 1
+        self.types[r.type] = self.types.get(r.type, 0) + 1
+        if r.status_cat == "done":
+            self.completed += 1
+        if fx.oos:
+            self.oos += 1
+            if r.status_cat != "done":
+                self.oos_open += 1
+        if fx.cycle_days is not None:
+            self.cycle.append(fx.cycle_days)
+        self.logged_s    += r.logged_s
+        self.estimated_s += r.estimated_s
+        self.no_estimate += not r.estimated_s
+        self.no_log      += not r.logged_s
+        d = self.by_dev.setdefault(r.assignee, {"logged_h": 0.0, "estimated_h": 0.0, "total": 0, "completed": 0})
+        d["total"]       += 1
+        d["logged_h"]    += round(r.logged_s / 3600, 2)
+        d["estimated_h"] += round(r.estimated_s / 3600, 2)
+        if r.status_cat == "done":
+            d["completed"] += 1
+
+    def stats(self):
+        if not self.items:
+            return {}
+        return {
+            "item_count":        self.items,
+            "completed_count":   self.completed,
+            "bug_count":         self.types.get("Bug", 0),
+            "story_count":       self.types.get("Story", 0),
+            "task_count":        self.types.get("Task", 0),
+            "oos_count":         self.oos,
+            "oos_open_count":    self.oos_open,
+            "avg_cycle_days":    _mean(self.cycle),
+            "med_cycle_days":    _median(self.cycle),
+            "logged_h":          round(self.logged_s    / 3600, 1),
+            "estimated_h":       round(self.estimated_s / 3600, 1),
+            "no_estimate_count": self.no_estimate,
+            "no_log_count":      self.no_log,
+            "by_dev":            self.by_dev,
+        }
 
+
+class KpiAggregate:
+    """Everything fetch_kpis() and _compute_per_sprint() need from one quarter's issues.
+    Issue lists keep the order of the input list."""
+
+    def __init__(self, sprints):
+        self.quarter       = _Bucket()
+        self.sprints       = {str(s["id"]): _Bucket() for s in sprints}
+        self.excl          = _ExclBucket()
+        self.excl_sprints  = {str(s["id"]): _ExclBucket() for s in sprints}
+        self.completed     = []   # issues counted as done (see _is_done in fetch_kpis)
+        self.in_progress   = []
+        self.oos_all       = []
+        self.oos_open      = []
+        self.released      = []
+        self.no_estimate   = []
+        self.no_log        = []
+        self.cycle_times   = []   # quarter cycle times (skips closures with no work done)
+        self.rollover      = 0    # open issues in closed sprints, one per sprint membership
+
+
+def aggregate_issues(all_issues, excl_issues, sprints, ctx, is_done, issue_sprint_ids_fn,
+                     prev_q_sprint_id=None, prev_q_sprint_end=None):
+    """Build a KpiAggregate in one pass over all_issues (and one over excl_issues)."""
+    use_oos = ctx.proj.get("use_oos", True)
+    use_sp  = ctx.proj.get("use_story_points", False)
+    agg     = KpiAggregate(sprints)
+    closed  = {str(s["id"]) for s in sprints if s["state"].lower() == "closed"}
+    # sprint id -> (sprint name, id + end date of the sprint immediately before it).
+    # For the first sprint that is the previous quarter's last sprint (if known).
+    previous = {}
+    for idx, s in enumerate(sprints):
+        if idx > 0:
+            previous[str(s["id"])] = (s["name"], str(sprints[idx - 1]["id"]), sprints[idx - 1].get("end_date") or "")
+        else:
+            previous[str(s["id"])] = (s["name"], prev_q_sprint_id, prev_q_sprint_end or "")
+
+    for i in all_issues:
+        fx  = _IssueFacts(i, ctx, is_done)
+        ids = issue_sprint_ids_fn(i)
+        agg.quarter.add(fx, use_oos)
+        if fx.done:
+            agg.completed.append(i)
+            # Quarter cycle time skips issues that never entered In Progress and have no
+            # logged time — closed without work (e.g. "To Do → Done" / won't-do).
+            if fx.cycle_days is not None and (fx.ip_date or i.logged_s > 0):
+                agg.cycle_times.append(fx.cycle_days)
+        if i.status_cat == "indeterminate":
+            agg.in_progress.append(i)
+        if use_oos and fx.oos:
+            agg.oos_all.append(i)
+            if i.status_cat != "done":
+                agg.oos_open.append(i)
+        if i.status in ("Released", "Closed", "Merged") and i.fix_versions:
+            agg.released.append(i)
+        if use_sp:
+            if not i.has_sp:
+                agg.no_estimate.append(i)
+        else:
+            if not i.estimated_s:
+                agg.no_estimate.append(i)
+            if not i.logged_s:
+                agg.no_log.append(i)
+
+        for sid in ids:
+            bucket = agg.sprints.get(sid)
+            if bucket is None:
+                continue  # e.g. the previous quarter's last sprint
+            if sid in closed and i.status_cat != "done":
+                agg.rollover += 1
+            bucket.add(fx, use_oos)
+            if fx.done and fx.cycle_days is not None:
+                bucket.cycle.append(fx.cycle_days)
+            # Rollover = was in the immediately preceding sprint AND was added to this
+            # sprint AFTER the previous sprint ended. If this sprint was added before the
+            # previous one closed it was an early start (planned for it), not a rollover.
+            name, prev_sid, prev_end = previous[sid]
+            if prev_sid and prev_sid in ids:
+                added = ctx.changelog(i).sprint_added_date(sid, name) if prev_end else None
+                if not (added and added < prev_end):
+                    bucket.rollover += 1
+
+    for i in excl_issues:
+        fx = _IssueFacts(i, ctx, is_done)
+        agg.excl.add(fx)
+        for sid in issue_sprint_ids_fn(i):
+            if sid in agg.excl_sprints:
+                agg.excl_sprints[sid].add(fx)
+    return agg
+
+
+def _compute_per_sprint(sprints, agg, ctx, release_counts, quarter_start_str=None):
+    """Per-sprint KPIs and assignee stats (for sprint-level filtering and trends) from the
+    sprint buckets of a KpiAggregate. release_counts is {sprint id: releases shipped}."""
+    proj       = ctx.proj
     per_sprint = {}
-    for sprint_idx, sprint in enumerate(sprints):
+    for sprint in sprints:
         sid = str(sprint["id"])
-        # ID + end date of the sprint immediately before this one.
-        # For the first sprint use the previous quarter's last sprint (if known).
-        if sprint_idx > 0:
-            prev_sid      = str(sprints[sprint_idx - 1]["id"])
-            prev_end_date = sprints[sprint_idx - 1].get("end_date") or ""
-        else:
-            prev_sid      = prev_q_sprint_id
-            prev_end_date = prev_q_sprint_end or ""
-        s_issues = [i for i in all_issues if sid in issue_sprint_ids_fn(i)]
-        if not s_issues:
+        b   = agg.sprints[sid]
+        if not b.total:
             continue
-        s_total     = len(s_issues)
-        s_completed = [i for i in s_issues if _is_done_sp(i)]
-        s_bugs      = sum(1 for i in s_issues if i["fields"]["issuetype"]["name"] == "Bug")
-        s_stories   = sum(1 for i in s_issues if i["fields"]["issuetype"]["name"] == "Story")
-        s_tasks     = sum(1 for i in s_issues if i["fields"]["issuetype"]["name"] == "Task")
-        s_logged_s  = sum(i["fields"].get("timespent") or 0 for i in s_issues)
-        s_est_s     = sum(i["fields"].get("timeoriginalestimate") or 0 for i in s_issues)
-        s_sp_total     = sum(int(i["fields"].get(sp_field) or 0) for i in s_issues)
-        s_sp_completed = sum(int(i["fields"].get(sp_field) or 0) for i in s_completed)
-        if use_oos:
-            s_oos_issues = [i for i in s_issues if "Out_Of_Sprint" in i["fields"].get("labels", [])]
-            s_oos        = len(s_oos_issues)
-            s_oos_open   = sum(1 for i in s_oos_issues
-                               if i["fields"]["status"]["statusCategory"]["key"] != "done")
-        else:
-            s_oos_issues = []
-            s_oos        = 0
-            s_oos_open   = 0
-        # Rollover = was in the immediately preceding sprint AND was added to the current
-        # sprint AFTER the previous sprint ended.  If the current sprint was added before
-        # the previous sprint closed, it was an early start (planned for this sprint),
-        # not a rollover — exclude it.
-        s_rollover = 0
-        if prev_sid:
-            for i in s_issues:
-                if prev_sid not in issue_sprint_ids_fn(i):
-                    continue
-                if prev_end_date:
-                    added = _sprint_added_date(i, sid, sprint["name"])
-                    if added and added < prev_end_date:
-                        continue  # added to this sprint before prev closed → early start
-                s_rollover += 1
-        s_cycle = []
-        for i in s_completed:
-            rs = (i["fields"].get("resolutiondate") or "")[:10]
-            ip = _earliest_in_progress_date(i, in_progress_statuses)
-            cs = ip or (i["fields"].get("created") or "")[:10]
-            if rs and cs:
-                try:
-                    s_cycle.append(max(0, (date.fromisoformat(rs) - date.fromisoformat(cs)).days))
-                except Exception:
-                    pass
-        sd = sprint.get("start_date") or ""
-        ed = sprint.get("end_date") or str(date.today())
-        s_releases = sum(1 for rd in version_release_dates.values() if sd <= rd <= ed)
-        s_amap = {}
-        for i in s_issues:
-            af  = i["fields"].get("assignee") or {}
-            a   = af.get("displayName", "Unassigned")
-            aid = af.get("accountId", "")
-            if a not in s_amap:
-                s_amap[a] = {"account_id": aid, "total": 0, "completed": 0,
-                             "logged_s": 0, "estimated_s": 0, "sp_total": 0, "sp_completed": 0}
-            sp_val = int(i["fields"].get(sp_field) or 0)
-            s_amap[a]["total"]       += 1
-            s_amap[a]["sp_total"]    += sp_val
-            if _is_done_sp(i):
-                s_amap[a]["completed"]   += 1
-                s_amap[a]["sp_completed"] += sp_val
-            s_amap[a]["logged_s"]    += i["fields"].get("timespent") or 0
-            s_amap[a]["estimated_s"] += i["fields"].get("timeoriginalestimate") or 0
+        s_bugs, s_stories, s_tasks = (b.types.get(t, 0) for t in ("Bug", "Story", "Task"))
+        s_releases = release_counts.get(sid, 0)
         s_assignee_stats = sorted([{
             "name":            a,
             "account_id":      v["account_id"],
@@ -853,122 +1787,150 @@ def _compute_per_sprint(sprints, all_issues, in_progress_statuses, proj,
             "sp_total":        v["sp_total"],
             "sp_completed":    v["sp_completed"],
             "completion_rate": round(v["completed"] / v["total"] * 100) if v["total"] else 0,
-        } for a, v in s_amap.items()], key=lambda x: (x["is_team"], x["total"]), reverse=True)
-        # Per-sprint stats for excluded-summary issues so the dashboard
-        # can adjust sprint-level KPIs when the "show excluded" checkbox is on.
-        se_issues = [i for i in (excl_issues or []) if sid in issue_sprint_ids_fn(i)]
-        se_logged_s    = sum(i["fields"].get("timespent")            or 0 for i in se_issues)
-        se_estimated_s = sum(i["fields"].get("timeoriginalestimate") or 0 for i in se_issues)
-        se_rows  = [_issue_row(i) for i in se_issues]
-        se_cycle = [r["cycle_days"] for r in se_rows if r.get("cycle_days") is not None]
-        se_by_dev = {}
-        for _i in se_issues:
-            _af = _i["fields"].get("assignee") or {}
-            _a  = _af.get("displayName", "Unassigned")
-            if _a not in se_by_dev:
-                se_by_dev[_a] = {"logged_h": 0.0, "estimated_h": 0.0, "total": 0, "completed": 0}
-            se_by_dev[_a]["total"]       += 1
-            se_by_dev[_a]["logged_h"]    += round((_i["fields"].get("timespent")            or 0) / 3600, 2)
-            se_by_dev[_a]["estimated_h"] += round((_i["fields"].get("timeoriginalestimate") or 0) / 3600, 2)
-            if _i["fields"]["status"]["statusCategory"]["key"] == "done":
-                se_by_dev[_a]["completed"] += 1
-        s_excl_stats = {
-            "item_count":        len(se_issues),
-            "completed_count":   sum(1 for i in se_issues
-                                     if i["fields"]["status"]["statusCategory"]["key"] == "done"),
-            "bug_count":         sum(1 for i in se_issues
-                                     if i["fields"]["issuetype"]["name"] == "Bug"),
-            "story_count":       sum(1 for i in se_issues
-                                     if i["fields"]["issuetype"]["name"] == "Story"),
-            "task_count":        sum(1 for i in se_issues
-                                     if i["fields"]["issuetype"]["name"] == "Task"),
-            "oos_count":         sum(1 for i in se_issues
-                                     if "Out_Of_Sprint" in i["fields"].get("labels", [])),
-            "oos_open_count":    sum(1 for i in se_issues
-                                     if "Out_Of_Sprint" in i["fields"].get("labels", [])
-                                     and i["fields"]["status"]["statusCategory"]["key"] != "done"),
-            "avg_cycle_days":    round(sum(se_cycle) / len(se_cycle), 1) if se_cycle else 0,
-            "med_cycle_days":    round(sorted(se_cycle)[len(se_cycle) // 2], 1) if se_cycle else 0,
-            "logged_h":          round(se_logged_s    / 3600, 1),
-            "estimated_h":       round(se_estimated_s / 3600, 1),
-            "no_estimate_count": sum(1 for i in se_issues if not i["fields"].get("timeoriginalestimate")),
-            "no_log_count":      sum(1 for i in se_issues if not i["fields"].get("timespent")),
-            "by_dev":            se_by_dev,
-        } if se_issues else {}
+        } for a, v in b.assignees.items()], key=lambda x: (x["is_team"], x["total"]), reverse=True)
 
         per_sprint[sid] = {
             "sprint_name":           sprint["name"],
             "sprint_state":          sprint["state"],
-            "total":                 s_total,
-            "completed":             len(s_completed),
-            "completion_rate":       round(len(s_completed) / s_total * 100) if s_total else 0,
+            "total":                 b.total,
+            "completed":             b.completed,
+            "completion_rate":       round(b.completed / b.total * 100),
             "bugs":                  s_bugs,
             "stories":               s_stories,
             "tasks":                 s_tasks,
-            "bug_pct":               round(s_bugs / s_total * 100) if s_total else 0,
-            "rollover_count":        s_rollover,
-            "rollover_pct":          round(s_rollover / s_total * 100) if s_total else 0,
-            "avg_cycle_days":        round(sum(s_cycle) / len(s_cycle), 1) if s_cycle else 0,
-            "med_cycle_days":        round(sorted(s_cycle)[len(s_cycle) // 2], 1) if s_cycle else 0,
-            "time_logged_h":         round(s_logged_s / 3600, 1),
-            "time_estimated_h":      round(s_est_s / 3600, 1),
-            "estimate_accuracy_pct": (round(min(s_logged_s, s_est_s) / max(s_logged_s, s_est_s) * 100)
-                                      if s_logged_s and s_est_s else 0),
-            "oos_total":             s_oos,
-            "oos_open":              s_oos_open,
+            "bug_pct":               round(s_bugs / b.total * 100),
+            "rollover_count":        b.rollover,
+            "rollover_pct":          round(b.rollover / b.total * 100),
+            "avg_cycle_days":        _mean(b.cycle),
+            "med_cycle_days":        _median(b.cycle),
+            "time_logged_h":         round(b.logged_s / 3600, 1),
+            "time_estimated_h":      round(b.estimated_s / 3600, 1),
+            "estimate_accuracy_pct": (round(min(b.logged_s, b.estimated_s) / max(b.logged_s, b.estimated_s) * 100)
+                                      if b.logged_s and b.estimated_s else 0),
+            "oos_total":             b.oos,
+            "oos_open":              b.oos_open,
             "releases_shipped":      s_releases,
-            "sp_total":              s_sp_total,
-            "sp_completed":          s_sp_completed,
+            "sp_total":              b.sp_total,
+            "sp_completed":          b.sp_completed,
             "assignee_stats":        s_assignee_stats,
-            "excl_summary_stats":    s_excl_stats,
+            # Per-sprint stats for excluded-summary issues so the dashboard can adjust
+            # sprint-level KPIs when the "show excluded" checkbox is on.
+            "excl_summary_stats":    agg.excl_sprints[sid].stats(),
         }
     return per_sprint
 
 
-def fetch_worklogs_for_quarter(issues, qs_date, qe_date, sprint_ranges=None, issue_sprint_ids_fn=None):
+# ---------------------------------------------------------------------------
+# Incremental worklog store
+# ---------------------------------------------------------------------------
+# Every worklog ever pulled for a project is kept in store_dir/worklog_store.json.gz,
+# grouped by issue id: {"since": ms watermark, "issues": {issue_id: {"key", "worklogs":
+# {worklog_id: [started_date, accountId, displayName, seconds]}}}}. Each run applies
+# Jira's /worklog/updated and /worklog/deleted feeds since the watermark (ids only,
+# site-wide) and bulk-fetches the changed worklogs via POST /worklog/list, so the day
+# buckets for a quarter are rebuilt locally instead of paging /issue/{key}/worklog for
+# every issue. An issue is only fetched one-by-one when it isn't in the store yet or its
+# stored seconds no longer add up to its timespent.
+
+_WORKLOG_LIST_CHUNK = 1000  # max ids per POST /worklog/list
+_WORKLOG_STORE_LOCKS: dict[str, threading.Lock] = {}
+_WORKLOG_STORE_LOCKS_GUARD = threading.Lock()
+
+
+def _worklog_store_path(proj):
+    return os.path.join(proj["store_dir"], "worklog_store.json.gz")
+
+
+def _worklog_feed(kind, since):
+    """Return ([worklog_id, ...], until_ms) from /worklog/{kind}?since= (kind: updated|deleted)."""
+    ids, url = [], f"{JIRA_BASE_URL}/rest/api/3/worklog/{kind}?since={since}"
+    while True:
+        data = http_get(url)
+        ids.extend(str(v["worklogId"]) for v in data.get("values", []))
+        until = data.get("until", since)
+        if data.get("lastPage", True) or not data.get("nextPage"):
+            return ids, until
+        url = data["nextPage"]
+
+
+def _worklog_row(wl):
+    author = wl.get("author") or {}
+    return [(wl.get("started") or "")[:10], author.get("accountId", ""),
+            author.get("displayName", "Unknown"), wl.get("timeSpentSeconds", 0)]
+
+
+def _apply_worklog_feeds(store):
+    """Fold worklogs changed/deleted since store["since"] into store (in place)."""
+    since = store["since"]
+    updated, until = _worklog_feed("updated", since)
+    deleted, _     = _worklog_feed("deleted", since)
+    owner = {wid: iid for iid, rec in store["issues"].items() for wid in rec["worklogs"]}
+    for wid in deleted:
+        if wid in owner:
+            store["issues"][owner[wid]]["worklogs"].pop(wid, None)
+    applied = 0
+    for i in range(0, len(updated), _WORKLOG_LIST_CHUNK):
+        chunk = [int(w) for w in updated[i:i + _WORKLOG_LIST_CHUNK]]
+        for wl in _JIRA.post(f"{JIRA_BASE_URL}/rest/api/3/worklog/list", {"ids": chunk}):
+            wid, iid = str(wl["id"]), str(wl.get("issueId"))
+            if wid in owner and owner[wid] != iid:
+                store["issues"][owner[wid]]["worklogs"].pop(wid, None)  # moved issue
+            if iid in store["issues"]:  # feed is site-wide — ignore other projects' issues
+                store["issues"][iid]["worklogs"][wid] = _worklog_row(wl)
+                applied += 1
+    store["since"] = until
+    print(f"      Worklog feed: {len(updated)} updated / {len(deleted)} deleted site-wide, "
+          f"{applied} applied to this project")
+
+
+def fetch_worklogs_for_quarter(issues, qs_date, qe_date, sprint_index=None, issue_sprint_ids_fn=None,
+                              cache_dir=None, store_path=None):
     """Fetch per-day worklog breakdowns for issues that have time logged.
     Returns {accountId: {name, days: {date_str: {issue_key: {s: seconds, t: summary}}}}}
     Only hits the API for issues with timespent > 0 to minimise call count.
 
-    sprint_ranges/issue_sprint_ids_fn (optional): when given, an issue's worklog window
+    sprint_index/issue_sprint_ids_fn (optional): when given, an issue's worklog window
     is the union of the actual start/end dates of the sprints (from this quarter's sprint
     list) it belongs to, rather than the quarter's calendar boundary. This keeps worklogs
     with the quarter a sprint is assigned to (via midpoint) even when that sprint runs past
     the quarter's end date, instead of clipping them at the calendar boundary. Falls back
-    to the quarter's calendar dates for issues with no matching sprint."""
-    headers  = _auth_header()
-    logged   = [i for i in issues if (i["fields"].get("timespent") or 0) > 0]
+    to the quarter's calendar dates for issues with no matching sprint.
+
+    cache_dir (optional): worklogs of Done issues are served from the on-disk response
+    cache there, keyed on the issue's timespent so newly logged time refetches them.
+    store_path (optional): read/update the incremental worklog store there (see above)."""
+    logged   = [i for i in issues if i.logged_s > 0]
     qs_str, qe_str = str(qs_date), str(qe_date)
     print(f"      Fetching worklogs for {len(logged)} issues "
           f"({len(issues) - len(logged)} skipped — no time logged)...")
 
     def _issue_window(issue):
-        if not sprint_ranges or not issue_sprint_ids_fn:
+        if not sprint_index or not issue_sprint_ids_fn:
             return qs_str, qe_str
         starts, ends = [], []
         for sid in issue_sprint_ids_fn(issue):
-            rng = sprint_ranges.get(sid)
+            rng = sprint_index.range_of(sid)
             if not rng:
                 continue
-            s, e = rng
+            s, e = rng   # e is already today for a sprint with no end date
             if s:
                 starts.append(s)
-            ends.append(e or str(date.today()))
+            ends.append(e)
         if not starts:
             return qs_str, qe_str
         return min(starts), max(ends)
 
     def _fetch_issue_worklogs(issue):
-        key     = issue["key"]
-        summary = issue["fields"]["summary"][:80]
-        win_start, win_end = _issue_window(issue)
-        entries = []
+        """{worklog_id: row} for one issue via /issue/{key}/worklog, or None on failure."""
+        key  = issue.key
+        done = issue.status_cat == "done"
         try:
             start_at, worklogs = 0, []
             while True:
                 url  = (f"{JIRA_BASE_URL}/rest/api/3/issue/{key}/worklog"
                         f"?maxResults=100&startAt={start_at}")
-                data = http_get(url, headers)
+                data = (http_get(url, cache_dir=cache_dir, version=issue.logged_s)
+                        if cache_dir and done else http_get(url))
                 page = data.get("worklogs", data.get("values", []))
                 worklogs.extend(page)
                 total = data.get("total", 0)
@@ -977,173 +1939,137 @@ def fetch_worklogs_for_quarter(issues, qs_date, qe_date, sprint_ranges=None, iss
                 start_at += len(page)
         except Exception as exc:
             print(f"      WARNING: worklog fetch failed for {key}: {exc}")
-            return entries
-        for wl in worklogs:
-            started = (wl.get("started") or "")[:10]
-            if not (win_start <= started <= win_end):
-                continue
-            author = wl.get("author") or {}
-            aid    = author.get("accountId", "")
-            name   = author.get("displayName", "Unknown")
-            secs   = wl.get("timeSpentSeconds", 0)
-            if not aid or not secs:
-                continue
-            entries.append((aid, name, started, key, summary, secs))
-        return entries
+            return None
+        return {str(wl.get("id")): _worklog_row(wl) for wl in worklogs}
+
+    def _stale(issue, rec):
+        return rec is None or sum(r[3] for r in rec["worklogs"].values()) != issue.logged_s
+
+    if store_path:
+        with _WORKLOG_STORE_LOCKS_GUARD:
+            lock = _WORKLOG_STORE_LOCKS.setdefault(store_path, threading.Lock())
+        lock.acquire()
+    try:
+        store = _load_issue_store(store_path) if store_path and not FULL_SYNC else None
+        if store_path and store is not None:
+            try:
+                _apply_worklog_feeds(store)
+            except Exception as exc:
+                print(f"      WARNING: worklog feed failed ({exc}) — checking issues one by one")
+        if store is None:
+            # Anything updated while we bootstrap is picked up by the next run's feed
+            store = {"since": int(time.time() * 1000), "issues": {}}
+        stored = store["issues"]
+        refetch = [i for i in logged if _stale(i, stored.get(i.id))]
+        if store_path:
+            print(f"      Worklog store: {len(logged) - len(refetch)} issue(s) current, "
+                  f"{len(refetch)} fetched individually")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
+            for issue, rows in zip(refetch, ex.map(_fetch_issue_worklogs, refetch)):
+                if rows is not None:
+                    stored[issue.id] = {"key": issue.key, "worklogs": rows}
+        if store_path:
+            _save_issue_store(store_path, store)
+    finally:
+        if store_path:
+            lock.release()
 
     by_person: dict = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
-        for entries in ex.map(_fetch_issue_worklogs, logged):
-            for aid, name, started, key, summary, secs in entries:
-                by_person.setdefault(aid, {"name": name, "days": {}})
-                days = by_person[aid]["days"]
-                days.setdefault(started, {})
-                entry = days[started].setdefault(key, {"s": 0, "t": summary})
-                entry["s"] += secs
+    for issue in logged:
+        rec = stored.get(issue.id)
+        if not rec:
+            continue
+        key     = issue.key
+        summary = issue.summary[:80]
+        win_start, win_end = _issue_window(issue)
+        for started, aid, name, secs in rec["worklogs"].values():
+            if not (win_start <= started <= win_end) or not aid or not secs:
+                continue
+            by_person.setdefault(aid, {"name": name, "days": {}})
+            days = by_person[aid]["days"]
+            days.setdefault(started, {})
+            entry = days[started].setdefault(key, {"s": 0, "t": summary})
+            entry["s"] += secs
     print(f"      Worklog data: {len(by_person)} people with logged time")
     return by_person
 
 
-def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=None):
+def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=None, persist_store=True):
+    ctx           = RunContext(proj, ref, use_http_cache=persist_store)
     project_key   = proj["key"]
     use_sp        = proj.get("use_story_points", False)
-    sp_field      = proj.get("story_points_field") or "customfield_10016"
+    sp_field      = ctx.sp_field
+    sprint_field  = proj.get("sprint_field") or _DEFAULT_SPRINT_FIELD
     use_oos       = proj.get("use_oos", True)
     excl_summ     = [s.lower() for s in proj.get("excluded_summary_contains", [])]
     sprint_ids    = [str(s["id"]) for s in sprints]
-    sprint_clause = ", ".join(sprint_ids)
-    base_jql      = f"project = {project_key} AND sprint in ({sprint_clause})"
 
-    in_progress_statuses = fetch_in_progress_statuses(project_key)
+    in_progress_statuses = ctx.in_progress_statuses
 
-    print(f"  Querying: {base_jql[:90]}...")
-    all_issues = jira_search(
-        base_jql,
+    all_issues = [IssueRecord(i, sp_field) for i in sync_quarter_issues(
+        proj, quarter_label(ref), sprint_ids,
         fields=f"key,summary,status,issuetype,assignee,fixVersions,labels,priority,"
-               f"timespent,timeoriginalestimate,{sp_field},created,resolutiondate",
-        expand="changelog",
-    )
+               f"timespent,timeoriginalestimate,{sp_field},created,resolutiondate,{sprint_field}",
+        expand="changelog", persist=persist_store,
+    )]
 
     # Exclude issues whose summary contains any of the configured strings (case-insensitive)
     # Keep a separate list so the dashboard can optionally show them.
     excl_summ_issues = []
     if excl_summ:
         excl_summ_issues = [i for i in all_issues
-                            if any(x in i["fields"]["summary"].lower() for x in excl_summ)]
+                            if any(x in i.summary.lower() for x in excl_summ)]
         all_issues = [i for i in all_issues
-                      if not any(x in i["fields"]["summary"].lower() for x in excl_summ)]
-
-    # Time/assignee stats for excluded-summary issues, stored so the dashboard
-    # can add them back in when the "show excluded" checkbox is on.
-    _es_logged_s    = sum(i["fields"].get("timespent")            or 0 for i in excl_summ_issues)
-    _es_estimated_s = sum(i["fields"].get("timeoriginalestimate") or 0 for i in excl_summ_issues)
-    _es_rows  = [_issue_row(i) for i in excl_summ_issues]
-    _es_cycle = [r["cycle_days"] for r in _es_rows if r.get("cycle_days") is not None]
-    _es_by_dev = {}
-    for _i in excl_summ_issues:
-        _af  = _i["fields"].get("assignee") or {}
-        _a   = _af.get("displayName", "Unassigned")
-        if _a not in _es_by_dev:
-            _es_by_dev[_a] = {"logged_h": 0.0, "estimated_h": 0.0, "total": 0, "completed": 0}
-        _es_by_dev[_a]["total"]       += 1
-        _es_by_dev[_a]["logged_h"]    += round((_i["fields"].get("timespent")            or 0) / 3600, 2)
-        _es_by_dev[_a]["estimated_h"] += round((_i["fields"].get("timeoriginalestimate") or 0) / 3600, 2)
-        if _i["fields"]["status"]["statusCategory"]["key"] == "done":
-            _es_by_dev[_a]["completed"] += 1
-    excl_summary_stats = {
-        "item_count":        len(excl_summ_issues),
-        "completed_count":   sum(1 for i in excl_summ_issues
-                                 if i["fields"]["status"]["statusCategory"]["key"] == "done"),
-        "bug_count":         sum(1 for i in excl_summ_issues
-                                 if i["fields"]["issuetype"]["name"] == "Bug"),
-        "story_count":       sum(1 for i in excl_summ_issues
-                                 if i["fields"]["issuetype"]["name"] == "Story"),
-        "task_count":        sum(1 for i in excl_summ_issues
-                                 if i["fields"]["issuetype"]["name"] == "Task"),
-        "oos_count":         sum(1 for i in excl_summ_issues
-                                 if "Out_Of_Sprint" in i["fields"].get("labels", [])),
-        "oos_open_count":    sum(1 for i in excl_summ_issues
-                                 if "Out_Of_Sprint" in i["fields"].get("labels", [])
-                                 and i["fields"]["status"]["statusCategory"]["key"] != "done"),
-        "avg_cycle_days":    round(sum(_es_cycle) / len(_es_cycle), 1) if _es_cycle else 0,
-        "med_cycle_days":    round(sorted(_es_cycle)[len(_es_cycle) // 2], 1) if _es_cycle else 0,
-        "logged_h":          round(_es_logged_s    / 3600, 1),
-        "estimated_h":       round(_es_estimated_s / 3600, 1),
-        "no_estimate_count": sum(1 for i in excl_summ_issues if not i["fields"].get("timeoriginalestimate")),
-        "no_log_count":      sum(1 for i in excl_summ_issues if not i["fields"].get("timespent")),
-        "by_dev":            _es_by_dev,
-    } if excl_summ_issues else {}
-
-    # Key set used to filter raw JQL results (e.g. rollover) against the exclusion list above
-    _filtered_keys = {i["key"] for i in all_issues}
-
-    # Sprint membership — Jira Cloud REST v3 doesn't reliably return customfield_10020
-    # so we fetch issue keys per sprint with a lightweight JQL call instead.
-    print(f"  Building sprint membership map ({len(sprints)} sprints, parallel)...")
-    _sprint_membership: dict[str, list[str]] = {}  # issue_key -> [sprint_id_str, ...]
+                      if not any(x in i.summary.lower() for x in excl_summ)]
+
+    # Sprint membership — read from the sprint field / Sprint changelog already in the
+    # search payload; per-sprint JQL is only used if the payload can't resolve it.
     prev_sid_str = str(prev_sprint_id) if prev_sprint_id else None
     _membership_targets = [(str(s["id"]), s["name"]) for s in sprints]
     if prev_sid_str:
         _membership_targets.append((prev_sid_str, f"prev-quarter {prev_sprint_id}"))
-
-    def _fetch_sprint_keys(sid_name):
-        sid, name = sid_name
-        keys = {i["key"] for i in jira_search(
-            f"project = {project_key} AND sprint = {sid}",
-            fields="key", max_results=2000,
-        )}
-        return sid, name, keys
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
-        for sid, name, keys in ex.map(_fetch_sprint_keys, _membership_targets):
-            for k in keys:
-                _sprint_membership.setdefault(k, []).append(sid)
-            suffix = " (rollover check)" if sid == prev_sid_str else ""
-            print(f"    Sprint {name}: {len(keys)} issues{suffix}")
-
-    def _issue_sprint_ids(issue):
-        return _sprint_membership.get(issue.get("key", ""), [])
-    def _row_with_sprints(issue):
-        row = _issue_row(issue)
-        row["sprint_ids"] = _issue_sprint_ids(issue)
+    _sprint_membership = resolve_sprint_membership(
+        [i.raw for i in all_issues + excl_summ_issues], _membership_targets, project_key, sprint_field,
+        prev_sid=prev_sid_str)
+
+    def _issue_sprint_ids(rec):
+        return _sprint_membership.get(rec.key, [])
+    # One row per issue for the whole run: an issue that appears in several lists (all,
+    # oos, released, no_estimate, ...) shares the same dict, which _intern_issue_rows()
+    # then stores once without diffing.
+    _rows_with_sprints = {}
+    def _row_with_sprints(rec):
+        row = _rows_with_sprints.get(rec.key)
+        if row is None:
+            row = _rows_with_sprints[rec.key] = dict(ctx.issue_row(rec), sprint_ids=_issue_sprint_ids(rec))
         return row
+    issues_by_key = {i.key: i for i in all_issues}
 
     # Statuses/labels in the Done category that should NOT count as completed work.
     # excluded_done_statuses: e.g. ["Rejected"] for PEM
     # excluded_done_labels:   e.g. ["Archive"] for DLK (Done + that label = rejected)
     _excl_done_st  = set(proj.get("excluded_done_statuses", []))
     _excl_done_lbl = set(proj.get("excluded_done_labels",   []))
-    def _is_done(issue):
-        if issue["fields"]["status"]["statusCategory"]["key"] != "done":
+    def _is_done(rec):
+        if rec.status_cat != "done":
             return False
-        if issue["fields"]["status"]["name"] in _excl_done_st:
+        if rec.status in _excl_done_st:
             return False
-        if _excl_done_lbl & set(issue["fields"].get("labels", [])):
+        if _excl_done_lbl & rec.labels:
             return False
         return True
 
-    completed   = [i for i in all_issues if _is_done(i)]
-    in_progress = [i for i in all_issues
-                   if i["fields"]["status"]["statusCategory"]["key"] == "indeterminate"]
-
-    if use_oos:
-        oos_all  = [i for i in all_issues
-                    if "Out_Of_Sprint" in i["fields"].get("labels", [])]
-        oos_open = [i for i in oos_all
-                    if i["fields"]["status"]["statusCategory"]["key"] != "done"]
-    else:
-        oos_all  = []
-        oos_open = []
-
-    released_issues = [i for i in all_issues
-                       if i["fields"]["status"]["name"] in ("Released", "Closed", "Merged")
-                       and i["fields"].get("fixVersions")]
+    agg = aggregate_issues(all_issues, excl_summ_issues, sprints, ctx, _is_done, _issue_sprint_ids,
+                           prev_q_sprint_id=prev_sid_str, prev_q_sprint_end=prev_sprint_end)
+    completed, in_progress = agg.completed, agg.in_progress
+    oos_all, oos_open      = agg.oos_all, agg.oos_open
+    released_issues        = agg.released
 
     version_ids = {}
     versions    = {}
     version_release_dates = {}
     for issue in completed:
-        for v in issue["fields"].get("fixVersions", []):
+        for v in issue.fix_versions:
             if not v.get("released", False):
                 continue
             versions[v["name"]] = versions.get(v["name"], 0) + 1
@@ -1153,6 +2079,8 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
             if rd and (v["name"] not in version_release_dates or rd > version_release_dates[v["name"]]):
                 version_release_dates[v["name"]] = rd
     last_release_date = max(version_release_dates.values(), default=None) if version_release_dates else None
+    sprint_index   = SprintIntervals((str(s["id"]), s.get("start_date"), s.get("end_date")) for s in sprints)
+    release_counts = sprint_index.count(version_release_dates.values())
     version_details = sorted([
         {
             "name":       name,
@@ -1163,12 +2091,8 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
         for name in versions
     ], key=lambda x: x["release_date"], reverse=True)
 
-    type_counts = {}
-    for issue in all_issues:
-        t = issue["fields"]["issuetype"]["name"]
-        type_counts[t] = type_counts.get(t, 0) + 1
-
-    total   = len(all_issues)
+    type_counts = agg.quarter.types
+    total   = agg.quarter.total
     bugs    = type_counts.get("Bug", 0)
     stories = type_counts.get("Story", 0)
     tasks   = type_counts.get("Task", 0)
@@ -1183,18 +2107,14 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
     tickets_per_day = round(len(completed) / days_elapsed, 2) if days_elapsed else 0
 
     # Story points (always computed; display controlled by use_sp flag)
-    sp_total     = sum(int(i["fields"].get(sp_field) or 0) for i in all_issues)
-    sp_completed = sum(int(i["fields"].get(sp_field) or 0) for i in completed)
-
-    # Time tracking / no-estimate logic differs by project mode
-    total_logged_s    = sum(i["fields"].get("timespent")            or 0 for i in all_issues)
-    total_estimated_s = sum(i["fields"].get("timeoriginalestimate") or 0 for i in all_issues)
-    if use_sp:
-        no_estimate = [i for i in all_issues if not (i["fields"].get(sp_field) or 0)]
-        no_log      = []
-    else:
-        no_estimate = [i for i in all_issues if not i["fields"].get("timeoriginalestimate")]
-        no_log      = [i for i in all_issues if not i["fields"].get("timespent")]
+    sp_total     = agg.quarter.sp_total
+    sp_completed = agg.quarter.sp_completed
+
+    # Time tracking / no-estimate logic differs by project mode (see aggregate_issues)
+    total_logged_s    = agg.quarter.logged_s
+    total_estimated_s = agg.quarter.estimated_s
+    no_estimate       = agg.no_estimate
+    no_log            = agg.no_log
     time_logged_h    = round(total_logged_s    / 3600, 1)
     time_estimated_h = round(total_estimated_s / 3600, 1)
     # Accuracy: how close is logged to estimated? Always 0—100%.
@@ -1212,47 +2132,13 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
 
     # Cycle time: In Progress start → resolved for done issues (in calendar days).
     # Uses the earliest changelog transition into an In Progress status as the start;
-    # falls back to the issue creation date only if no such transition exists.
-    cycle_times = []
-    for i in completed:
-        rs = (i["fields"].get("resolutiondate") or "")[:10]
-        if not rs:
-            continue
-        ip = _earliest_in_progress_date(i, in_progress_statuses)
-        # Skip issues that never entered In Progress — they were closed without work
-        # (e.g. "To Do → Done" / won't-do closures). Fall back to created only when
-        # there IS logged time, meaning work happened despite no status transition.
-        if ip:
-            cs = ip
-        elif (i["fields"].get("timespent") or 0) > 0:
-            cs = (i["fields"].get("created") or "")[:10]
-        else:
-            continue  # no work done — exclude from cycle time
-        if cs:
-            try:
-                cycle_times.append(max(0, (date.fromisoformat(rs) - date.fromisoformat(cs)).days))
-            except Exception:
-                pass
-    avg_cycle_days = round(sum(cycle_times) / len(cycle_times), 1) if cycle_times else 0
-    med_cycle_days = round(sorted(cycle_times)[len(cycle_times) // 2], 1) if cycle_times else 0
+    # falls back to the issue creation date only if there is logged time (see aggregate_issues).
+    cycle_times = agg.cycle_times
+    avg_cycle_days = _mean(cycle_times)
+    med_cycle_days = _median(cycle_times)
 
     # Assignee workload: aggregate from all issues
-    assignee_map = {}
-    for i in all_issues:
-        af  = i["fields"].get("assignee") or {}
-        a   = af.get("displayName", "Unassigned")
-        aid = af.get("accountId", "")
-        if a not in assignee_map:
-            assignee_map[a] = {"account_id": aid, "total": 0, "completed": 0,
-                               "logged_s": 0, "estimated_s": 0, "sp_total": 0, "sp_completed": 0}
-        assignee_map[a]["total"]       += 1
-        sp_val = int(i["fields"].get(sp_field) or 0)
-        assignee_map[a]["sp_total"]    += sp_val
-        if _is_done(i):
-            assignee_map[a]["completed"]   += 1
-            assignee_map[a]["sp_completed"] += sp_val
-        assignee_map[a]["logged_s"]    += i["fields"].get("timespent") or 0
-        assignee_map[a]["estimated_s"] += i["fields"].get("timeoriginalestimate") or 0
+    assignee_map = agg.quarter.assignees
     def _team_period_label(team_map, account_id, qs, qe):
         """Return a short label like 'from May 25' / 'until Jun 12' / 'partial' if the
         member was not on the team for the full quarter, else None."""
@@ -1296,30 +2182,20 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
         for a, v in assignee_map.items()
     ], key=lambda x: (x["is_team"], x["total"]), reverse=True)
 
-    # Sprint rollover: items in each closed sprint that were not completed
-    # Filter against _filtered_keys so excluded issues (e.g. buffer work) are not counted
-    closed_sprints = [s for s in sprints if s["state"].lower() == "closed"]
-
-    def _fetch_rollover(s):
-        rolled = jira_search(
-            f"project = {project_key} AND sprint = {s['id']} AND statusCategory != Done",
-            fields="key",
-        )
-        return sum(1 for r in rolled if r["key"] in _filtered_keys)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
-        rollover_count = sum(ex.map(_fetch_rollover, closed_sprints))
+    # Sprint rollover: items in each closed sprint that were not completed.
+    # Only all_issues is scanned, so excluded issues (e.g. buffer work) are not counted.
+    # Counted locally from the same membership map, not with one JQL search per sprint.
+    rollover_count = agg.rollover
     rollover_pct = round(rollover_count / total * 100) if total else 0
 
     oos_open_detail = []
     for issue in oos_open:
-        assignee = issue["fields"].get("assignee")
         oos_open_detail.append({
-            "key":      issue["key"],
-            "summary":  issue["fields"]["summary"],
-            "assignee": assignee["displayName"] if assignee else "Unassigned",
-            "status":   issue["fields"]["status"]["name"],
-            "priority": (issue["fields"].get("priority") or {}).get("name", ""),
+            "key":      issue.key,
+            "summary":  issue.summary,
+            "assignee": issue.assignee,
+            "status":   issue.status,
+            "priority": issue.priority,
         })
 
     _result = {
@@ -1332,11 +2208,8 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
         "version_details":         version_details,
         "tickets_per_day":         tickets_per_day,
         "avg_releases_per_sprint": round(len(versions) / closed_sprint_count, 1) if closed_sprint_count else 0,
-        "med_releases_per_sprint": (lambda counts: sorted(counts)[len(counts)//2] if counts else 0)(
-            [sum(1 for rd in version_release_dates.values()
-                 if (s["start_date"] or "") <= rd <= (s["end_date"] or str(date.today())))
-             for s in sprints if s["state"].lower() == "closed"]
-        ),
+        "med_releases_per_sprint": _median([release_counts[str(s["id"])] for s in sprints
+                                            if s["state"].lower() == "closed"]),
         "oos_total":               len(oos_all),
         "oos_open":                len(oos_open),
         "oos_pct":                 round(len(oos_all) / total * 100) if total else 0,
@@ -1367,34 +2240,28 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
         "rollover_count":       rollover_count,
         "rollover_pct":         rollover_pct,
         "assignee_stats":       assignee_stats,
-        "issues": {
+        "issues": _intern_issue_rows({
             "all":         [_row_with_sprints(i) for i in all_issues],
             "oos_all":     [_row_with_sprints(i) for i in oos_all],
             "oos_open":    [_row_with_sprints(i) for i in oos_open],
             "released":    [_row_with_sprints(i) for i in sorted(
                 released_issues,
                 key=lambda i: (
-                    max((version_release_dates.get(v["name"], "") for v in i["fields"].get("fixVersions", [])), default=""),
-                    max((v["name"].lstrip("v") for v in i["fields"].get("fixVersions", [])), default=""),
+                    max((version_release_dates.get(v["name"], "") for v in i.fix_versions), default=""),
+                    max((v["name"].lstrip("v") for v in i.fix_versions), default=""),
                 ),
                 reverse=True,
             )],
-            "in_progress": [dict(r, sprint_ids=_issue_sprint_ids(
-                                next((i for i in all_issues if i["key"] == r["key"]), {})))
-                            for r in _build_inprogress_rows(in_progress, all_issues, qe_date, in_progress_statuses)],
+            "in_progress": [dict(r, sprint_ids=_issue_sprint_ids(issues_by_key[r["key"]]))
+                            for r in _build_inprogress_rows(in_progress, all_issues, qe_date, ctx)],
             "no_estimate":       [_row_with_sprints(i) for i in no_estimate],
             "excluded_summary":  [_row_with_sprints(i) for i in excl_summ_issues],
-        },
+        }),
         "per_sprint":          "__PLACEHOLDER__",
-        "excl_summary_stats":  excl_summary_stats,
+        "excl_summary_stats":  agg.excl.stats(),
     }
-    _per_sprint = _compute_per_sprint(sprints, all_issues, in_progress_statuses,
-                                      proj, version_release_dates,
-                                      _issue_sprint_ids,
-                                      prev_q_sprint_id=prev_sid_str,
-                                      prev_q_sprint_end=prev_sprint_end,
-                                      quarter_start_str=str(qs_date),
-                                      excl_issues=excl_summ_issues)
+    _per_sprint = _compute_per_sprint(sprints, agg, ctx, release_counts,
+                                      quarter_start_str=str(qs_date))
     _sp_velocity_avg = 0
     if use_sp:
         _closed_sps = [v["sp_completed"] for v in _per_sprint.values()
@@ -1411,10 +2278,11 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
     # Worklog data — only fetched when "fetch_worklogs": true in project config.
     # Adds one API call per issue that has timespent > 0.
     if proj.get("fetch_worklogs", False):
-        _sprint_ranges = {str(s["id"]): (s.get("start_date"), s.get("end_date")) for s in sprints}
         _result["worklog_by_person"] = fetch_worklogs_for_quarter(
             all_issues + excl_summ_issues, qs_date, qe_date,
-            sprint_ranges=_sprint_ranges, issue_sprint_ids_fn=_issue_sprint_ids,
+            sprint_index=sprint_index, issue_sprint_ids_fn=_issue_sprint_ids,
+            cache_dir=ctx.http_cache_dir,
+            store_path=_worklog_store_path(proj) if persist_store else None,
         )
     else:
         _result["worklog_by_person"] = {}
@@ -1425,23 +2293,146 @@ def fetch_kpis(sprints, proj, ref=None, prev_sprint_id=None, prev_sprint_end=Non
 # Claude — generate narrative notes
 # ---------------------------------------------------------------------------
 
-def _note_dependency_map(use_sp, use_oos):
-    """Which KPI fields drive each quarter-level note key. Shared by generate_notes()
-    and the --diagnose inspector so both use identical change-detection logic."""
-    all_keys = [
-        "total","completed","completion_rate","releases_shipped",
-        *( ["oos_total","oos_open"] if use_oos else [] ),
-        "type_split","avg_releases","rollover","cycle_time","assignee_workload",
-    ]
-    if use_sp:
-        all_keys += ["sp_velocity", "no_estimate"]  # no_estimate = no story points
-    else:
-        all_keys += ["time_logged", "estimate_accuracy", "no_estimate"]
-    note_deps = {
-        "total":             ["total"],
-        "completed":         ["completed"],
-        "completion_rate":   ["completion_rate"],
-        "releases_shipped":  ["releases_shipped", "avg_releases_per_sprint"],
+# Every Claude call goes through _claude_request(): a per-call timeout, and retries with
+# exponential backoff (honouring Retry-After) on rate limits, overload and network errors.
+# _run_quarter() submits the quarter call and all sprint calls to _CLAUDE_POOL at once, so a
+# run takes about as long as its slowest call; the pool is shared across concurrent
+# project/quarter runs (--jobs), which keeps the total number of in-flight calls bounded.
+_CLAUDE_MAX_WORKERS  = 4
+_CLAUDE_TIMEOUT_S    = 120
+_CLAUDE_MAX_RETRIES  = 3
+_CLAUDE_BACKOFF_BASE = 2.0
+_CLAUDE_RETRY_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+_CLAUDE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=_CLAUDE_MAX_WORKERS,
+                                                     thread_name_prefix="claude")
+
+
+# Content-addressed note cache, shared by every project, quarter and run (including
+# --force-notes and backfills). A quarter note is keyed by a hash of what that note is
+# written from — its note key, the KPI fields _note_dependency_map() ties to it, project,
+# TEAM CONTEXT, whether the quarter is still active, model and _NOTES_PROMPT_VERSION — so
+# the day count in the quarter status or an unrelated KPI moving doesn't force a new call.
+# Sprint notes are keyed by their whole (small) sprint prompt.
+# Bump _NOTES_PROMPT_VERSION whenever prompt wording, guidance or the key inputs change.
+_NOTES_PROMPT_VERSION      = 3
+_NOTE_CACHE_RETENTION_DAYS = 180
+_NOTE_CACHE_LOCK = threading.Lock()
+_NOTE_CACHE      = None  # {hash: {"v": value, "t": last-used epoch seconds}}, loaded lazily
+_note_cache_hits = 0
+
+
+def _note_cache_key(kind, note_key, inputs, model):
+    raw = json.dumps([kind, note_key, inputs, model, _NOTES_PROMPT_VERSION],
+                     sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _note_cache():
+    global _NOTE_CACHE
+    if _NOTE_CACHE is None:
+        try:
+            with gzip.open(NOTE_CACHE_PATH, "rt", encoding="utf-8") as fh:
+                _NOTE_CACHE = json.load(fh)
+        except FileNotFoundError:
+            _NOTE_CACHE = {}
+        except Exception as exc:
+            print(f"      WARNING: could not read note cache {NOTE_CACHE_PATH} ({exc}) — starting empty")
+            _NOTE_CACHE = {}
+    return _NOTE_CACHE
+
+
+def _note_cache_get(key):
+    global _note_cache_hits
+    with _NOTE_CACHE_LOCK:
+        entry = _note_cache().get(key)
+        if entry is None:
+            return None
+        entry["t"] = int(time.time())
+        _note_cache_hits += 1
+        return entry["v"]
+
+
+def _note_cache_put(key, value):
+    with _NOTE_CACHE_LOCK:
+        _note_cache()[key] = {"v": value, "t": int(time.time())}
+
+
+def _save_note_cache():
+    """Write the note cache back, dropping entries unused for _NOTE_CACHE_RETENTION_DAYS."""
+    with _NOTE_CACHE_LOCK:
+        if _NOTE_CACHE is None:
+            return
+        cutoff = time.time() - _NOTE_CACHE_RETENTION_DAYS * 86400
+        for k in [k for k, e in _NOTE_CACHE.items() if e.get("t", 0) < cutoff]:
+            del _NOTE_CACHE[k]
+        os.makedirs(NOTE_CACHE_PATH.parent, exist_ok=True)
+        with _atomic_target(NOTE_CACHE_PATH) as tmp, gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            json.dump(_NOTE_CACHE, fh, separators=(",", ":"))
+
+
+def _quarter_note_cache_key(key, kpis, note_deps, is_active, use_sp, proj_context, project_key):
+    inputs = {"project": project_key, "context": proj_context, "use_sp": use_sp,
+              "status": "active" if is_active else "completed",
+              "kpis": {f: kpis.get(f) for f in note_deps.get(key, [])}}
+    return _note_cache_key("quarter", key, inputs, ANTHROPIC_QUARTER_MODEL)
+
+
+def _sprint_note_cache_key(sprint_name, sprint_state, sp_kpis, use_oos, proj_context, project_key):
+    inputs = {"project": project_key, "context": proj_context, "use_oos": use_oos,
+              "prompt": _sprint_notes_user_text(sprint_name, sprint_state, sp_kpis, use_oos)}
+    return _note_cache_key("sprint", "sprint", inputs, ANTHROPIC_SPRINT_MODEL)
+
+
+def _claude_request(body):
+    """POST a Messages API request body and return the decoded JSON response.
+    Raises urllib.error.HTTPError (non-retryable status, or retries exhausted) or the
+    last network error, so callers' existing error reporting is unchanged."""
+    data = json.dumps(body).encode()
+    headers = {
+        "Content-Type":      "application/json",
+        "x-api-key":         ANTHROPIC_API_KEY,
+        "anthropic-version": "2023-06-01",
+    }
+    for attempt in range(_CLAUDE_MAX_RETRIES + 1):
+        req = urllib.request.Request(ANTHROPIC_API_URL, data=data, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=_CLAUDE_TIMEOUT_S) as resp:
+                return json.loads(resp.read().decode())
+        except urllib.error.HTTPError as exc:
+            if exc.code not in _CLAUDE_RETRY_STATUS or attempt == _CLAUDE_MAX_RETRIES:
+                raise
+            try:
+                delay = max(0.0, float(exc.headers.get("retry-after")))
+            except (TypeError, ValueError):
+                delay = _CLAUDE_BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.0)
+            reason = f"HTTP {exc.code}"
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+            if attempt == _CLAUDE_MAX_RETRIES:
+                raise
+            delay  = _CLAUDE_BACKOFF_BASE * 2 ** attempt * random.uniform(0.5, 1.0)
+            reason = str(getattr(exc, "reason", exc))
+        print(f"      Claude call failed ({reason}) — retrying in {delay:.1f}s "
+              f"({attempt + 1}/{_CLAUDE_MAX_RETRIES})")
+        time.sleep(delay)
+
+
+def _note_dependency_map(use_sp, use_oos):
+    """Which KPI fields drive each quarter-level note key. Shared by generate_notes()
+    and the --diagnose inspector so both use identical change-detection logic."""
+    all_keys = [
+        "total","completed","completion_rate","releases_shipped",
+        *( ["oos_total","oos_open"] if use_oos else [] ),
+        "type_split","avg_releases","rollover","cycle_time","assignee_workload",
+    ]
+    if use_sp:
+        all_keys += ["sp_velocity", "no_estimate"]  # no_estimate = no story points
+    else:
+        all_keys += ["time_logged", "estimate_accuracy", "no_estimate"]
+    note_deps = {
+        "total":             ["total"],
+        "completed":         ["completed"],
+        "completion_rate":   ["completion_rate"],
+        "releases_shipped":  ["releases_shipped", "avg_releases_per_sprint"],
         "oos_total":         ["oos_total", "oos_pct"],
         "oos_open":          ["oos_open"],
         "type_split":        ["bugs", "stories", "tasks", "bug_pct"],
@@ -1495,7 +2486,7 @@ def generate_notes(kpis, sprints, existing_notes=None, existing_kpis=None, proj_
     existing_kpis  = existing_kpis  or {}
     use_sp  = kpis.get("use_story_points", False)
     use_oos = kpis.get("use_oos", True)
-    all_keys, _note_deps = _note_dependency_map(use_sp, use_oos)
+    all_keys, note_deps = _note_dependency_map(use_sp, use_oos)
 
     report = _notes_change_report(kpis, existing_notes, existing_kpis)
     missing_keys = [r["key"] for r in report if r["changed"]]
@@ -1504,11 +2495,7 @@ def generate_notes(kpis, sprints, existing_notes=None, existing_kpis=None, proj_
     for k in (pending_keys or []):
         if k in all_keys and k not in missing_keys:
             missing_keys.append(k)
-    if not missing_keys:
-        print("      KPI values unchanged — skipping API call, reusing existing notes.")
-        return existing_notes, []
 
-    print(f"      Generating notes for {len(missing_keys)} key(s): {', '.join(missing_keys)}")
     current_sprint = next(
         (s["name"] for s in sprints if s["state"].lower() == "active"), None
     )
@@ -1526,6 +2513,54 @@ def generate_notes(kpis, sprints, existing_notes=None, existing_kpis=None, proj_
             f"{a.get('assignee','?')} {a.get('total',0)} ({a.get('pct',0)}%)" for a in team
         ) or "none"
 
+    # Quarter progress context
+    qs_date   = date.fromisoformat(kpis['quarter_start'])
+    qe_month  = qs_date.month + 2
+    qe_date   = date(qs_date.year, qe_month, calendar.monthrange(qs_date.year, qe_month)[1])
+    today     = date.today()
+    is_active = today <= qe_date
+    days_total   = (qe_date - qs_date).days + 1
+    days_elapsed = min((today - qs_date).days + 1, days_total)
+    days_remaining = max((qe_date - today).days, 0)
+    pct_elapsed  = round(days_elapsed / days_total * 100)
+    closed_sprints = sum(1 for s in sprints if s["state"].lower() == "closed")
+    total_sprints  = len(sprints)
+    quarter_status = (
+        f"IN PROGRESS — {pct_elapsed}% through ({days_elapsed}/{days_total} days elapsed, "
+        f"{days_remaining} days remaining). "
+        f"{closed_sprints} of {total_sprints} sprints closed. "
+        f"Active sprint: {current_sprint}. More sprints likely remain before quarter end ({qe_date})."
+    ) if is_active else f"COMPLETED — quarter ended {qe_date}."
+
+    _oos_user_line = f"Open OOS items: {json.dumps(kpis['oos_open_detail'])}\n" if use_oos else ""
+    user_text = f"""\
+Quarter: {kpis['quarter']} (started {kpis['quarter_start']}, ends {qe_date})
+Quarter status: {quarter_status}
+{_oos_user_line}
+
+KPI data:
+{json.dumps(kpis_for_prompt)}"""
+
+    # Reuse cached text for any key whose inputs have been seen before.
+    cache_keys = {k: _quarter_note_cache_key(k, kpis, note_deps, is_active, use_sp,
+                                             proj_context, project_key)
+                  for k in missing_keys}
+    cached = {}
+    if not TESTING_MODE:
+        for k in missing_keys:
+            text = _note_cache_get(cache_keys[k])
+            if text is not None:
+                cached[k] = text
+    if cached:
+        print(f"      Reusing cached note(s) for identical inputs: {', '.join(cached)}")
+        existing_notes = {**existing_notes, **cached}
+        missing_keys   = [k for k in missing_keys if k not in cached]
+    if not missing_keys:
+        print("      KPI values unchanged — skipping API call, reusing existing notes.")
+        return existing_notes, []
+
+    print(f"      Generating notes for {len(missing_keys)} key(s): {', '.join(missing_keys)}")
+
     if TESTING_MODE:
         print("      TESTING MODE — skipping Claude API call, preserving existing notes.")
         return {**{k: "[test]" for k in all_keys}, **existing_notes}, []
@@ -1637,33 +2672,6 @@ def generate_notes(kpis, sprints, existing_notes=None, existing_kpis=None, proj_
         system_text += f"\n\nTEAM CONTEXT: {proj_context}"
     filled_system = system_text
 
-    # Quarter progress context
-    qs_date   = date.fromisoformat(kpis['quarter_start'])
-    qe_month  = qs_date.month + 2
-    qe_date   = date(qs_date.year, qe_month, calendar.monthrange(qs_date.year, qe_month)[1])
-    today     = date.today()
-    is_active = today <= qe_date
-    days_total   = (qe_date - qs_date).days + 1
-    days_elapsed = min((today - qs_date).days + 1, days_total)
-    days_remaining = max((qe_date - today).days, 0)
-    pct_elapsed  = round(days_elapsed / days_total * 100)
-    closed_sprints = sum(1 for s in sprints if s["state"].lower() == "closed")
-    total_sprints  = len(sprints)
-    quarter_status = (
-        f"IN PROGRESS — {pct_elapsed}% through ({days_elapsed}/{days_total} days elapsed, "
-        f"{days_remaining} days remaining). "
-        f"{closed_sprints} of {total_sprints} sprints closed. "
-        f"Active sprint: {current_sprint}. More sprints likely remain before quarter end ({qe_date})."
-    ) if is_active else f"COMPLETED — quarter ended {qe_date}."
-
-    _oos_user_line = f"Open OOS items: {json.dumps(kpis['oos_open_detail'])}\n" if use_oos else ""
-    user_text = f"""\
-Quarter: {kpis['quarter']} (started {kpis['quarter_start']}, ends {qe_date})
-Quarter status: {quarter_status}
-{_oos_user_line}
-
-KPI data:
-{json.dumps(kpis_for_prompt)}"""
 
     body = {
         "model": ANTHROPIC_QUARTER_MODEL,
@@ -1671,26 +2679,19 @@ KPI data:
         "system": [{"type": "text", "text": filled_system, "cache_control": {"type": "ephemeral"}}],
         "messages": [{"role": "user", "content": user_text}],
     }
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-    }
-    data = json.dumps(body).encode()
-    req  = urllib.request.Request(
-        ANTHROPIC_API_URL,
-        data=data, headers=headers, method="POST"
-    )
     try:
-        with urllib.request.urlopen(req) as resp:
-            result = json.loads(resp.read().decode())
+        result = _claude_request(body)
         usage = result.get("usage", {})
-        _log_token_usage("quarter", project_key, kpis.get("quarter", ""), usage)
+        _log_token_usage("quarter", project_key, kpis.get("quarter", ""), usage,
+                         model=ANTHROPIC_QUARTER_MODEL)
         text = result["content"][0]["text"].strip()
         if text.startswith("```"):
             text = "\n".join(text.split("\n")[1:])
             text = text.rsplit("```", 1)[0]
         new_notes = json.loads(text.strip())
+        for k in missing_keys:
+            if isinstance(new_notes.get(k), str) and new_notes[k].strip():
+                _note_cache_put(cache_keys[k], new_notes[k])
         merged     = {**existing_notes, **new_notes}
         unresolved = [k for k in missing_keys if k not in new_notes]
         if unresolved:
@@ -1741,25 +2742,13 @@ def _sprint_notes_change_report(sprint_state, sp_kpis, existing_notes, existing_
     return {"changed": False, "reason": "unchanged"}
 
 
-def generate_sprint_notes(sprint_name, sprint_state, sp_kpis, existing_notes=None,
-                          existing_sp_kpis=None, proj_context="", use_oos=True, project_key=""):
-    """Generate AI narrative notes for a single sprint. Returns (notes_dict, failed_bool).
-    Closed sprints with existing notes are locked permanently — unless the previous
-    attempt failed, in which case it gets retried once more before locking.
-    Active sprints are only regenerated when the underlying KPI values change."""
-    existing_notes    = existing_notes    or {}
-    existing_sp_kpis  = existing_sp_kpis  or {}
-
-    _rep = _sprint_notes_change_report(sprint_state, sp_kpis, existing_notes, existing_sp_kpis)
-    if not _rep["changed"]:
-        return existing_notes, False
-
-    note_keys = ["completion_rate", *( ["oos_total"] if use_oos else [] ),
-                 "rollover", "cycle_time", "type_split"]
+def _sprint_note_keys(use_oos):
+    return ["completion_rate", *( ["oos_total"] if use_oos else [] ),
+            "rollover", "cycle_time", "type_split"]
 
-    if TESTING_MODE:
-        return {**{k: "[test]" for k in note_keys}, **existing_notes}, False
 
+def _sprint_notes_system(proj_context, use_oos, batched=False):
+    """System prompt for sprint notes. batched=True asks for one object per sprint id."""
     system_text = """\
 You are a technical product owner writing concise notes for a Jira sprint review card on a management dashboard.
 Write 1-2 sentences per metric. Be direct, factual, and actionable. Flag risks. Celebrate genuine wins briefly.
@@ -1769,6 +2758,13 @@ Respond ONLY with a valid JSON object — no markdown, no backticks, no trailing
         system_text += f"\n\nTEAM CONTEXT: {proj_context}"
     oos_guidance = "\noos_total: Items added to the sprint after it started. High OOS = reactive/unplanned work. Zero = disciplined planning." if use_oos else ""
     oos_return   = ',"oos_total":"..."' if use_oos else ""
+    keys_json    = f'{{"completion_rate":"..."{oos_return},"rollover":"...","cycle_time":"...","type_split":"..."}}'
+    if batched:
+        return_text = ("Several sprints are given, each headed by its Sprint id. Return ONE object keyed by "
+                       f"sprint id (as a string), each value holding ONLY these keys (no others):\n"
+                       f'{{"<sprint id>":{keys_json}, ...}}')
+    else:
+        return_text = f"Return ONLY these keys (no others):\n{keys_json}"
     system_text += f"""
 
 METRIC GUIDANCE:
@@ -1777,12 +2773,14 @@ rollover: Items carried forward from an earlier sprint in the same quarter. Work
 cycle_time: Median days from In Progress to Done. Under 3d excellent; 3-7d normal; over 7d flag.
 type_split: Bug vs story vs task split. Flag if bugs exceed 40% of sprint items.
 
-Return ONLY these keys (no others):
-{{"completion_rate":"..."{oos_return},"rollover":"...","cycle_time":"...","type_split":"..."}}"""
+{return_text}"""
+    return system_text
 
+
+def _sprint_notes_user_text(sprint_name, sprint_state, sp_kpis, use_oos):
     cr  = sp_kpis.get("completion_rate", 0)
     oos_line = f"\nOOS total: {sp_kpis.get('oos_total',0)}" if use_oos else ""
-    user_text = f"""Sprint: {sprint_name}
+    return f"""Sprint: {sprint_name}
 State: {sprint_state}
 Total: {sp_kpis.get("total",0)}  Completed: {sp_kpis.get("completed",0)} ({cr}%)
 Bug/Story/Task: {sp_kpis.get("bugs",0)}/{sp_kpis.get("stories",0)}/{sp_kpis.get("tasks",0)} ({sp_kpis.get("bug_pct",0)}% bugs)
@@ -1790,82 +2788,223 @@ Rollover: {sp_kpis.get("rollover_count",0)} items ({sp_kpis.get("rollover_pct",0
 Cycle time: {sp_kpis.get("med_cycle_days",0)}d median ({sp_kpis.get("avg_cycle_days",0)}d avg)
 Releases: {sp_kpis.get("releases_shipped",0)}"""
 
+
+def _parse_notes_json(result):
+    text = result["content"][0]["text"].strip()
+    if text.startswith("```"):
+        text = "\n".join(text.split("\n")[1:]).rsplit("```", 1)[0]
+    return json.loads(text.strip())
+
+
+def generate_sprint_notes(sprint_name, sprint_state, sp_kpis, existing_notes=None,
+                          existing_sp_kpis=None, proj_context="", use_oos=True, project_key=""):
+    """Generate AI narrative notes for a single sprint. Returns (notes_dict, failed_bool).
+    Closed sprints with existing notes are locked permanently — unless the previous
+    attempt failed, in which case it gets retried once more before locking.
+    Active sprints are only regenerated when the underlying KPI values change."""
+    existing_notes    = existing_notes    or {}
+    existing_sp_kpis  = existing_sp_kpis  or {}
+
+    _rep = _sprint_notes_change_report(sprint_state, sp_kpis, existing_notes, existing_sp_kpis)
+    if not _rep["changed"]:
+        return existing_notes, False
+
+    if TESTING_MODE:
+        return {**{k: "[test]" for k in _sprint_note_keys(use_oos)}, **existing_notes}, False
+
+    cache_key = _sprint_note_cache_key(sprint_name, sprint_state, sp_kpis, use_oos,
+                                       proj_context, project_key)
+    cached = _note_cache_get(cache_key)
+    if cached is not None:
+        return cached, False
+
     body = {
         "model":      ANTHROPIC_SPRINT_MODEL,
         "max_tokens": 600,
-        "system":     [{"type": "text", "text": system_text}],
-        "messages":   [{"role": "user", "content": user_text}],
+        "system":     [{"type": "text", "text": _sprint_notes_system(proj_context, use_oos)}],
+        "messages":   [{"role": "user", "content": _sprint_notes_user_text(
+                           sprint_name, sprint_state, sp_kpis, use_oos)}],
     }
-    headers = {
-        "Content-Type":    "application/json",
-        "x-api-key":       ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-    }
-    data = json.dumps(body).encode()
-    req  = urllib.request.Request(
-        ANTHROPIC_API_URL,
-        data=data, headers=headers, method="POST"
-    )
     try:
-        with urllib.request.urlopen(req) as resp:
-            result = json.loads(resp.read().decode())
+        result = _claude_request(body)
         usage = result.get("usage", {})
-        _log_token_usage("sprint", project_key, sprint_name, usage)
-        text = result["content"][0]["text"].strip()
-        if text.startswith("```"):
-            text = "\n".join(text.split("\n")[1:]).rsplit("```", 1)[0]
-        return json.loads(text.strip()), False
+        _log_token_usage("sprint", project_key, sprint_name, usage, model=ANTHROPIC_SPRINT_MODEL)
+        notes = _parse_notes_json(result)
+        _note_cache_put(cache_key, notes)
+        return notes, False
     except Exception as exc:
         print(f"      WARNING: sprint notes failed for {sprint_name} ({exc}) — will retry next run")
         return existing_notes, True
 
 
+def generate_sprint_notes_batch(sprints_in, proj_context="", use_oos=True, project_key="",
+                                label=""):
+    """Batched counterpart of generate_sprint_notes(): every sprint that needs regenerating
+    goes into ONE Claude request, so the system prompt and team context are sent once
+    instead of once per sprint.
+
+    sprints_in = {sprint_id: (sprint_name, sprint_state, sp_kpis, existing_notes,
+    existing_sp_kpis)}. Returns {sprint_id: (notes_dict, failed_bool)} with the same
+    meaning as generate_sprint_notes(). A sprint missing from (or malformed in) the
+    response is marked failed and keeps its existing notes, so it is retried next run
+    through the usual notes_failed flag."""
+    results, todo = {}, {}
+    for sid, (name, state, sp_kpis, prev_notes, prev_kpis) in sprints_in.items():
+        prev_notes = prev_notes or {}
+        if _sprint_notes_change_report(state, sp_kpis, prev_notes, prev_kpis or {})["changed"]:
+            todo[sid] = (name, state, sp_kpis, prev_notes)
+        else:
+            results[sid] = (prev_notes, False)
+    if not todo:
+        return results
+
+    note_keys = _sprint_note_keys(use_oos)
+    if TESTING_MODE:
+        for sid, (_, _, _, prev_notes) in todo.items():
+            results[sid] = ({**{k: "[test]" for k in note_keys}, **prev_notes}, False)
+        return results
+    cache_keys = {sid: _sprint_note_cache_key(name, state, sp_kpis, use_oos, proj_context, project_key)
+                  for sid, (name, state, sp_kpis, _) in todo.items()}
+    for sid in list(todo):
+        cached = _note_cache_get(cache_keys[sid])
+        if cached is not None:
+            results[sid] = (cached, False)
+            del todo[sid]
+    if not todo:
+        return results
+    if len(todo) == 1:
+        (sid, (name, state, sp_kpis, prev_notes)), = todo.items()
+        results[sid] = generate_sprint_notes(name, state, sp_kpis, prev_notes, sprints_in[sid][4],
+                                             proj_context=proj_context, use_oos=use_oos,
+                                             project_key=project_key)
+        return results
+
+    system_text = _sprint_notes_system(proj_context, use_oos, batched=True)
+    user_text = "\n\n".join(
+        f"Sprint id: {sid}\n" + _sprint_notes_user_text(name, state, sp_kpis, use_oos)
+        for sid, (name, state, sp_kpis, _) in todo.items()
+    )
+    body = {
+        "model":      ANTHROPIC_SPRINT_MODEL,
+        "max_tokens": 600 * len(todo),
+        "system":     [{"type": "text", "text": system_text}],
+        "messages":   [{"role": "user", "content": user_text}],
+    }
+    try:
+        result = _claude_request(body)
+        usage  = result.get("usage", {})
+        # Unbatched, every sprint would have paid for its own copy of the system prompt;
+        # estimate that share from the prompt's character length.
+        system_share = usage.get("input_tokens", 0) * len(system_text) / max(1, len(system_text) + len(user_text))
+        _log_token_usage("sprint_batch", project_key, f"{label} ({len(todo)} sprints)".strip(), usage,
+                         saved_input=round(system_share * (len(todo) - 1)),
+                         model=ANTHROPIC_SPRINT_MODEL)
+        parsed = _parse_notes_json(result)
+    except Exception as exc:
+        print(f"      WARNING: batched sprint notes failed ({exc}) — will retry next run")
+        parsed = {}
+    for sid, (name, _, _, prev_notes) in todo.items():
+        notes = parsed.get(str(sid)) if isinstance(parsed, dict) else None
+        if isinstance(notes, dict) and any(notes.get(k) for k in note_keys):
+            results[sid] = (notes, False)
+            _note_cache_put(cache_keys[sid], notes)
+        else:
+            if parsed:
+                print(f"      WARNING: batched response had no notes for {name} — will retry next run")
+            results[sid] = (prev_notes, True)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Token usage logging
 # ---------------------------------------------------------------------------
 
+# One JSON object per API call, appended to data/token_usage/YYYY-MM-DD.jsonl (local date).
+# Appends never re-read the ledger; retention is handled by deleting whole day files older
+# than _TOKEN_LOG_RETENTION_DAYS, checked once per day per process. Query with --token-report.
 _TOKEN_LOG_RETENTION_DAYS = 90
-
-def _log_token_usage(call_type, project_key, label, usage):
-    """Append a block to token_usage.log for a single API call, then trim entries older than 90 days."""
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    block = (
-        f"[{ts}]\n"
-        f"  type    : {call_type}\n"
-        f"  project : {project_key}\n"
-        f"  label   : {label}\n"
-        f"  input   : {usage.get('input_tokens', 0):,}\n"
-        f"  output  : {usage.get('output_tokens', 0):,}\n"
-        f"  cache_read  : {usage.get('cache_read_input_tokens', 0):,}\n"
-        f"  cache_write : {usage.get('cache_creation_input_tokens', 0):,}\n"
-        f"\n"
-    )
-    TOKEN_LOG_PATH.parent.mkdir(exist_ok=True)
-    with open(TOKEN_LOG_PATH, "a", encoding="utf-8") as fh:
-        fh.write(block)
-
-    # Trim blocks older than retention window
-    try:
-        cutoff = datetime.now() - timedelta(days=_TOKEN_LOG_RETENTION_DAYS)
-        with open(TOKEN_LOG_PATH, "r", encoding="utf-8") as fh:
-            content = fh.read()
-        blocks = [b for b in content.split("\n\n") if b.strip()]
-        kept = []
-        for b in blocks:
-            first_line = b.strip().splitlines()[0]
-            if first_line.startswith("[") and first_line.endswith("]"):
+_TOKEN_LOG_LOCK = threading.Lock()  # concurrent quarter runs append to the same day file
+_token_log_pruned_on = None
+
+
+def _token_ledger_file(day):
+    return TOKEN_LEDGER_DIR / f"{day.isoformat()}.jsonl"
+
+
+def _log_token_usage(call_type, project_key, label, usage, saved_input=0, model=""):
+    """Append one ledger record for a single API call.
+    saved_input is the estimated input tokens avoided by batching several notes into this call."""
+    global _token_log_pruned_on
+    now = datetime.now()
+    record = {
+        "ts":          now.isoformat(timespec="seconds"),
+        "type":        call_type,
+        "project":     project_key,
+        "label":       label,
+        "model":       model,
+        "input":       usage.get("input_tokens", 0),
+        "output":      usage.get("output_tokens", 0),
+        "cache_read":  usage.get("cache_read_input_tokens", 0),
+        "cache_write": usage.get("cache_creation_input_tokens", 0),
+    }
+    if saved_input:
+        record["saved_input"] = saved_input
+    with _TOKEN_LOG_LOCK:
+        TOKEN_LEDGER_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_token_ledger_file(now.date()), "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        if _token_log_pruned_on != now.date():
+            _token_log_pruned_on = now.date()
+            cutoff = now.date() - timedelta(days=_TOKEN_LOG_RETENTION_DAYS)
+            for f in TOKEN_LEDGER_DIR.glob("*.jsonl"):
                 try:
-                    block_dt = datetime.strptime(first_line[1:-1], "%Y-%m-%d %H:%M:%S")
-                    if block_dt >= cutoff:
-                        kept.append(b)
-                    continue
+                    if date.fromisoformat(f.stem) < cutoff:
+                        f.unlink()
+                except (ValueError, OSError):
+                    pass  # Never let trimming break a run
+
+
+def token_usage_report(days=30, only_projects=None):
+    """Print input/output/cache token totals per day, project and model for the last
+    `days` days of the ledger (optionally limited to some project keys)."""
+    since  = date.today() - timedelta(days=days - 1)
+    totals = {}
+    fields = ("input", "output", "cache_read", "cache_write", "saved_input")
+    for f in sorted(TOKEN_LEDGER_DIR.glob("*.jsonl")):
+        try:
+            if date.fromisoformat(f.stem) < since:
+                continue
+        except ValueError:
+            continue
+        with open(f, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rec = json.loads(line)
                 except ValueError:
-                    pass
-            kept.append(b)
-        with open(TOKEN_LOG_PATH, "w", encoding="utf-8") as fh:
-            fh.write("\n\n".join(reversed(kept)) + "\n")
-    except Exception:
-        pass  # Never let trimming break a run
+                    continue
+                if only_projects and rec.get("project", "").upper() not in only_projects:
+                    continue
+                key = (rec["ts"][:10], rec.get("project", ""), rec.get("model") or "?")
+                row = totals.setdefault(key, dict.fromkeys(("calls", *fields), 0))
+                row["calls"] += 1
+                for k in fields:
+                    row[k] += rec.get(k, 0)
+    if not totals:
+        print(f"No token usage recorded since {since}.")
+        return
+    print(f"{'Day':<10}  {'Project':<8}  {'Model':<28}  {'Calls':>5}  {'Input':>10}  {'Output':>9}  "
+          f"{'Cache rd':>9}  {'Cache wr':>9}  {'Saved':>8}")
+    grand = dict.fromkeys(("calls", *fields), 0)
+    for (day, proj, model), row in sorted(totals.items()):
+        print(f"{day:<10}  {proj:<8}  {model:<28}  {row['calls']:>5}  {row['input']:>10,}  "
+              f"{row['output']:>9,}  {row['cache_read']:>9,}  {row['cache_write']:>9,}  "
+              f"{row['saved_input']:>8,}")
+        for k in grand:
+            grand[k] += row[k]
+    print(f"{'Total':<10}  {'':<8}  {'':<28}  {grand['calls']:>5}  {grand['input']:>10,}  "
+          f"{grand['output']:>9,}  {grand['cache_read']:>9,}  {grand['cache_write']:>9,}  "
+          f"{grand['saved_input']:>8,}")
 
 
 # ---------------------------------------------------------------------------
@@ -1879,6 +3018,129 @@ def ensure_dirs(proj):
     os.makedirs(DASHBOARD_OUTPUT_DIR, exist_ok=True)
 
 
+@contextlib.contextmanager
+def _file_lock(path, waiting_msg=None):
+    """Exclusive advisory (flock) lock on path, created if missing, held for the
+    with-block. Blocks until free; prints waiting_msg first if it has to wait."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a") as fh:
+        try:
+            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if waiting_msg:
+                print(waiting_msg)
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _atomic_target(path):
+    """Yield a temp path beside path, unique per process and thread (the note cache and
+    HA-triggered runs share files across processes). It replaces path when the block
+    completes and is removed if the block raises."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _write_if_changed(path, data):
+    """Write bytes to path atomically, skipping the write entirely when the file
+    already holds identical bytes. Returns True if the file was (re)written."""
+    path = pathlib.Path(path)
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    with _atomic_target(path) as tmp:
+        pathlib.Path(tmp).write_bytes(data)
+    return True
+
+
+def _write_precompressed(path, data):
+    """Write data to path plus .gz (and .br when brotli is installed) siblings, so the
+    static file server can hand out the compressed form directly. Each file goes through
+    _write_if_changed(); gzip's header timestamp is pinned so unchanged input gives
+    byte-identical output. Returns {"raw": n, "gz": n, "br": n} sizes in bytes."""
+    _write_if_changed(path, data)
+    sizes = {"raw": len(data)}
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_if_changed(f"{path}.gz", gz)
+    sizes["gz"] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(data, quality=11)
+        _write_if_changed(f"{path}.br", br)
+        sizes["br"] = len(br)
+    return sizes
+
+
+def _format_sizes(sizes):
+    """'1.8 MB → 142 KB gz, 98 KB br' for a _write_precompressed() result."""
+    def _fmt(n):
+        return f"{n / 1048576:.1f} MB" if n >= 1048576 else f"{n / 1024:.0f} KB"
+    parts = [f"{_fmt(sizes[k])} {k}" for k in ("gz", "br") if k in sizes]
+    return f"{_fmt(sizes['raw'])} → " + ", ".join(parts)
+
+
+# kpis["issues"] is saved normalized: each issue row once in "rows" (keyed by issue key),
+# every category list ("all", "oos_open", "in_progress", ...) as a list of keys, and
+# "overrides" = {list: {key: {field: value}}} for the few rows that carry extra fields in
+# one list only (the carry-over markers on in_progress rows). Quarter files written
+# before this format hold full row dicts in every list; load_all_quarters() upgrades
+# them, and quarters_script.js reads both.
+
+def _intern_issue_rows(lists):
+    """Normalize {list_name: [row, ...]} into the rows/key-list/overrides form."""
+    rows, out, overrides = {}, {}, {}
+    # Rows from "all" (and then excluded_summary) are the canonical copies
+    names = sorted(lists, key=lambda n: (n != "all", n != "excluded_summary"))
+    for name in names:
+        for row in lists[name]:
+            rows.setdefault(row["key"], row)
+    for name, items in lists.items():
+        keys = []
+        for row in items:
+            base = rows[row["key"]]
+            if row is not base:
+                diff = {f: v for f, v in row.items() if f not in base or base[f] != v}
+                if diff:
+                    overrides.setdefault(name, {})[row["key"]] = diff
+            keys.append(row["key"])
+        out[name] = keys
+    return {"rows": rows, **out, "overrides": overrides}
+
+
+def _expand_issue_rows(issues):
+    """Inverse of _intern_issue_rows: {list_name: [row, ...]} with fresh row dicts.
+    Already-expanded (pre-normalization) blocks are returned as they are."""
+    if "rows" not in issues:
+        return issues
+    rows, overrides = issues["rows"], issues.get("overrides", {})
+    return {
+        name: [{**rows[k], **overrides.get(name, {}).get(k, {})} for k in keys]
+        for name, keys in issues.items() if name not in ("rows", "overrides")
+    }
+
+
+def _upgrade_quarter_data(data):
+    """Bring a loaded quarter payload up to the current on-disk format (in place)."""
+    issues = data.get("kpis", {}).get("issues")
+    if issues and "rows" not in issues:
+        data["kpis"]["issues"] = _intern_issue_rows(issues)
+    return data
+
+
 def save_quarter_data(kpis, notes, sprints, proj, notes_generated_at=None, locked=False,
                       pending_note_keys=None):
     key  = quarter_file_key(kpis["quarter"])
@@ -1897,29 +3159,123 @@ def save_quarter_data(kpis, notes, sprints, proj, notes_generated_at=None, locke
         # permanently freeze stale text once the underlying KPI value stops moving.
         "pending_note_keys":  pending_note_keys or [],
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2, default=str)
-    print(f"      Saved data: {path}")
+    sizes = _write_quarter_file(proj, kpis["quarter"], payload)
+    print(f"      Saved data: {path} ({_format_sizes(sizes)})")
     return path
 
 
-def load_all_quarters(proj):
-    """Load all saved quarter JSON files for a project, sorted newest-first."""
-    pattern = os.path.join(proj["data_dir"], "Q*.json")
+# Each project's data_dir also holds quarter_index.json: per saved quarter, its file name,
+# locked, saved_at, sprint ids/names/date ranges, content hash, size and mtime. It is
+# updated by _write_quarter_file() alongside every quarter JSON write, so lookups that only
+# need that metadata (_get_prev_sprint_id, _finalize_previous_quarter) read one small file.
+# Quarter files touched outside _write_quarter_file() are noticed by a size/mtime check
+# and re-read; a payload parsed for that check is handed on to the same load_all_quarters()
+# call rather than parsed twice. Nothing is kept between calls, so every caller gets its own
+# dicts (_enrich_past_quarters_with_carryovers() edits them in place).
+_QUARTER_INDEX_FILE = "quarter_index.json"
+_QUARTER_INDEX_LOCK = threading.Lock()
+_QUARTER_FILE_RE    = re.compile(r"^Q([1-4])_(\d{4})\.json$")
 
-    def _quarter_sort_key(path):
-        name = os.path.basename(path).replace(".json", "")  # e.g. "Q3_2025"
-        q, year = name.split("_")
-        return (int(year), int(q[1:]))
 
-    quarters = {}
-    for f in sorted(glob.glob(pattern), key=_quarter_sort_key, reverse=True):
+def _quarter_label_key(label):
+    """Sort key for a quarter label like 'Q3 2025'."""
+    q, year = label.split()
+    return (int(year), int(q[1:]))
+
+
+def _quarter_index_entry(name, data, body, st):
+    sprints = [{k: s.get(k) for k in ("id", "name", "state", "start_date", "end_date")}
+               for s in data.get("sprints", [])]
+    return {
+        "file":     name,
+        "locked":   bool(data.get("locked")),
+        "saved_at": data.get("saved_at"),
+        "sprints":  json.loads(json.dumps(sprints, default=str)),
+        "sha1":     hashlib.sha1(body).hexdigest(),
+        "size":     st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def _read_quarter_index(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh).get("quarters", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_quarter_index(path, index):
+    body = json.dumps({"quarters": index}, indent=2, sort_keys=True).encode("utf-8")
+    _write_if_changed(path, body)
+
+
+def _write_quarter_file(proj, label, payload):
+    """Write a quarter payload (plus compressed siblings) and record it in the index."""
+    name = f"{quarter_file_key(label)}.json"
+    path = os.path.join(proj["data_dir"], name)
+    body = json.dumps(payload, indent=2, default=str).encode("utf-8")
+    with _QUARTER_INDEX_LOCK:
+        sizes = _write_precompressed(path, body)
+        index_path = os.path.join(proj["data_dir"], _QUARTER_INDEX_FILE)
+        index = _read_quarter_index(index_path)
+        index[label] = _quarter_index_entry(name, payload, body, os.stat(path))
+        _save_quarter_index(index_path, index)
+    return sizes
+
+
+def load_quarter_index(proj, payloads=None):
+    """Return {quarter label: index entry} for a project's saved quarters, checked
+    against the Q*.json files on disk (stat only unless a file changed). Files that had
+    to be re-read are added to payloads ({path: upgraded payload}) when it is given."""
+    data_dir   = proj["data_dir"]
+    index_path = os.path.join(data_dir, _QUARTER_INDEX_FILE)
+    with _QUARTER_INDEX_LOCK:
+        index = _read_quarter_index(index_path)
+        by_file = {e.get("file"): (label, e) for label, e in index.items()}
         try:
-            with open(f, encoding="utf-8") as fh:
-                data = json.load(fh)
-            quarters[data["quarter"]] = data
-        except Exception as e:
-            print(f"      Warning: could not load {f}: {e}")
+            names = sorted(n for n in os.listdir(data_dir) if _QUARTER_FILE_RE.match(n))
+        except FileNotFoundError:
+            names = []
+        fresh = {}
+        for name in names:
+            fpath = os.path.join(data_dir, name)
+            st = os.stat(fpath)
+            label, entry = by_file.get(name, (None, None))
+            if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+                fresh[label] = entry
+                continue
+            try:
+                with open(fpath, "rb") as fh:
+                    body = fh.read()
+                data = json.loads(body)
+                fresh[data["quarter"]] = _quarter_index_entry(name, data, body, st)
+            except Exception as e:
+                print(f"      Warning: could not load {fpath}: {e}")
+                continue
+            if payloads is not None:
+                payloads[fpath] = _upgrade_quarter_data(data)
+        if fresh != index:
+            _save_quarter_index(index_path, fresh)
+        return fresh
+
+
+def load_all_quarters(proj):
+    """Load all saved quarter JSON files for a project, sorted newest-first."""
+    payloads = {}
+    index    = load_quarter_index(proj, payloads)
+    quarters = {}
+    for label in sorted(index, key=_quarter_label_key, reverse=True):
+        fpath = os.path.join(proj["data_dir"], index[label]["file"])
+        data  = payloads.get(fpath)
+        if data is None:
+            try:
+                with open(fpath, "rb") as fh:
+                    data = _upgrade_quarter_data(json.loads(fh.read()))
+            except Exception as e:
+                print(f"      Warning: could not load {fpath}: {e}")
+                continue
+        quarters[data["quarter"]] = data
     return quarters
 
 
@@ -1935,9 +3291,7 @@ def archive_old_quarters(all_quarters, current_quarter, proj):
         # Archive uses single-project data for this project only
         proj_data = {proj["key"]: {"qs": {q_label: data}, "proj_key": proj["key"],
                                    "board_id": proj["board_id"], "display": proj["display"]}}
-        html = _render_html(proj_data)
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        _write_if_changed(html_path, _render_html(proj_data).encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -1952,14 +3306,14 @@ _HTML_TEMPLATE = r"""<!DOCTYPE html>
 <meta name="viewport" content="width=device-width,initial-scale=1">
 <title>__DASHBOARD_TITLE__</title>
 <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>📊</text></svg>">
-<link rel="stylesheet" href="assets/quarters_style__ASSET_SUFFIX__.css?v=__ASSET_VERSION__">
+<link rel="stylesheet" href="assets/quarters_style__ASSET_SUFFIX__.css?v=__CSS_VERSION__">
 </head>
 <body>
 __PREVIEW_BANNER__
 <header id="site-header">
   <div class="header-top">
     <div class="logo-wrap">
-      <img src="assets/logo.png?v=__ASSET_VERSION__" alt="__LOGO_ALT__" class="site-logo">
+      <img src="assets/logo.png?v=__LOGO_VERSION__" alt="__LOGO_ALT__" class="site-logo">
     </div>
     <div class="hdr-center">
       <div class="logo"><span id="proj-name"></span> Quarter Dashboard</div>
@@ -2004,7 +3358,7 @@ const ALL_DATA=__ALL_DATA_JSON__;
 const WLOG_ADMINS=__WLOG_ADMINS_JSON__;
 const NOTES_REFRESH_TIME=__NOTES_REFRESH_TIME__;
 </script>
-<script src="assets/quarters_script__ASSET_SUFFIX__.js?v=__ASSET_VERSION__"></script>
+<script src="assets/quarters_script__ASSET_SUFFIX__.js?v=__JS_VERSION__"></script>
 <div id="tt"></div>
 <div id="cf-access-notice" style="display:none;position:fixed;bottom:24px;left:50%;transform:translateX(-50%);background:#1e293b;color:#f8fafc;padding:10px 20px;border-radius:8px;font-size:13px;font-weight:500;align-items:center;gap:10px;box-shadow:0 4px 12px rgba(0,0,0,.3);z-index:9999">
   <svg width="16" height="16" viewBox="0 0 16 16" fill="none"><circle cx="8" cy="8" r="7" stroke="#f59e0b" stroke-width="1.5"/><path d="M8 5v4M8 11v.5" stroke="#f59e0b" stroke-width="1.5" stroke-linecap="round"/></svg>
@@ -2014,6 +3368,16 @@ const NOTES_REFRESH_TIME=__NOTES_REFRESH_TIME__;
 </html>"""
 
 
+def _asset_version(name):
+    """Short content hash of a bundled asset, used as its ?v= cache-buster so browsers
+    only re-download a file when its bytes actually change."""
+    path = pathlib.Path(__file__).parent / name
+    try:
+        return hashlib.sha1(path.read_bytes()).hexdigest()[:10]
+    except OSError:
+        return "0"
+
+
 def _render_html(all_projects_data, preview=False):
     """Render the HTML template.
     CSS and JS are served as external files from the output directory.
@@ -2025,8 +3389,7 @@ def _render_html(all_projects_data, preview=False):
     # Escape </ so </script> in any value can't terminate the script tag early
     all_data_json = all_data_json.replace("</", "<\\/")
     notes_refresh_time_json = json.dumps(NOTES_REFRESH_TIME)
-    # Cache-busting version string — changes every run so browsers always fetch fresh assets
-    asset_version = str(int(datetime.now().timestamp()))
+    suffix = "_dev" if preview else ""
     preview_banner = (
         '<div style="background:#b45309;color:#fff;text-align:center;padding:6px 12px;'
         'font-size:13px;font-weight:700;letter-spacing:.04em;position:sticky;top:0;z-index:9998">'
@@ -2042,42 +3405,111 @@ def _render_html(all_projects_data, preview=False):
         .replace("__PREVIEW_BANNER__",     preview_banner)
         .replace("__DASHBOARD_TITLE__",    DASHBOARD_TITLE)
         .replace("__LOGO_ALT__",           LOGO_ALT)
-        .replace("__ASSET_VERSION__",      asset_version)
-        .replace("__ASSET_SUFFIX__",       "_dev" if preview else "")
+        .replace("__CSS_VERSION__",        _asset_version(f"quarters_style{suffix}.css"))
+        .replace("__JS_VERSION__",         _asset_version(f"quarters_script{suffix}.js"))
+        .replace("__LOGO_VERSION__",       _asset_version("logo.png"))
+        .replace("__ASSET_SUFFIX__",       suffix)
     )
 
 
+# Per-quarter KPI fields too heavy for the lazy manifest. Everything else in kpis stays,
+# since the trend charts and the quarter dropdown read it for every quarter at once.
+_MANIFEST_DROP_KPIS = ("issues", "worklog_by_person", "per_sprint", "version_details")
+
+
+def _write_dashboard_quarter_files(all_projects_data, out_dir, sizes):
+    """Write each quarter as a content-hashed JSON file (plus compressed siblings) and
+    return a copy of all_projects_data whose qs entries are manifest stubs pointing at
+    those files. Per-file sizes are summed into the sizes dict.
+
+    Files go to <data_dir>/dashboard/ (kept out of data_dir itself so the Q*.json globs
+    only ever see the canonical saved quarters). A quarter whose data hasn't changed
+    keeps its filename, so browsers and the static file server can cache it forever.
+    Superseded hashes are pruned once they're a day old, so a page that is still open
+    (or the preview build, which shares the data dir) doesn't lose files it points at.
+    """
+    projects = {p["key"]: p for p in PROJECTS}
+    manifest = {}
+    for pkey, pdata in all_projects_data.items():
+        proj = projects.get(pkey)
+        if proj is None:
+            manifest[pkey] = pdata
+            continue
+        q_dir = pathlib.Path(proj["data_dir"]) / "dashboard"
+        q_dir.mkdir(parents=True, exist_ok=True)
+        url_base = os.path.relpath(q_dir, out_dir).replace(os.sep, "/")
+        keep, stubs = set(), {}
+        for q_label, data in pdata["qs"].items():
+            body = json.dumps(data, default=str, ensure_ascii=True, separators=(",", ":"))
+            digest = hashlib.sha1(body.encode("utf-8")).hexdigest()[:12]
+            name = f"{quarter_file_key(q_label)}.{digest}.json"
+            _add_sizes(sizes, _write_precompressed(q_dir / name, body.encode("utf-8")))
+            keep.add(name)
+            kpis = data.get("kpis", {})
+            stubs[q_label] = {
+                "quarter": data.get("quarter", q_label),
+                "sprints": data.get("sprints", []),
+                "kpis":    {k: v for k, v in kpis.items() if k not in _MANIFEST_DROP_KPIS},
+                "src":     f"{url_base}/{name}",
+            }
+        cutoff = time.time() - 86400
+        for old in q_dir.glob("Q*.json*"):
+            base = old.name.removesuffix(".gz").removesuffix(".br")
+            if base not in keep and old.stat().st_mtime < cutoff:
+                old.unlink(missing_ok=True)
+        manifest[pkey] = {**pdata, "qs": stubs}
+    return manifest
+
+
+def _add_sizes(total, sizes):
+    for k, n in sizes.items():
+        total[k] = total.get(k, 0) + n
+
+
 def generate_html_dashboard(all_projects_data):
-    import shutil
     _here    = pathlib.Path(__file__).parent
     _out_dir = pathlib.Path(DASHBOARD_OUTPUT_DIR)
 
-    # Copy CSS and JS into assets/ subfolder.
-    # Dev assets (quarters_script_dev.js / quarters_style_dev.css) are kept separate
-    # from live assets so test builds never overwrite what the live dashboard serves.
+    # Copy CSS and JS into assets/ subfolder — only when the bytes differ, so a run
+    # with unchanged assets touches nothing on disk. Dev assets (quarters_script_dev.js /
+    # quarters_style_dev.css) are kept separate from live assets so test builds never
+    # overwrite what the live dashboard serves. Text assets get .gz/.br siblings too.
     _assets_dir = _out_dir / "assets"
     _assets_dir.mkdir(exist_ok=True)
-    for asset in ("quarters_script.js", "quarters_style.css", "logo.png"):
-        src = _here / asset
-        if src.exists():
-            shutil.copy2(src, _assets_dir / asset)
-    for asset in ("quarters_script_dev.js", "quarters_style_dev.css"):
+    asset_sizes, quarter_sizes = {}, {}
+    for asset in ("quarters_script.js", "quarters_style.css", "logo.png",
+                  "quarters_script_dev.js", "quarters_style_dev.css"):
         src = _here / asset
-        if src.exists():
-            shutil.copy2(src, _assets_dir / asset)
+        if not src.exists():
+            continue
+        if asset.endswith((".js", ".css")):
+            _add_sizes(asset_sizes, _write_precompressed(_assets_dir / asset, src.read_bytes()))
+        else:
+            _write_if_changed(_assets_dir / asset, src.read_bytes())
+
+    if DASHBOARD_LAZY_DATA:
+        all_projects_data = _write_dashboard_quarter_files(all_projects_data, _out_dir, quarter_sizes)
 
     # PREVIEW_MODE (dev): write ONLY the preview page — the live page must stay
     # untouched, since the dev project config (team_projects_test.json) can be a
     # subset of the real project list and would otherwise clobber live data.
     if PREVIEW_MODE:
-        preview_path = _out_dir / DASHBOARD_PREVIEW_FILE
-        preview_path.write_text(_render_html(all_projects_data, preview=True), encoding="utf-8")
-        return str(preview_path)
+        html_path = _out_dir / DASHBOARD_PREVIEW_FILE
+        html = _render_html(all_projects_data, preview=True)
+    else:
+        # Live mode: write the real dashboard.
+        html_path = _out_dir / DASHBOARD_FILENAME
+        html = _render_html(all_projects_data, preview=False)
+    html_sizes = _write_precompressed(html_path, html.encode("utf-8"))
 
-    # Live mode: write the real dashboard.
-    live_path = _out_dir / DASHBOARD_FILENAME
-    live_path.write_text(_render_html(all_projects_data, preview=False), encoding="utf-8")
-    return str(live_path)
+    print(f"  {html_path.name}: {_format_sizes(html_sizes)}")
+    if quarter_sizes:
+        print(f"  Quarter files: {_format_sizes(quarter_sizes)}")
+    if asset_sizes:
+        print(f"  Assets: {_format_sizes(asset_sizes)}")
+    if brotli is None:
+        print("  (brotli not installed — .br siblings skipped)")
+    return str(html_path)
 
 
 # ---------------------------------------------------------------------------
@@ -2103,7 +3535,7 @@ def _enrich_past_quarters_with_carryovers(kpis, all_quarters, proj):
     """
     carry_overs = {
         row["key"]: row
-        for row in kpis["issues"]["in_progress"]
+        for row in _expand_issue_rows(kpis["issues"])["in_progress"]
         if row.get("origin_quarter") and row.get("ip_date")
     }
     if not carry_overs:
@@ -2117,7 +3549,8 @@ def _enrich_past_quarters_with_carryovers(kpis, all_quarters, proj):
         q_end    = _quarter_last_day(q_label)
         q_start  = date(q_end.year, q_end.month - 2, 1)
         q_end_s  = str(q_end)
-        ip_list  = q_data.get("kpis", {}).get("issues", {}).get("in_progress", [])
+        issues   = _expand_issue_rows(q_data.get("kpis", {}).get("issues", {}))
+        ip_list  = issues.get("in_progress", [])
         if not ip_list:
             continue
 
@@ -2148,31 +3581,41 @@ def _enrich_past_quarters_with_carryovers(kpis, all_quarters, proj):
                 changed = True
 
         if changed:
-            path = os.path.join(proj["data_dir"], f"{quarter_file_key(q_label)}.json")
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(q_data, f, indent=2, default=str)
+            q_data["kpis"]["issues"] = _intern_issue_rows(issues)
+            _write_quarter_file(proj, q_label, q_data)
             updated.append(q_label)
 
     if updated:
         print(f"      Carry-in markers pushed to: {', '.join(updated)}")
 
 
-def _get_prev_sprint_id(proj, current_sprints):
+def _get_prev_sprint_id(proj, current_sprints, persist=True):
     """Return (sprint_id, end_date_str) for the sprint immediately before this quarter,
-    or (None, None) if no saved data exists yet."""
+    or (None, None) if there is none.
+
+    Read from the board's sprint catalogue, so it doesn't depend on the previous quarter
+    having been saved first — backfill quarters can run in any order (see --jobs).
+    Falls back to scanning saved quarter data if the catalogue can't be fetched."""
     if not current_sprints:
         return None, None
     first_start = current_sprints[0]["start_date"]
     best_id, best_end = None, ""
-    for f in glob.glob(os.path.join(proj["data_dir"], "Q*.json")):
-        try:
-            saved = json.loads(open(f, encoding="utf-8").read())
-            for s in saved.get("sprints", []):
-                end = s.get("end_date") or ""
-                if end and end < first_start and end > best_end:
-                    best_end, best_id = end, s["id"]
-        except Exception:
-            pass
+    try:
+        catalogue = fetch_sprint_catalogue(proj, persist)
+    except Exception as exc:
+        print(f"      WARNING: sprint catalogue unavailable ({exc}) — using saved quarter data")
+        catalogue = None
+    if catalogue is not None:
+        for s in _catalogue_sprints(catalogue, "active", "closed"):
+            end = (s.get("endDate") or "")[:10]
+            if s.get("startDate") and end and end < first_start and end > best_end:
+                best_end, best_id = end, s["id"]
+        return best_id, (best_end or None)
+    for entry in load_quarter_index(proj).values():
+        for s in entry.get("sprints", []):
+            end = s.get("end_date") or ""
+            if end and end < first_start and end > best_end:
+                best_end, best_id = end, s["id"]
     return best_id, (best_end or None)
 
 
@@ -2182,18 +3625,15 @@ def _diagnose_quarter(proj, ref=None):
     anything, so it's safe to re-run repeatedly while troubleshooting stale notes.
     Prints locked/throttle status plus a per-key old-value -> new-value diff showing
     exactly which quarter- and sprint-level notes would regenerate on a real run."""
-    global _ACTIVE_PROJECT_KEY, _ACTIVE_SP_FIELD
-    _ACTIVE_PROJECT_KEY = proj["key"]
-    _ACTIVE_SP_FIELD    = proj.get("story_points_field") or "customfield_10016"
-
     print(f"\n{'='*60}\nDIAGNOSE: {proj['display']} / {quarter_label(ref)}\n{'='*60}")
-    raw_sprints = fetch_sprints_in_quarter(proj, ref)
+    raw_sprints = fetch_sprints_in_quarter(proj, ref, persist=False)
     if not raw_sprints:
         print("  No sprints found for this quarter — nothing to diagnose.")
         return
     sprints = classify_sprints(raw_sprints)
-    prev_sprint_id, prev_sprint_end = _get_prev_sprint_id(proj, sprints)
-    kpis = fetch_kpis(sprints, proj, ref, prev_sprint_id=prev_sprint_id, prev_sprint_end=prev_sprint_end)
+    prev_sprint_id, prev_sprint_end = _get_prev_sprint_id(proj, sprints, persist=False)
+    kpis = fetch_kpis(sprints, proj, ref, prev_sprint_id=prev_sprint_id, prev_sprint_end=prev_sprint_end,
+                      persist_store=False)
 
     existing_json_path = os.path.join(proj["data_dir"], f"{quarter_file_key(kpis['quarter'])}.json")
     existing_saved = {}
@@ -2249,6 +3689,75 @@ def _diagnose_quarter(proj, ref=None):
         print(f"    {spd['sprint_name']:<20} [{spd['sprint_state']:<8}] {flag}  {rep['reason']}")
 
 
+# Serialises runs of the same project/quarter (a backfill ref and the finalize pass can
+# both land on the previous quarter) and every write into a project's data_dir, so
+# concurrent jobs (--jobs N) never interleave on the same quarter files.
+_RUN_LOCKS: dict = {}
+_RUN_LOCKS_GUARD = threading.Lock()
+
+
+def _run_lock(*key):
+    with _RUN_LOCKS_GUARD:
+        return _RUN_LOCKS.setdefault(key, threading.RLock())
+
+
+# Across processes: the HA refresh webhooks can start a script run while another is still
+# going. main() holds data_dir/.run.lock (see _file_lock) for every target project from
+# before the first Jira call until the dashboard is written, taken in project-key order so
+# two runs can't deadlock; a second run simply queues. Once it has the lock it checks
+# data_dir/.last_run.json: if a run that started after this one was requested has since
+# finished the same quarters — with notes, --force-notes and --full-sync wherever this
+# run asked for them — the request is coalesced — that project is loaded from saved data instead of being fetched again.
+# The stamp also keeps the next-sprint panel that run fetched, so a project this run
+# doesn't refresh is rendered exactly as the run that did refresh it left it.
+
+def _run_stamp_path(proj):
+    return os.path.join(proj["data_dir"], ".last_run.json")
+
+
+def _run_covered(proj, requested_at, labels, notes):
+    """True if a completed run that started at/after requested_at already did this work.
+    A run is never coalesced into a weaker one: --force-notes / --full-sync requests are
+    only covered by a run that used the same flag."""
+    try:
+        with open(_run_stamp_path(proj), encoding="utf-8") as fh:
+            stamp = json.load(fh)
+    except (OSError, ValueError):
+        return False
+    return (stamp.get("started_at", 0) >= requested_at
+            and (stamp.get("notes") or not notes)
+            and (stamp.get("force_notes") or not FORCE_NOTES)
+            and (stamp.get("full_sync") or not FULL_SYNC)
+            and set(labels) <= set(stamp.get("quarters", [])))
+
+
+def _last_run_at(proj):
+    """ISO timestamp of the last completed run of proj (from .last_run.json), or None."""
+    try:
+        with open(_run_stamp_path(proj), encoding="utf-8") as fh:
+            finished = json.load(fh)["finished_at"]
+    except (OSError, ValueError, KeyError):
+        return None
+    return datetime.fromtimestamp(finished, timezone.utc).isoformat()
+
+
+def _saved_next_sprint(proj):
+    """Next-sprint panel saved by the last completed run of proj, or None."""
+    try:
+        with open(_run_stamp_path(proj), encoding="utf-8") as fh:
+            return json.load(fh).get("next_sprint")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_run_stamp(proj, started_at, labels, notes, next_sprint):
+    body = json.dumps({"started_at": started_at, "finished_at": time.time(),
+                       "quarters": sorted(labels), "notes": notes,
+                       "force_notes": FORCE_NOTES, "full_sync": FULL_SYNC,
+                       "next_sprint": next_sprint}, indent=2)
+    _write_if_changed(_run_stamp_path(proj), body.encode("utf-8"))
+
+
 def _finalize_previous_quarter(proj, skip_notes=False):
     """Called once the real current quarter is confirmed to have its own live sprint —
     that means the immediately preceding calendar quarter is now definitively over (even
@@ -2259,13 +3768,8 @@ def _finalize_previous_quarter(proj, skip_notes=False):
         return  # data-only runs shouldn't trigger a Claude notes pass
     prev_ref   = current_quarter_start() - timedelta(days=1)
     prev_label = quarter_label(prev_ref)
-    path = os.path.join(proj["data_dir"], f"{quarter_file_key(prev_label)}.json")
-    if os.path.exists(path):
-        try:
-            if json.loads(open(path, encoding="utf-8").read()).get("locked"):
-                return  # already finalized
-        except Exception:
-            pass
+    if load_quarter_index(proj).get(prev_label, {}).get("locked"):
+        return  # already finalized
     print(f"\n  {prev_label} has ended — running final notes pass and locking...")
     _run_quarter(proj, prev_ref, skip_notes=False, force_notes=True, lock_after=True)
 
@@ -2276,141 +3780,152 @@ def _run_quarter(proj, ref=None, skip_notes=False, force_notes=False, lock_after
     force_notes=True bypasses the notes_refresh_hours throttle for this call only.
     lock_after=True marks the saved quarter as locked once notes are generated, so it is
     never regenerated on a future run (see _finalize_previous_quarter)."""
-    global _ACTIVE_PROJECT_KEY, _ACTIVE_SP_FIELD
-    _ACTIVE_PROJECT_KEY = proj["key"]
-    _ACTIVE_SP_FIELD    = proj.get("story_points_field") or "customfield_10016"
-
-    print(f"\n{'='*52}")
-    print(f"Project : {proj['display']}  |  Quarter: {quarter_label(ref)} (starts {current_quarter_start(ref)})")
-
-    print("\n[1/4] Discovering sprints...")
-    raw_sprints = fetch_sprints_in_quarter(proj, ref)
-    if not raw_sprints:
-        print("      No sprints found — skipping.")
-        return None
-    sprints = classify_sprints(raw_sprints)
-    if ref is None:
-        # Confirms the real current quarter already has a live sprint of its own —
-        # the calendar quarter right before it can now be finalized and locked.
-        _finalize_previous_quarter(proj, skip_notes=skip_notes)
-    for s in sprints:
-        print(f"      {s['name']}  [{s['status_label']}]  {s['start_date']} → {s['end_date']}")
-
-    print(f"\n[2/4] Fetching KPIs from Jira ({len(sprints)} sprints)...")
-    prev_sprint_id, prev_sprint_end = _get_prev_sprint_id(proj, sprints)
-    if prev_sprint_id:
-        print(f"      Previous quarter last sprint: {prev_sprint_id} (ends {prev_sprint_end})")
-    kpis = fetch_kpis(sprints, proj, ref, prev_sprint_id=prev_sprint_id, prev_sprint_end=prev_sprint_end)
-    if proj.get("use_story_points"):
-        print(f"      Total: {kpis['total']} | Done: {kpis['completed']} | "
-              f"Rollover: {kpis['rollover_count']} | Cycle: {kpis['avg_cycle_days']}d | "
-              f"SP: {kpis['sp_completed']}/{kpis['sp_total']} | No-SP-est: {kpis['no_estimate_count']}")
-    else:
-        print(f"      Total: {kpis['total']} | Done: {kpis['completed']} | "
-              f"Rollover: {kpis['rollover_count']} | Cycle: {kpis['avg_cycle_days']}d | "
-              f"Logged: {kpis['time_logged_h']}h | No-estimate: {kpis['no_estimate_count']}")
-    _update_developer_roster(kpis.get("assignee_stats", []))
-
-    existing_json_path = os.path.join(proj["data_dir"], f"{quarter_file_key(kpis['quarter'])}.json")
-    existing_saved = {}
-    if os.path.exists(existing_json_path):
-        try:
-            existing_saved = json.loads(open(existing_json_path, encoding="utf-8").read())
-        except Exception:
-            pass
+    with _run_lock(proj["key"], quarter_label(ref)):
+        print(f"\n{'='*52}")
+        print(f"Project : {proj['display']}  |  Quarter: {quarter_label(ref)} (starts {current_quarter_start(ref)})")
+
+        print("\n[1/4] Discovering sprints...")
+        raw_sprints = fetch_sprints_in_quarter(proj, ref)
+        if not raw_sprints:
+            print("      No sprints found — skipping.")
+            return None
+        sprints = classify_sprints(raw_sprints)
+        if ref is None:
+            # Confirms the real current quarter already has a live sprint of its own —
+            # the calendar quarter right before it can now be finalized and locked.
+            _finalize_previous_quarter(proj, skip_notes=skip_notes)
+        for s in sprints:
+            print(f"      {s['name']}  [{s['status_label']}]  {s['start_date']} → {s['end_date']}")
+
+        print(f"\n[2/4] Fetching KPIs from Jira ({len(sprints)} sprints)...")
+        prev_sprint_id, prev_sprint_end = _get_prev_sprint_id(proj, sprints)
+        if prev_sprint_id:
+            print(f"      Previous quarter last sprint: {prev_sprint_id} (ends {prev_sprint_end})")
+        kpis = fetch_kpis(sprints, proj, ref, prev_sprint_id=prev_sprint_id, prev_sprint_end=prev_sprint_end)
+        if proj.get("use_story_points"):
+            print(f"      Total: {kpis['total']} | Done: {kpis['completed']} | "
+                  f"Rollover: {kpis['rollover_count']} | Cycle: {kpis['avg_cycle_days']}d | "
+                  f"SP: {kpis['sp_completed']}/{kpis['sp_total']} | No-SP-est: {kpis['no_estimate_count']}")
+        else:
+            print(f"      Total: {kpis['total']} | Done: {kpis['completed']} | "
+                  f"Rollover: {kpis['rollover_count']} | Cycle: {kpis['avg_cycle_days']}d | "
+                  f"Logged: {kpis['time_logged_h']}h | No-estimate: {kpis['no_estimate_count']}")
+        _update_developer_roster(kpis.get("assignee_stats", []))
+
+        existing_json_path = os.path.join(proj["data_dir"], f"{quarter_file_key(kpis['quarter'])}.json")
+        existing_saved = {}
+        if os.path.exists(existing_json_path):
+            try:
+                existing_saved = json.loads(open(existing_json_path, encoding="utf-8").read())
+            except Exception:
+                pass
 
-    # A locked quarter's notes are frozen against routine/automatic runs, but an
-    # explicit force (--force-notes, or force_notes=True from a caller) still
-    # overrides it — that's the escape hatch for manually refreshing a past quarter.
-    # The quarter simply re-locks afterward (see the save at the end of this function).
-    quarter_already_locked = bool(existing_saved.get("locked"))
-    if quarter_already_locked and not FORCE_NOTES and not force_notes:
-        skip_notes = True
-
-    # Per-project refresh interval: if notes were generated within the last
-    # notes_refresh_hours hours, treat this run as data-only (skip_notes).
-    _refresh_hours = proj.get("notes_refresh_hours")
-    if not skip_notes and not FORCE_NOTES and not force_notes and _refresh_hours and existing_saved.get("notes_generated_at"):
-        try:
-            _last = datetime.fromisoformat(existing_saved["notes_generated_at"].replace("Z", "+00:00"))
-            _age_h = (datetime.now(timezone.utc) - _last).total_seconds() / 3600
-            if _age_h < _refresh_hours:
-                skip_notes = True
-                print(f"\n[3/4] Notes are {_age_h:.1f}h old (limit: {_refresh_hours}h) — reusing existing notes.")
-        except Exception:
-            pass
+        # A locked quarter's notes are frozen against routine/automatic runs, but an
+        # explicit force (--force-notes, or force_notes=True from a caller) still
+        # overrides it — that's the escape hatch for manually refreshing a past quarter.
+        # The quarter simply re-locks afterward (see the save at the end of this function).
+        quarter_already_locked = bool(existing_saved.get("locked"))
+        if quarter_already_locked and not FORCE_NOTES and not force_notes:
+            skip_notes = True
+
+        # Per-project refresh interval: if notes were generated within the last
+        # notes_refresh_hours hours, treat this run as data-only (skip_notes).
+        _refresh_hours = proj.get("notes_refresh_hours")
+        if not skip_notes and not FORCE_NOTES and not force_notes and _refresh_hours and existing_saved.get("notes_generated_at"):
+            try:
+                _last = datetime.fromisoformat(existing_saved["notes_generated_at"].replace("Z", "+00:00"))
+                _age_h = (datetime.now(timezone.utc) - _last).total_seconds() / 3600
+                if _age_h < _refresh_hours:
+                    skip_notes = True
+                    print(f"\n[3/4] Notes are {_age_h:.1f}h old (limit: {_refresh_hours}h) — reusing existing notes.")
+            except Exception:
+                pass
 
-    if skip_notes:
-        print("\n[3/4] Skipping Claude notes (data-only run) — reusing saved notes...")
-        notes = existing_saved.get("notes", {})
-        notes_generated_at = existing_saved.get("notes_generated_at")
-        pending_note_keys  = existing_saved.get("pending_note_keys", [])
-        for sid, spd in kpis["per_sprint"].items():
-            _prev_spd = existing_saved.get("kpis", {}).get("per_sprint", {}).get(sid, {})
-            spd["notes"]        = _prev_spd.get("notes", {})
-            spd["notes_failed"] = _prev_spd.get("notes_failed", False)
-        print(f"      Reused notes for {len(notes)} quarter key(s); sprint notes carried forward.")
-    else:
-        print("\n[3/4] Generating notes via Claude...")
-        existing_notes      = {}
-        existing_kpis       = {}
-        existing_pending    = []
-        if not FORCE_NOTES and not force_notes:
-            existing_notes   = existing_saved.get("notes", {})
-            existing_kpis    = existing_saved.get("kpis",  {})
-            existing_pending = existing_saved.get("pending_note_keys", [])
-        notes, pending_note_keys = generate_notes(kpis, sprints, existing_notes, existing_kpis,
-                               proj_context=proj.get("notes_context", ""),
-                               project_key=proj["key"], pending_keys=existing_pending)
-        quarter_notes_generated = (notes != existing_notes)
-        print(f"      Notes populated: {', '.join(notes.keys()) if notes else 'none (skipped)'}")
-        if pending_note_keys:
-            print(f"      Quarter key(s) still pending retry next run: {', '.join(pending_note_keys)}")
-
-        # Sprint notes — only regenerated when KPI values change; closed sprints locked permanently
-        print("      Generating sprint notes...")
-        existing_per_sprint_notes = {}
-        existing_per_sprint_kpis  = {}
-        if not FORCE_NOTES and not force_notes:
-            for sid, spd in existing_saved.get("kpis", {}).get("per_sprint", {}).items():
-                existing_per_sprint_notes[sid] = spd.get("notes", {})
-                existing_per_sprint_kpis[sid]  = spd
-        any_sprint_generated = False
-        for sid, spd in kpis["per_sprint"].items():
-            prev_notes = existing_per_sprint_notes.get(sid, {})
-            prev_kpis  = existing_per_sprint_kpis.get(sid, {})
-            new_notes, sprint_failed = generate_sprint_notes(
-                                               spd["sprint_name"], spd["sprint_state"], spd,
-                                               prev_notes, prev_kpis,
-                                               proj_context=proj.get("notes_context", ""),
-                                               use_oos=proj.get("use_oos", True),
-                                               project_key=proj["key"])
-            spd["notes"]        = new_notes
-            spd["notes_failed"] = sprint_failed
-            locked    = (not sprint_failed) and spd["sprint_state"].lower() == "closed" and bool(prev_notes)
-            unchanged = (not locked) and (not sprint_failed) and (new_notes is prev_notes or new_notes == prev_notes)
-            if not locked and not unchanged:
-                any_sprint_generated = True
-            status = "failed — will retry" if sprint_failed else ("locked" if locked else ("unchanged" if unchanged else "generated"))
-            print(f"        {spd['sprint_name']}: {status}")
-        notes_generated_at = datetime.now(timezone.utc).isoformat()
-
-    print("\n[4/4] Saving quarter data...")
-    quarter_locked = lock_after or quarter_already_locked
-    save_quarter_data(kpis, notes, sprints, proj,
-                       notes_generated_at=notes_generated_at, locked=quarter_locked,
-                       pending_note_keys=pending_note_keys)
-    if lock_after and not quarter_already_locked:
-        print(f"      {kpis['quarter']} locked — notes will not be regenerated again.")
-
-    all_quarters = load_all_quarters(proj)
-    _enrich_past_quarters_with_carryovers(kpis, all_quarters, proj)
-    archive_old_quarters(all_quarters, kpis["quarter"], proj)
-    print(f"      {kpis['as_of']}")
-    return all_quarters
+        if skip_notes:
+            print("\n[3/4] Skipping Claude notes (data-only run) — reusing saved notes...")
+            notes = existing_saved.get("notes", {})
+            notes_generated_at = existing_saved.get("notes_generated_at")
+            pending_note_keys  = existing_saved.get("pending_note_keys", [])
+            for sid, spd in kpis["per_sprint"].items():
+                _prev_spd = existing_saved.get("kpis", {}).get("per_sprint", {}).get(sid, {})
+                spd["notes"]        = _prev_spd.get("notes", {})
+                spd["notes_failed"] = _prev_spd.get("notes_failed", False)
+            print(f"      Reused notes for {len(notes)} quarter key(s); sprint notes carried forward.")
+        else:
+            print("\n[3/4] Generating notes via Claude...")
+            existing_notes      = {}
+            existing_kpis       = {}
+            existing_pending    = []
+            if not FORCE_NOTES and not force_notes:
+                existing_notes   = existing_saved.get("notes", {})
+                existing_kpis    = existing_saved.get("kpis",  {})
+                existing_pending = existing_saved.get("pending_note_keys", [])
+            quarter_future = _CLAUDE_POOL.submit(
+                generate_notes, kpis, sprints, existing_notes, existing_kpis,
+                proj_context=proj.get("notes_context", ""),
+                project_key=proj["key"], pending_keys=existing_pending)
+
+            # Sprint notes — only regenerated when KPI values change; closed sprints locked
+            # permanently. Submitted alongside the quarter call; results are reported in order.
+            existing_per_sprint_notes = {}
+            existing_per_sprint_kpis  = {}
+            if not FORCE_NOTES and not force_notes:
+                for sid, spd in existing_saved.get("kpis", {}).get("per_sprint", {}).items():
+                    existing_per_sprint_notes[sid] = spd.get("notes", {})
+                    existing_per_sprint_kpis[sid]  = spd
+            sprints_in = {
+                sid: (spd["sprint_name"], spd["sprint_state"], spd,
+                      existing_per_sprint_notes.get(sid, {}), existing_per_sprint_kpis.get(sid, {}))
+                for sid, spd in kpis["per_sprint"].items()
+            }
+            _notes_kw = dict(proj_context=proj.get("notes_context", ""),
+                             use_oos=proj.get("use_oos", True), project_key=proj["key"])
+            if BATCH_SPRINT_NOTES:
+                batch_future = _CLAUDE_POOL.submit(generate_sprint_notes_batch, sprints_in,
+                                                   label=kpis["quarter"], **_notes_kw)
+                sprint_futures = None
+            else:
+                sprint_futures = {sid: _CLAUDE_POOL.submit(generate_sprint_notes, *args, **_notes_kw)
+                                  for sid, args in sprints_in.items()}
+
+            notes, pending_note_keys = quarter_future.result()
+            print(f"      Notes populated: {', '.join(notes.keys()) if notes else 'none (skipped)'}")
+            if pending_note_keys:
+                print(f"      Quarter key(s) still pending retry next run: {', '.join(pending_note_keys)}")
+
+            print("      Sprint notes:")
+            sprint_results = (batch_future.result() if sprint_futures is None
+                              else {sid: f.result() for sid, f in sprint_futures.items()})
+            for sid, spd in kpis["per_sprint"].items():
+                prev_notes = existing_per_sprint_notes.get(sid, {})
+                new_notes, sprint_failed = sprint_results[sid]
+                spd["notes"]        = new_notes
+                spd["notes_failed"] = sprint_failed
+                locked    = (not sprint_failed) and spd["sprint_state"].lower() == "closed" and bool(prev_notes)
+                unchanged = (not locked) and (not sprint_failed) and (new_notes is prev_notes or new_notes == prev_notes)
+                status = "failed — will retry" if sprint_failed else ("locked" if locked else ("unchanged" if unchanged else "generated"))
+                print(f"        {spd['sprint_name']}: {status}")
+            notes_generated_at = datetime.now(timezone.utc).isoformat()
+            _save_note_cache()
+
+        print("\n[4/4] Saving quarter data...")
+        quarter_locked = lock_after or quarter_already_locked
+        with _run_lock(proj["key"]):
+            save_quarter_data(kpis, notes, sprints, proj,
+                               notes_generated_at=notes_generated_at, locked=quarter_locked,
+                               pending_note_keys=pending_note_keys)
+            if lock_after and not quarter_already_locked:
+                print(f"      {kpis['quarter']} locked — notes will not be regenerated again.")
+
+            all_quarters = load_all_quarters(proj)
+            _enrich_past_quarters_with_carryovers(kpis, all_quarters, proj)
+            archive_old_quarters(all_quarters, kpis["quarter"], proj)
+        print(f"      {kpis['as_of']}")
+        return all_quarters
 
 
 def main():
+    requested_at = time.time()
     parser = argparse.ArgumentParser(description="Quarter Dashboard generator")
     parser.add_argument(
         "--data-only", action="store_true",
@@ -2420,17 +3935,32 @@ def main():
         "--force-notes", action="store_true",
         help="Force regeneration of all Claude notes even if KPI values are unchanged."
     )
+    parser.add_argument(
+        "--full-sync", action="store_true",
+        help="Ignore the local issue store and re-pull every issue from Jira "
+             "instead of only those updated since the last run."
+    )
     parser.add_argument(
         "--project", metavar="KEY[,KEY...]",
         help="Run for one or more projects only (e.g. --project dlk or --project dlk,nda). "
              "Other projects load from saved data."
     )
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="Run up to N project/quarter fetches concurrently (default 1 = one at a time). "
+             "New runs pause while Jira is rate-limiting (Retry-After)."
+    )
     parser.add_argument(
         "--diagnose", action="store_true",
         help="Read-only: fetch live Jira data and print why quarter/sprint notes would or "
              "wouldn't regenerate (locked/throttle/KPI-diff status) — no Claude calls, no "
              "writes, no dashboard render. Combine with --project to target one project."
     )
+    parser.add_argument(
+        "--token-report", type=int, nargs="?", const=30, metavar="DAYS",
+        help="Print Claude token totals per day, project and model from the usage ledger "
+             "for the last DAYS days (default 30), then exit. Combine with --project to filter."
+    )
     args = parser.parse_args()
     skip_notes    = args.data_only
     force_notes   = args.force_notes
@@ -2438,10 +3968,16 @@ def main():
     only_projects = ({k.strip().upper() for k in args.project.replace(",", " ").split()}
                      if args.project else None)
 
-    # CLI --force-notes overrides the module-level constant
-    global FORCE_NOTES
+    # CLI --force-notes / --full-sync override the module-level constants
+    global FORCE_NOTES, FULL_SYNC
     if force_notes:
         FORCE_NOTES = True
+    if args.full_sync:
+        FULL_SYNC = True
+
+    if args.token_report is not None:
+        token_usage_report(max(1, args.token_report), only_projects)
+        return
 
     if args.diagnose:
         targets = [p for p in PROJECTS if not only_projects or p["key"] in only_projects]
@@ -2468,6 +4004,11 @@ def main():
         print("Mode: DATA-ONLY (Claude notes unchanged)")
     elif FORCE_NOTES:
         print("Mode: FORCE-NOTES (all Claude notes will be regenerated)")
+    if FULL_SYNC:
+        print("Mode: FULL-SYNC (local issue store ignored)")
+    jobs = max(1, args.jobs)
+    if jobs > 1:
+        print(f"Mode: PARALLEL (up to {jobs} project/quarter runs at once)")
     for proj in PROJECTS:
         print(f"\n{'#'*52}")
         print(f"# Project: {proj['display']} (board {proj['board_id']})")
@@ -2475,27 +4016,71 @@ def main():
 
     all_projects_data = {}
     refs = [_quarter_last_day(q) for q in BACKFILL_QUARTERS] + [None]
+    targets = [p for p in PROJECTS if not (only_projects and p["key"] not in only_projects)]
+    ref_labels = [quarter_label(ref) for ref in refs]
+
+    # Queue behind any other run of the same project(s), then drop projects that a run
+    # started after this one was requested has already refreshed.
+    run_locks = contextlib.ExitStack()
+    for p in sorted(targets, key=lambda p: p["key"]):
+        run_locks.enter_context(_file_lock(
+            os.path.join(p["data_dir"], ".run.lock"),
+            waiting_msg=f"  {p['key']}: another run is in progress — queued until it finishes..."))
+    for p in targets:
+        _move_private_stores(p)
+        _prune_http_cache(p)
+    started_at = time.time()
+    coalesced = [p for p in targets if _run_covered(p, requested_at, ref_labels, not skip_notes)]
+    if coalesced:
+        print(f"  Coalesced: {', '.join(p['key'] for p in coalesced)} already refreshed by a run "
+              f"that started after this one was requested — using its saved data.")
+        targets = [p for p in targets if p not in coalesced]
+        if not targets:
+            # The covering run already rendered the dashboard from this same data.
+            run_locks.close()
+            print("\nDone. Nothing left to refresh — dashboard left as the covering run wrote it.")
+            _JIRA.close()
+            return
+
+    def _job(proj, ref):
+        # Don't start another quarter while Jira has asked us to back off
+        _JIRA.wait_if_throttled()
+        return _run_quarter(proj, ref, skip_notes=skip_notes)
+
+    # Every (project, quarter) run is queued up front on one bounded pool; results are
+    # collected below in project/ref order, so --jobs 1 behaves exactly like a serial run.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=jobs)
+    pending = {p["key"]: [pool.submit(_job, p, ref) for ref in refs] for p in targets}
 
     for proj in PROJECTS:
         print(f"\n{'#'*52}")
         print(f"# Processing: {proj['display']}")
         proj_quarters = {}
-        if only_projects and proj["key"] not in only_projects:
+        if proj["key"] not in pending:
             # Not the target project — load saved data only, skip Jira/Claude calls
             proj_quarters = load_all_quarters(proj)
             print(f"  Skipped (not target project) — loaded {len(proj_quarters)} saved quarter(s).")
         else:
-            for ref in refs:
-                result = _run_quarter(proj, ref, skip_notes=skip_notes)
+            results = [f.result() for f in pending[proj["key"]]]
+            for result in results:
                 if result:
                     proj_quarters = result  # load_all_quarters returns full set each time
+            if proj_quarters and jobs > 1:
+                # Parallel runs may have saved out of order, so each one's snapshot (and
+                # its carry-in markers) can predate a sibling quarter — redo both oldest-first.
+                with _run_lock(proj["key"]):
+                    proj_quarters = load_all_quarters(proj)
+                    for ref, result in zip(refs, results):
+                        _k = proj_quarters.get(quarter_label(ref), {}).get("kpis")
+                        if result and _k:
+                            _enrich_past_quarters_with_carryovers(_k, proj_quarters, proj)
             if not proj_quarters and None in refs:
                 # The new calendar quarter has started but its first sprint hasn't yet —
                 # the real "current" sprint is still the previous quarter's last one, which
                 # keeps running for a week or two past the calendar boundary. Refresh that
                 # quarter live instead so KPIs/as_of keep moving until a Q-starting sprint exists.
                 prev_ref = current_quarter_start() - timedelta(days=1)
-                result = _run_quarter(proj, prev_ref, skip_notes=skip_notes)
+                result = pool.submit(_job, proj, prev_ref).result()
                 if result:
                     proj_quarters = result
                     print(f"  Current quarter has no sprints yet — refreshed previous quarter instead.")
@@ -2505,17 +4090,21 @@ def main():
                 proj_quarters = load_all_quarters(proj)
                 print(f"  No live quarter data — loaded {len(proj_quarters)} saved quarter(s) instead.")
         _pkey = proj["key"].lower()
-        # Fetch next sprint capacity (best-effort — None if no future sprint exists)
-        print(f"  Fetching next sprint for {proj['key']}...")
-        try:
-            _next_sprint = fetch_next_sprint(proj) if not (only_projects and proj["key"] not in only_projects) else None
-            if _next_sprint:
-                print(f"      Next sprint: {_next_sprint['sprint_name']} ({_next_sprint['total_issues']} issues)")
-            else:
-                print(f"      No future sprint found.")
-        except Exception as _exc:
-            print(f"      Next sprint fetch failed: {_exc}")
-            _next_sprint = None
+        if proj["key"] in pending:
+            # Fetch next sprint capacity (best-effort — None if no future sprint exists)
+            print(f"  Fetching next sprint for {proj['key']}...")
+            try:
+                _next_sprint = fetch_next_sprint(proj)
+                if _next_sprint:
+                    print(f"      Next sprint: {_next_sprint['sprint_name']} ({_next_sprint['total_issues']} issues)")
+                else:
+                    print(f"      No future sprint found.")
+            except Exception as _exc:
+                print(f"      Next sprint fetch failed: {_exc}")
+                _next_sprint = None
+        else:
+            # Not refreshed by this run — keep the panel its last refresh saved.
+            _next_sprint = _saved_next_sprint(proj)
         all_projects_data[proj["key"]] = {
             "qs":              proj_quarters,
             "proj_key":        proj["key"],
@@ -2528,14 +4117,36 @@ def main():
             "refresh_request_webhook": _REFRESH_REQUEST_WEBHOOKS.get(_pkey, ""),
             "capacity_update_webhook": _CAPACITY_UPDATE_WEBHOOKS.get(_pkey, ""),
             "notes_refresh_hours":     proj.get("notes_refresh_hours") or None,
-            "last_run_at":             datetime.now(timezone.utc).isoformat(),
+            # Only projects this run refreshed get a new timestamp, so a run that skips or
+            # coalesces a project leaves its part of the dashboard byte-identical.
+            "last_run_at":             (datetime.now(timezone.utc).isoformat()
+                                        if proj["key"] in pending else _last_run_at(proj)),
             "next_sprint":             _next_sprint,
         }
+    pool.shutdown()
+    for p in targets:
+        _write_run_stamp(p, started_at, ref_labels, not skip_notes,
+                         all_projects_data[p["key"]]["next_sprint"])
 
     print(f"\n{'='*52}")
     print("Building combined HTML dashboard...")
-    path = generate_html_dashboard(all_projects_data)
+    # Another process may have saved a project this run didn't fetch while this one was
+    # busy — reload those from disk just before rendering, under a dashboard-wide lock so
+    # two runs never render from crossed snapshots.
+    with _file_lock(os.path.join(DASHBOARD_OUTPUT_DIR, ".dashboard.lock")):
+        for p in PROJECTS:
+            if p["key"] not in pending and p["key"] in all_projects_data:
+                all_projects_data[p["key"]]["qs"] = load_all_quarters(p)
+        path = generate_html_dashboard(all_projects_data)
+    run_locks.close()
     print(f"Dashboard: {path}")
+    print(f"Jira: {_JIRA.requests_made} request(s) over {_JIRA.connections_opened} connection(s), "
+          f"{_JIRA.throttled_responses} throttled response(s) retried")
+    print(f"HTTP cache: {_JIRA.cache_hits} hit(s), {_JIRA.cache_revalidated} revalidated (304), "
+          f"{_JIRA.cache_misses} miss(es)")
+    if _note_cache_hits:
+        print(f"Note cache: {_note_cache_hits} note(s) reused without a Claude call")
+    _JIRA.close()
     if DASHBOARD_BASE_URL:
         live_url    = DASHBOARD_BASE_URL.rstrip("/") + "/" + DASHBOARD_FILENAME
         preview_url = DASHBOARD_BASE_URL.rstrip("/") + "/" + DASHBOARD_PREVIEW_FILE
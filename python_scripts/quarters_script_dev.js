@@ -507,6 +507,41 @@ function _adjKpis(base,exclStats,showOn){
   };
 }
 
+/* ---- Issue lists ----
+   Quarter JSON stores each issue row once (issues.rows, keyed by issue key) and the
+   category lists as key arrays, with per-list field overrides in issues.overrides.
+   Older files still carry full rows in every list and are returned unchanged. */
+const _issueListCache=new WeakMap();
+function issueLists(iss){
+  if(!iss||!iss.rows)return iss||{};
+  if(_issueListCache.has(iss))return _issueListCache.get(iss);
+  const out={},ov=iss.overrides||{};
+  for(const [name,keys] of Object.entries(iss)){
+    if(name==="rows"||name==="overrides"||!Array.isArray(keys))continue;
+    const o=ov[name]||{};
+    out[name]=keys.filter(k=>iss.rows[k]).map(k=>o[k]?{...iss.rows[k],...o[k]}:iss.rows[k]);
+  }
+  _issueListCache.set(iss,out);
+  return out;
+}
+
+// Lazy dashboards embed only a manifest entry per quarter ({src, sprints, summary kpis});
+// the full quarter JSON is fetched on first render and swapped into QS in place.
+// Filenames are content-hashed, so unchanged quarters come straight from the browser cache.
+const _quarterLoads=new Map();
+function loadQuarter(qs,qk){
+  const d=qs[qk];
+  if(!d||!d.src)return Promise.resolve(d);
+  if(_quarterLoads.has(d.src))return _quarterLoads.get(d.src);
+  const p=fetch(d.src).then(r=>{
+    if(!r.ok)throw new Error("HTTP "+r.status);
+    return r.json();
+  }).then(full=>{qs[qk]=full;return full;})
+    .catch(err=>{_quarterLoads.delete(d.src);throw err;});
+  _quarterLoads.set(d.src,p);
+  return p;
+}
+
 /* ---- Main render ---- */
 function render(qk,activeTab){
   const D=QS[qk];
@@ -515,11 +550,18 @@ function render(qk,activeTab){
   document.getElementById("q-input").value=qk;
   document.title=PROJ_DISPLAY+" Quarter Dashboard - "+qk;
 
+  if(D&&D.src){
+    const qs=QS;
+    document.getElementById("dash").innerHTML='<div class="nodata">Loading '+e(qk)+'…</div>';
+    loadQuarter(qs,qk).then(()=>{if(QS===qs&&cur===qk)render(qk,activeTab);})
+      .catch(err=>{if(QS===qs&&cur===qk)document.getElementById("dash").innerHTML='<div class="nodata">Could not load '+e(qk)+' ('+e(err.message)+')</div>';});
+    return;
+  }
   if(!D){document.getElementById("dash").innerHTML='<div class="nodata">No data for '+e(qk)+'</div>';return;}
   const {kpis,notes,sprints}=D;
   buildSprintSelector(sprints);
   const sp=activeSprint?(kpis.per_sprint||{})[activeSprint]||null:null;
-  const iss=kpis.issues||{};
+  const iss=issueLists(kpis.issues);
   const jb=kpis.jira_base||"";
   const verIds=kpis.version_ids||{};
   let oa=activeSprint&&sp?(sp.oos_open||0):kpis.oos_open;